@@ -0,0 +1,130 @@
+"""
+Runs benchmark suite against local fake MWDB server and prints results as JSON.
+
+Usage:
+
+    python -m benchmarks --latency 0.005 --output results.json
+    python -m benchmarks --compare results.json
+
+With ``--compare``, results are compared with baseline file and command exits
+with code 1 if any value is worse than baseline by more than ``--tolerance``.
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import warnings
+
+from mwdblib import MWDB
+from mwdblib.__version__ import __version__
+
+from .fake_mwdb import FakeMWDB, fake_api_key
+from .suite import BENCHMARKS
+
+
+def is_regression(name, baseline, current, tolerance):
+    if name.endswith("_per_s"):
+        return current < baseline * (1 - tolerance)
+    if name.endswith("_ms") or name.endswith("_s") or name == "requests":
+        return current > baseline * (1 + tolerance)
+    return False
+
+
+def compare(baseline, results, tolerance):
+    regressions = []
+    for benchmark, values in results["results"].items():
+        baseline_values = baseline.get("results", {}).get(benchmark, {})
+        for name, current in values.items():
+            if name not in baseline_values:
+                continue
+            if is_regression(name, baseline_values[name], current, tolerance):
+                regressions.append(
+                    {
+                        "benchmark": benchmark,
+                        "value": name,
+                        "baseline": baseline_values[name],
+                        "current": current,
+                    }
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("benchmarks", nargs="*", help="Benchmarks to run (all)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Response delay")
+    parser.add_argument("--page-size", type=int, default=10, help="Listing page size")
+    parser.add_argument("--files", type=int, default=2000, help="Number of files")
+    parser.add_argument("--file-size", type=int, default=1024, help="File size")
+    parser.add_argument("--objects", type=int, default=1000, help="Objects to list")
+    parser.add_argument("--queries", type=int, default=100, help="Queries to send")
+    parser.add_argument(
+        "--transfer-size", type=int, default=16 * 1024 * 1024, help="Upload size"
+    )
+    parser.add_argument("--listener-objects", type=int, default=5)
+    parser.add_argument("--listener-interval", type=float, default=0.3)
+    parser.add_argument("--formatter-rows", type=int, default=200)
+    parser.add_argument("--dhash-urls", type=int, default=20000)
+    parser.add_argument("--dhash-configs", type=int, default=2000)
+    parser.add_argument("--output", help="Write results to file instead of stdout")
+    parser.add_argument("--compare", help="Baseline results to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    config = parser.parse_args()
+
+    names = config.benchmarks or list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    warnings.simplefilter("ignore")
+    results = {}
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        server = FakeMWDB(
+            files=config.files,
+            file_size=config.file_size,
+            page_size=config.page_size,
+            latency=config.latency,
+        )
+        with server:
+            mwdb = MWDB(
+                api_url=server.api_url, api_key=fake_api_key(), config_path=None
+            )
+            results[name] = BENCHMARKS[name](server, mwdb, config)
+
+    report = {
+        "mwdblib_version": __version__,
+        "python": platform.python_version(),
+        "timestamp": datetime.datetime.now().isoformat(),
+        "config": {
+            key: value
+            for key, value in vars(config).items()
+            if key not in ("benchmarks", "output", "compare")
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=4)
+    if config.output:
+        with open(config.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if config.compare:
+        with open(config.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, config.tolerance)
+        for regression in regressions:
+            print(
+                "Regression in {benchmark}.{value}: "
+                "{baseline:.4g} -> {current:.4g}".format(**regression),
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+"""
+Local stand-in for MWDB Core REST API serving synthetic objects.
+
+Implements only the endpoints used by benchmarks and tests: server metadata,
+object listings with paging, object details, tags/comments/attributes,
+relations, downloads, uploads of files and configurations and object removal.
+Every request can be delayed to simulate network latency.
+"""
+
+import base64
+import datetime
+import email
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+SERVER_VERSION = "2.9.0"
+
+
+def fake_api_key(login="bench"):
+    """
+    Returns token accepted by APIClient.set_api_key
+    """
+
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    return ".".join(
+        [encode({"alg": "HS512"}), encode({"login": login, "api_key_id": "0"}), "x"]
+    )
+
+
+def synthetic_content(index, size):
+    seed = hashlib.sha256(f"file-{index}".encode()).digest()
+    return (seed * (size // len(seed) + 1))[:size]
+
+
+class FakeMWDB:
+    """
+    Fake MWDB Core server running in background thread.
+
+    .. code-block:: python
+
+        with FakeMWDB(files=1000, latency=0.01) as server:
+            mwdb = MWDB(api_url=server.api_url, api_key=fake_api_key())
+
+    :param files: Number of generated files
+    :param file_size: Size of generated file contents in bytes
+    :param page_size: Default number of objects in listing page
+    :param max_page_size: Maximum number of objects in page requested by ``count``
+    :param latency: Delay added to each response (in seconds)
+    """
+
+    def __init__(
+        self, files=1000, file_size=1024, page_size=10, max_page_size=1000, latency=0.0
+    ):
+        self.file_size = file_size
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.latency = latency
+        self.requests = 0
+        self.lock = threading.Lock()
+        # Objects ordered from the oldest one
+        self.objects = []
+        self.objects_by_id = {}
+        self.positions = {}
+        self.contents = {}
+        # Object attributes ({"key": ..., "value": ...}) by object id
+        self.attributes = {}
+        # (parent id, child id) pairs
+        self.relations = set()
+        # Creation time (time.monotonic) of objects added during benchmark
+        self.created_at = {}
+        self._counter = 0
+        self._base_time = datetime.datetime(2023, 1, 1)
+        for _ in range(files):
+            self.add_file()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def api_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_port}/api/"
+
+    def add_file(self, content=None, name=None):
+        """
+        Adds new file as the most recent object
+        """
+        with self.lock:
+            index = self._counter
+            self._counter += 1
+            if content is None:
+                content = synthetic_content(index, self.file_size)
+            sha256 = hashlib.sha256(content).hexdigest()
+            if sha256 in self.objects_by_id:
+                return self.objects_by_id[sha256]
+            obj = {
+                "id": sha256,
+                "type": "file",
+                "file_name": name or f"sample-{index}.bin",
+                "file_size": len(content),
+                "file_type": "data",
+                "md5": hashlib.md5(content).hexdigest(),
+                "sha1": hashlib.sha1(content).hexdigest(),
+                "sha256": sha256,
+                "sha512": hashlib.sha512(content).hexdigest(),
+                "crc32": "00000000",
+                "ssdeep": "3:abc:def",
+                "tags": [{"tag": "bench"}, {"tag": f"group:{index % 10}"}],
+                "upload_time": (
+                    self._base_time + datetime.timedelta(seconds=index)
+                ).isoformat(),
+            }
+            self.positions[sha256] = len(self.objects)
+            self.objects.append(obj)
+            self.objects_by_id[sha256] = obj
+            self.contents[sha256] = content
+            self.created_at[sha256] = time.monotonic()
+            return obj
+
+    def add_config(self, family, cfg, config_type="static"):
+        """
+        Adds configuration object. Configurations aren't listed.
+        """
+        from mwdblib import config_dhash
+
+        with self.lock:
+            dhash = config_dhash(cfg)
+            if dhash not in self.objects_by_id:
+                self.objects_by_id[dhash] = {
+                    "id": dhash,
+                    "type": "static_config",
+                    "family": family,
+                    "config_type": config_type,
+                    "cfg": cfg,
+                    "tags": [],
+                    "upload_time": self._base_time.isoformat(),
+                }
+            return self.objects_by_id[dhash]
+
+    def remove_object(self, object_id):
+        with self.lock:
+            obj = self.objects_by_id.pop(object_id, None)
+            if obj is None:
+                return False
+            if object_id in self.positions:
+                self.objects.remove(obj)
+                self.positions = {
+                    entry["id"]: position for position, entry in enumerate(self.objects)
+                }
+                del self.contents[object_id]
+            self.relations = {
+                (p, c) for p, c in self.relations if object_id not in (p, c)
+            }
+            return True
+
+    def add_tag(self, object_id, tag):
+        with self.lock:
+            tags = self.objects_by_id[object_id]["tags"]
+            if {"tag": tag} not in tags:
+                tags.append({"tag": tag})
+
+    def listing(self, older_than=None, count=None):
+        count = min(int(count), self.max_page_size) if count else self.page_size
+        with self.lock:
+            end = len(self.objects)
+            if older_than is not None:
+                if older_than not in self.positions:
+                    return None
+                end = self.positions[older_than]
+            page = self.objects[max(0, end - count) : end][::-1]
+        listing_fields = [
+            "id",
+            "type",
+            "tags",
+            "upload_time",
+            "file_name",
+            "file_size",
+            "file_type",
+            "md5",
+            "sha1",
+            "sha256",
+        ]
+        return [{key: obj[key] for key in listing_fields} for obj in page]
+
+    def details(self, object_id):
+        with self.lock:
+            obj = self.objects_by_id.get(object_id)
+            if obj is None:
+                return None
+            parents = [
+                self.objects_by_id[p] for p, c in self.relations if c == object_id
+            ]
+            children = [
+                self.objects_by_id[c] for p, c in self.relations if p == object_id
+            ]
+        return {
+            **obj,
+            "parents": parents,
+            "children": children,
+            "latest_config": None,
+            "alt_names": [],
+            "share_3rd_party": True,
+        }
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, so Nagle's algorithm
+            # would delay keep-alive responses by delayed ACK timeout
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def send_body(self, status, body, content_type="application/json"):
+                if not isinstance(body, bytes):
+                    body = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def parse_upload(self, body):
+                message = email.message_from_bytes(
+                    f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode()
+                    + body
+                )
+                name, content, options = None, b"", {}
+                for part in message.get_payload():
+                    field = part.get_param("name", header="content-disposition")
+                    if field == "file":
+                        name = part.get_filename()
+                        content = part.get_payload(decode=True)
+                    elif field == "options":
+                        options = json.loads(part.get_payload(decode=True))
+                return name, content, options
+
+            def not_found(self):
+                self.send_body(404, {"message": "Object not found"})
+
+            def handle_request(self, method):
+                with server.lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                url = urlparse(self.path)
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                path = url.path[len("/api/") :].strip("/").split("/")
+                body = b""
+                if "Content-Length" in self.headers:
+                    body = self.rfile.read(int(self.headers["Content-Length"]))
+                if method == "GET":
+                    self.handle_get(path, params)
+                elif method == "POST" and path == ["file"]:
+                    name, content, options = self.parse_upload(body)
+                    obj = server.add_file(content=content, name=name)
+                    for tag in options.get("tags", []):
+                        server.add_tag(obj["id"], tag["tag"])
+                    for attribute in options.get("attributes", []):
+                        server.attributes.setdefault(obj["id"], []).append(attribute)
+                    if options.get("parent"):
+                        server.relations.add((options["parent"], obj["id"]))
+                    self.send_body(200, server.details(obj["id"]))
+                elif method == "POST" and path == ["config"]:
+                    params = json.loads(body)
+                    obj = server.add_config(
+                        params["family"], params["cfg"], params["config_type"]
+                    )
+                    for tag in params.get("tags", []):
+                        server.add_tag(obj["id"], tag["tag"])
+                    self.send_body(200, server.details(obj["id"]))
+                elif method in ("PUT", "POST") and path[0] == "object":
+                    self.handle_update(method, path, json.loads(body or b"{}"))
+                elif method == "DELETE" and len(path) == 2 and path[0] == "object":
+                    if not server.remove_object(path[1]):
+                        return self.not_found()
+                    self.send_body(200, {})
+                else:
+                    self.not_found()
+
+            def handle_update(self, method, path, data):
+                if any(
+                    object_id not in server.objects_by_id for object_id in path[1::2]
+                ):
+                    return self.not_found()
+                if method == "PUT" and len(path) == 3 and path[2] == "tag":
+                    server.add_tag(path[1], data["tag"])
+                    self.send_body(200, server.details(path[1])["tags"])
+                elif method == "PUT" and len(path) == 4 and path[2] == "child":
+                    server.relations.add((path[1], path[3]))
+                    self.send_body(200, {})
+                elif method == "POST" and len(path) == 3 and path[2] == "attribute":
+                    server.attributes.setdefault(path[1], []).append(data)
+                    self.send_body(200, data)
+                else:
+                    self.not_found()
+
+            def handle_get(self, path, params):
+                if path == ["server"]:
+                    self.send_body(
+                        200,
+                        {"server_version": SERVER_VERSION, "is_authenticated": True},
+                    )
+                elif path in (["file"], ["object"]):
+                    page = server.listing(params.get("older_than"), params.get("count"))
+                    if page is None:
+                        return self.not_found()
+                    self.send_body(200, {path[0] + "s": page})
+                elif len(path) == 2 and path[0] in ("file", "config", "object"):
+                    details = server.details(path[1])
+                    if details is None:
+                        return self.not_found()
+                    self.send_body(200, details)
+                elif len(path) == 3 and path[0] == "file" and path[2] == "download":
+                    content = server.contents.get(path[1])
+                    if content is None:
+                        return self.not_found()
+                    self.send_body(200, content, "application/octet-stream")
+                elif len(path) == 3 and path[0] == "object":
+                    details = server.details(path[1])
+                    if details is None:
+                        return self.not_found()
+                    if path[2] == "tag":
+                        self.send_body(200, details["tags"])
+                    elif path[2] == "comment":
+                        self.send_body(200, [])
+                    elif path[2] == "attribute":
+                        self.send_body(
+                            200, {"attributes": server.attributes.get(path[1], [])}
+                        )
+                    elif path[2] == "share":
+                        self.send_body(200, {"groups": [], "shares": []})
+                    else:
+                        self.not_found()
+                else:
+                    self.not_found()
+
+            def do_GET(self):
+                self.handle_request("GET")
+
+            def do_POST(self):
+                self.handle_request("POST")
+
+            def do_PUT(self):
+                self.handle_request("PUT")
+
+            def do_DELETE(self):
+                self.handle_request("DELETE")
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,234 @@
+"""
+Benchmarks run against FakeMWDB server.
+
+Each benchmark gets running server, MWDB client and configuration and
+returns dict of measured values. Names of values follow the convention
+used for regression checks:
+
+- ``*_per_s`` - throughput, higher is better
+- ``*_ms``, ``*_s`` - latency, lower is better
+- ``requests`` - number of API requests, lower is better
+"""
+
+import hashlib
+import io
+import itertools
+import os
+import random
+import threading
+import time
+
+from mwdblib import config_dhash, config_dhash_many
+from mwdblib.api import MetricsCollector
+from mwdblib.util import convert_to_utf8
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def decorator(fn):
+        BENCHMARKS[name] = fn
+        return fn
+
+    return decorator
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class Measurement:
+    """
+    Measures wall time and number of API requests made by client
+    """
+
+    def __init__(self, mwdb):
+        self.mwdb = mwdb
+        self.metrics = MetricsCollector()
+
+    def __enter__(self):
+        self.mwdb.api.add_hooks(self.metrics)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.elapsed = time.perf_counter() - self.start
+        self.mwdb.api.remove_hooks(self.metrics)
+
+    @property
+    def requests(self):
+        return sum(e["count"] for e in self.metrics.to_dict()["endpoints"])
+
+
+def _recent_files(server, mwdb, config, **kwargs):
+    count = min(config.objects, len(server.objects))
+    with Measurement(mwdb) as m:
+        for _ in itertools.islice(mwdb.recent_files(**kwargs), count):
+            pass
+    return {
+        "objects": count,
+        "elapsed_s": m.elapsed,
+        "objects_per_s": count / m.elapsed,
+        "requests": m.requests,
+    }
+
+
+@benchmark("recent_files")
+def bench_recent_files(server, mwdb, config):
+    return _recent_files(server, mwdb, config)
+
+
+@benchmark("recent_files_prefetch")
+def bench_recent_files_prefetch(server, mwdb, config):
+    return _recent_files(server, mwdb, config, prefetch=2)
+
+
+@benchmark("query")
+def bench_query(server, mwdb, config):
+    rng = random.Random(0)
+    hashes = [obj["id"] for obj in rng.sample(server.objects, config.queries)]
+    latencies = []
+    with Measurement(mwdb) as m:
+        for sha256 in hashes:
+            start = time.perf_counter()
+            mwdb.query_file(sha256)
+            latencies.append(time.perf_counter() - start)
+    return {
+        "queries": len(hashes),
+        "latency_avg_ms": 1000 * sum(latencies) / len(latencies),
+        "latency_p50_ms": 1000 * percentile(latencies, 0.5),
+        "latency_p95_ms": 1000 * percentile(latencies, 0.95),
+        "requests": m.requests,
+    }
+
+
+@benchmark("download")
+def bench_download(server, mwdb, config):
+    obj = server.add_file(content=os.urandom(config.transfer_size))
+    file = mwdb.query_file(obj["id"])
+    with Measurement(mwdb) as m:
+        file.download()
+    with Measurement(mwdb) as m_streamed:
+        file.download_to(io.BytesIO())
+    return {
+        "bytes": config.transfer_size,
+        "download_bytes_per_s": config.transfer_size / m.elapsed,
+        "download_to_bytes_per_s": config.transfer_size / m_streamed.elapsed,
+    }
+
+
+@benchmark("upload")
+def bench_upload(server, mwdb, config):
+    content = os.urandom(config.transfer_size)
+    with Measurement(mwdb) as m:
+        mwdb.upload_file("upload.bin", content)
+    streamed = io.BytesIO(os.urandom(config.transfer_size))
+    with Measurement(mwdb) as m_streamed:
+        mwdb.upload_file("upload-streamed.bin", streamed)
+    return {
+        "bytes": config.transfer_size,
+        "upload_bytes_per_s": config.transfer_size / m.elapsed,
+        "upload_stream_bytes_per_s": config.transfer_size / m_streamed.elapsed,
+    }
+
+
+@benchmark("listener_lag")
+def bench_listener_lag(server, mwdb, config):
+    new_objects = config.listener_objects
+    listener = mwdb.listen_for_files(interval=1)
+    stop = threading.Event()
+
+    def produce():
+        # Let the listener fetch the pivot first
+        time.sleep(0.5)
+        for _ in range(new_objects):
+            if stop.wait(config.listener_interval):
+                return
+            server.add_file(content=os.urandom(64))
+
+    producer = threading.Thread(target=produce, daemon=True)
+    lags = []
+    with Measurement(mwdb) as m:
+        producer.start()
+        for file in itertools.islice(listener, new_objects):
+            lags.append(time.monotonic() - server.created_at[file.id])
+    stop.set()
+    producer.join()
+    return {
+        "objects": new_objects,
+        "lag_avg_s": sum(lags) / len(lags),
+        "lag_max_s": max(lags),
+        "requests": m.requests,
+    }
+
+
+@benchmark("formatter")
+def bench_formatter(server, mwdb, config):
+    from mwdblib.cli.formatters.tabular import TabularFormatter
+
+    count = min(config.formatter_rows, len(server.objects))
+    files = list(itertools.islice(mwdb.recent_files(chunk_size=count), count))
+    formatter = TabularFormatter(colorize=False)
+    with Measurement(mwdb) as m:
+        rendered = "".join(formatter.format_file_list(files))
+    return {
+        "rows": count,
+        "rows_per_s": count / m.elapsed,
+        "output_bytes": len(rendered),
+        "requests": m.requests,
+    }
+
+
+def legacy_config_dhash(obj):
+    """
+    Recursive implementation of config_dhash from mwdblib 4.6.0
+    """
+    if isinstance(obj, list):
+        return legacy_config_dhash(str(sorted([legacy_config_dhash(o) for o in obj])))
+    elif isinstance(obj, dict):
+        return legacy_config_dhash(
+            [[o, legacy_config_dhash(obj[o])] for o in sorted(obj.keys())]
+        )
+    else:
+        return hashlib.sha256(convert_to_utf8(obj)).hexdigest()
+
+
+def synthetic_config(index, urls):
+    return {
+        "family": "bench",
+        "urls": [f"http://c2-{index}-{n}.example.com/gate.php" for n in range(urls)],
+        "c2": [
+            [f"10.{n // 256 % 256}.{n % 256}.{index % 256}", 443] for n in range(urls)
+        ],
+        "keys": {"rsa": {"n": str(index), "e": 65537}, "rc4": f"key-{index}"},
+    }
+
+
+@benchmark("config_dhash")
+def bench_config_dhash(server, mwdb, config):
+    large = synthetic_config(0, config.dhash_urls)
+    start = time.perf_counter()
+    dhash = config_dhash(large)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    legacy_dhash = legacy_config_dhash(large)
+    legacy_elapsed = time.perf_counter() - start
+    if dhash != legacy_dhash:
+        raise RuntimeError("config_dhash differs from legacy implementation")
+
+    small = [synthetic_config(index, 10) for index in range(config.dhash_configs)]
+    start = time.perf_counter()
+    hashes = list(config_dhash_many(small))
+    many_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel_hashes = list(config_dhash_many(small, processes=os.cpu_count() or 1))
+    parallel_elapsed = time.perf_counter() - start
+    if hashes != parallel_hashes:
+        raise RuntimeError("config_dhash_many results differ")
+    return {
+        "large_config_s": elapsed,
+        "large_config_legacy_s": legacy_elapsed,
+        "configs_per_s": len(small) / many_elapsed,
+        "configs_parallel_per_s": len(small) / parallel_elapsed,
+    }
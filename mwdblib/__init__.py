@@ -1,22 +1,37 @@
 from .__version__ import __version__
-from .api import APIClient, APIClientOptions
+from .api import APIClient, APIClientOptions, AsyncAPIClient
+from .async_core import AsyncMWDB
 from .blob import MWDBBlob
+from .checkpoint import Checkpoint, FileCheckpointStore, SQLiteCheckpointStore
 from .comment import MWDBComment
 from .config import MWDBConfig
 from .core import MWDB
 from .file import MWDBFile
+from .listener import ListenerEngine
 from .object import MWDBObject
-from .util import config_dhash
+from .record import MWDBBlobRecord, MWDBConfigRecord, MWDBFileRecord, MWDBObjectRecord
+from .util import config_dhash, config_dhash_many
 
 __all__ = [
     "MWDB",
     "APIClient",
     "APIClientOptions",
+    "AsyncMWDB",
+    "AsyncAPIClient",
     "MWDBFile",
     "MWDBObject",
     "MWDBConfig",
     "MWDBBlob",
     "MWDBComment",
+    "ListenerEngine",
+    "Checkpoint",
+    "FileCheckpointStore",
+    "SQLiteCheckpointStore",
+    "MWDBObjectRecord",
+    "MWDBFileRecord",
+    "MWDBConfigRecord",
+    "MWDBBlobRecord",
     "__version__",
     "config_dhash",
+    "config_dhash_many",
 ]
@@ -1,4 +1,22 @@
 from .api import APIClient
+from .async_api import AsyncAPIClient
+from .conditional import ConditionalCache
+from .config_index import ConfigIndex, SQLiteConfigIndex
+from .disk_cache import DiskCache
+from .hooks import APIClientHooks, MetricsCollector, RequestInfo
+from .object_cache import ObjectCache
 from .options import APIClientOptions
 
-__all__ = ["APIClient", "APIClientOptions"]
+__all__ = [
+    "APIClient",
+    "APIClientHooks",
+    "APIClientOptions",
+    "AsyncAPIClient",
+    "ConditionalCache",
+    "ConfigIndex",
+    "DiskCache",
+    "MetricsCollector",
+    "ObjectCache",
+    "RequestInfo",
+    "SQLiteConfigIndex",
+]
@@ -0,0 +1,57 @@
+import socket
+from typing import Any, List, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from .options import APIClientOptions
+
+# Idle time before the first keep-alive probe, interval between probes
+# and number of failed probes after which connection is considered dead
+KEEPALIVE_IDLE = 60
+KEEPALIVE_INTERVAL = 15
+KEEPALIVE_COUNT = 4
+
+
+def keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    """
+    Returns socket options enabling TCP keep-alive probes.
+    Platform-specific tuning options are set only if available.
+    """
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE))
+    elif hasattr(socket, "TCP_KEEPALIVE"):
+        # macOS equivalent of TCP_KEEPIDLE
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, KEEPALIVE_IDLE))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_COUNT))
+    return options
+
+
+class APIClientAdapter(HTTPAdapter):
+    """
+    HTTP adapter with connection pool configured by :class:`APIClientOptions`.
+
+    Mounted by :class:`APIClient` for all its requests, so concurrent callers
+    reuse pooled connections instead of reconnecting.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["tcp_keepalive"]
+
+    def __init__(self, options: APIClientOptions) -> None:
+        self.tcp_keepalive = options.tcp_keepalive
+        super().__init__(
+            pool_connections=options.pool_connections,
+            pool_maxsize=options.pool_maxsize,
+            pool_block=options.pool_block,
+        )
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        if self.tcp_keepalive:
+            kwargs["socket_options"] = (
+                HTTPConnection.default_socket_options + keepalive_socket_options()
+            )
+        super().init_poolmanager(*args, **kwargs)
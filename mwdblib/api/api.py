@@ -2,6 +2,7 @@ import base64
 import datetime
 import functools
 import json
+import random
 import re
 import time
 import warnings
@@ -22,7 +23,14 @@ from ..exc import (
     VersionMismatchError,
     map_http_error,
 )
+from .adapter import APIClientAdapter
+from .conditional import ConditionalCache
+from .config_index import ConfigIndex, SQLiteConfigIndex
+from .disk_cache import DiskCache
+from .hooks import APIClientHooks, RequestInfo, endpoint_name
+from .object_cache import ObjectCache
 from .options import APIClientOptions
+from .throttling import ConcurrencyLimiter, RetryBudget, TokenBucket
 
 
 # TODO: Protocol typing is available from Python 3.8
@@ -93,8 +101,55 @@ class APIClient:
         self.api_key: Optional[str] = None
 
         self._server_metadata: Optional[dict] = None
+        self.hooks: List[APIClientHooks] = []
+
+        self.object_cache: Optional[ObjectCache] = (
+            ObjectCache(
+                max_size=self.options.object_cache_size,
+                ttl=self.options.object_cache_ttl,
+            )
+            if self.options.object_cache_size > 0
+            else None
+        )
+        self.disk_cache: Optional[DiskCache] = (
+            DiskCache(self.options.cache_dir, max_size=self.options.cache_max_size)
+            if self.options.cache_dir
+            else None
+        )
+        self.conditional_cache: Optional[ConditionalCache] = (
+            ConditionalCache(max_size=self.options.conditional_cache_size)
+            if self.options.conditional_cache_size > 0
+            else None
+        )
+        self.config_index: Optional[ConfigIndex] = None
+        if self.options.config_index_path:
+            self.config_index = SQLiteConfigIndex(
+                self.options.config_index_path,
+                namespace=self.options.api_url,
+                max_size=self.options.config_index_size,
+            )
+        elif self.options.config_index_size > 0:
+            self.config_index = ConfigIndex(max_size=self.options.config_index_size)
+        self.rate_limiter: Optional[TokenBucket] = (
+            TokenBucket(self.options.rate_limit, burst=self.options.rate_limit_burst)
+            if self.options.rate_limit is not None
+            else None
+        )
+        self.concurrency_limiter: Optional[ConcurrencyLimiter] = (
+            ConcurrencyLimiter(self.options.max_concurrency)
+            if self.options.max_concurrency is not None
+            else None
+        )
+        self.retry_budget: Optional[RetryBudget] = (
+            RetryBudget(self.options.retry_budget_ratio)
+            if self.options.retry_budget_ratio is not None
+            else None
+        )
 
         self.session: requests.Session = requests.Session()
+        adapter = APIClientAdapter(self.options)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         from ..__version__ import __version__
 
@@ -190,6 +245,9 @@ class APIClient:
         """
         self.auth_token = None
         self.session.headers.pop("Authorization")
+        # Cached responses may depend on user permissions
+        if self.conditional_cache is not None:
+            self.conditional_cache.clear()
 
     def perform_request(
         self, method: str, url: str, *args: Any, **kwargs: Any
@@ -204,6 +262,111 @@ class APIClient:
                 raise
             raise mapped_error
 
+    def add_hooks(self, hooks: APIClientHooks) -> None:
+        """
+        Registers instrumentation hooks
+
+        .. versionadded:: 4.7.0
+
+        :param hooks: :class:`mwdblib.api.APIClientHooks` instance
+            e.g. :class:`mwdblib.api.MetricsCollector`
+        """
+        self.hooks = self.hooks + [hooks]
+
+    def remove_hooks(self, hooks: APIClientHooks) -> None:
+        """
+        Unregisters instrumentation hooks
+
+        .. versionadded:: 4.7.0
+        """
+        self.hooks = [h for h in self.hooks if h is not hooks]
+
+    def call_hooks(self, name: str, *args: Any) -> None:
+        """
+        Calls method of all registered hooks
+        """
+        for hooks in self.hooks:
+            getattr(hooks, name)(*args)
+
+    def _perform_throttled_request(
+        self,
+        request_info: RequestInfo,
+        method: str,
+        url: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> requests.models.Response:
+        """
+        Performs request respecting client-side rate and concurrency limits
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        epoch = (
+            self.concurrency_limiter.acquire()
+            if self.concurrency_limiter is not None
+            else 0
+        )
+        request_info.attempt += 1
+        request_info.start_time = time.monotonic()
+        self.call_hooks("on_request_start", request_info)
+        response: Optional[requests.models.Response] = None
+        error: Optional[BaseException] = None
+        try:
+            response = self.perform_request(method, url, *args, **kwargs)
+            return response
+        except BaseException as e:
+            error = e
+            http_error = (
+                e if isinstance(e, HTTPError) else getattr(e, "http_error", None)
+            )
+            if http_error is not None:
+                response = http_error.response
+            raise
+        finally:
+            if self.concurrency_limiter is not None:
+                self.concurrency_limiter.release(
+                    epoch,
+                    overloaded=isinstance(error, (LimitExceededError, GatewayError)),
+                )
+            self.call_hooks("on_request_end", request_info, response, error)
+
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Returns delay before next retry after downtime
+        """
+        if not self.options.retry_backoff:
+            return float(self.options.downtime_timeout)
+        # Exponential backoff with full jitter
+        return random.uniform(
+            0,
+            min(
+                self.options.retry_backoff_max,
+                self.options.downtime_timeout * 2**attempt,
+            ),
+        )
+
+    def _can_retry(self, delay: float, deadline: Optional[float]) -> bool:
+        """
+        Checks if request can be retried after delay within deadline
+        and retry budget
+        """
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return False
+        if self.retry_budget is not None and not self.retry_budget.withdraw():
+            return False
+        return True
+
+    @staticmethod
+    def _deadline_timeout(timeout: Any, remaining: float) -> Any:
+        """
+        Limits request timeout to the time remaining until deadline
+        """
+        if isinstance(timeout, tuple):
+            return tuple(
+                min(t, remaining) if t is not None else remaining for t in timeout
+            )
+        return min(timeout, remaining) if timeout is not None else remaining
+
     def request(
         self,
         method: str,
@@ -234,6 +397,20 @@ class APIClient:
         :param noauth: |
             Don't check if user is authenticated before sending request (default: False)
         :param raw: Return raw response bytes instead of parsed JSON (default: False)
+
+        .. versionchanged:: 4.7.0
+           If ``stream=True`` is passed, response body is not consumed and
+           :class:`requests.Response` object is returned instead. Caller is
+           responsible for closing it.
+
+        .. versionchanged:: 4.7.0
+           GET requests are sent as conditional requests if
+           ``conditional_cache_size`` option is set and response was cached.
+           Only JSON responses are cached (not ``raw`` ones).
+
+        .. versionchanged:: 4.7.0
+           Retries respect ``request_deadline`` and ``retry_budget_ratio`` options.
+           Failed retry is reported by raising the last error.
         """
         # Check if authenticated
         if not noauth and self.auth_token is None:
@@ -246,17 +423,85 @@ class APIClient:
         url = urljoin(self.options.api_url, url)
         # Pass verify_ssl setting to requests kwargs
         kwargs["verify"] = self.options.verify_ssl
+        # Use configured timeouts unless overridden for this request
+        if "timeout" not in kwargs and (
+            self.options.connect_timeout is not None
+            or self.options.read_timeout is not None
+        ):
+            kwargs["timeout"] = (
+                self.options.connect_timeout,
+                self.options.read_timeout,
+            )
 
         downtime_retries = self.options.max_downtime_retries
-        downtime_timeout = self.options.downtime_timeout
         retry_on_downtime = self.options.retry_on_downtime
         retry_idempotent = self.options.retry_idempotent
+        downtime_attempt = 0
+
+        # Total time budget for request including retries
+        timeout = kwargs.get("timeout")
+        deadline = (
+            time.monotonic() + self.options.request_deadline
+            if self.options.request_deadline is not None
+            else None
+        )
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+
+        # Streamed request body needs to be rewound before each retry
+        body: Any = kwargs.get("data")
+        body_position = (
+            body.tell() if hasattr(body, "seek") and hasattr(body, "tell") else None
+        )
+
+        request_info = RequestInfo(
+            method,
+            url,
+            endpoint_name(url[len(self.options.api_url) :]),
+            stream=bool(kwargs.get("stream")),
+        )
+
+        # Revalidate previously fetched resource instead of downloading it again.
+        # Raw responses (e.g. file contents) are not kept in memory.
+        conditional_cache = self.conditional_cache
+        if method.lower() != "get" or raw or kwargs.get("stream"):
+            conditional_cache = None
+        conditional_key = None
+        cached_response = None
+        if conditional_cache is not None:
+            conditional_key = (
+                requests.Request(method, url, params=kwargs.get("params")).prepare().url
+            )
+            cached_response = conditional_cache.get(conditional_key)
+            if cached_response is not None:
+                kwargs["headers"] = {
+                    **(kwargs.get("headers") or {}),
+                    **conditional_cache.request_headers(cached_response),
+                }
 
         while True:
+            if body_position is not None:
+                body.seek(body_position)
+            if deadline is not None:
+                kwargs["timeout"] = self._deadline_timeout(
+                    timeout, max(deadline - time.monotonic(), 0.001)
+                )
             try:
-                response = self.perform_request(method, url, *args, **kwargs)
+                response = self._perform_throttled_request(
+                    request_info, method, url, *args, **kwargs
+                )
+                if kwargs.get("stream"):
+                    return response
+                if conditional_cache is None:
+                    content = response.content
+                elif cached_response is not None and response.status_code == 304:
+                    content = conditional_cache.revalidated(cached_response)
+                    self.call_hooks("on_cache_hit", "conditional", url)
+                else:
+                    content = response.content
+                    conditional_cache.store(conditional_key, response)
                 try:
-                    return response.json() if not raw else response.content
+                    return json.loads(content) if not raw else content
                 except ValueError:
                     raise BadResponseError(
                         "Can't decode JSON response from server. "
@@ -269,6 +514,7 @@ class APIClient:
                 # If no password set: re-raise
                 if self.username is None or self.password is None:
                     raise
+                self.call_hooks("on_relogin", request_info)
                 # Try to log in
                 self.login(self.username, self.password)
                 # Retry failed request...
@@ -283,26 +529,38 @@ class APIClient:
                     retry_after = 60
                 else:
                     retry_after = int(http_error.response.headers["Retry-After"])
+                if not self._can_retry(retry_after, deadline):
+                    raise
+                self.call_hooks("on_ratelimit", request_info, retry_after)
                 if self.options.emit_warnings:
                     warnings.warn(
                         f"Rate limit exceeded. Sleeping for a {retry_after} seconds."
                     )
-                time.sleep(retry_after)
+                if self.rate_limiter is not None:
+                    # Hold back other threads as well, they would hit the limit too
+                    self.rate_limiter.pause(retry_after)
+                else:
+                    time.sleep(retry_after)
                 # Retry failed request...
-            except (ConnectionError, GatewayError):
+            except (ConnectionError, GatewayError) as e:
                 if (
                     not retry_on_downtime
                     or downtime_retries == 0
                     or (not retry_idempotent and method == "post")
                 ):
                     raise
+                delay = self._retry_delay(downtime_attempt)
+                if not self._can_retry(delay, deadline):
+                    raise
                 downtime_retries -= 1
+                downtime_attempt += 1
+                self.call_hooks("on_retry", request_info, e, delay)
                 if self.options.emit_warnings:
                     warnings.warn(
                         "Retrying request due to connectivity issues. "
-                        f"Sleeping for {downtime_timeout} seconds."
+                        f"Sleeping for {delay:.1f} seconds."
                     )
-                time.sleep(downtime_timeout)
+                time.sleep(delay)
                 # Retry failed request...
 
     def get(self, *args: Any, **kwargs: Any) -> Any:
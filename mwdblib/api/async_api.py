@@ -0,0 +1,163 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from .api import APIClient
+from .options import APIClientOptions
+
+T = TypeVar("T")
+
+
+class AsyncAPIClient:
+    """
+    Asyncio counterpart of :class:`APIClient`.
+
+    Requests are sent by the wrapped :class:`APIClient`, so authentication,
+    re-login, rate limiting and downtime retries behave exactly the same as
+    in the blocking client. Blocking I/O is dispatched to a dedicated thread
+    pool, which allows a single event loop to keep up to ``max_workers``
+    requests in flight.
+
+    .. note::
+
+       This is not a native asyncio transport: each request in flight
+       occupies one worker thread and further requests wait for a free
+       worker. Threads are started on demand, so raise ``max_workers`` if you
+       need more concurrent requests. Connection pool of the created client
+       is sized to ``max_workers``, so every worker keeps its connection.
+
+    .. code-block:: python
+
+        async with AsyncAPIClient(max_workers=32) as api:
+            server = await api.get("server", noauth=True)
+
+    .. versionadded:: 4.7.0
+
+    :param api: Blocking :class:`APIClient` to be used for communication.
+        If not provided, new client is created using ``api_options``.
+    :param max_workers: Maximum number of requests in flight (default: 64).
+        Unless set explicitly, ``pool_maxsize`` of the created client
+        is set to the same value. If ``api`` is provided, its ``pool_maxsize``
+        should not be lower than ``max_workers``.
+    """
+
+    def __init__(
+        self,
+        api: Optional[APIClient] = None,
+        max_workers: int = 64,
+        **api_options: Any,
+    ) -> None:
+        if api is None:
+            api_options.setdefault("pool_maxsize", max_workers)
+            api = APIClient(**api_options)
+        self.api: APIClient = api
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mwdblib"
+        )
+        self.closed = False
+
+    @property
+    def options(self) -> APIClientOptions:
+        return self.api.options
+
+    @property
+    def logged_user(self) -> Optional[str]:
+        """
+        Username of logged-in user or the owner of used API key.
+        Returns None if no credentials are provided
+        """
+        return self.api.logged_user
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Runs blocking callable (e.g. lazy-loading property or object method)
+        in the client thread pool.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def server_metadata(self) -> dict:
+        """
+        Information about MWDB Core server from ``/api/server`` endpoint.
+        """
+        return await self.run(lambda: self.api.server_metadata)
+
+    async def server_version(self) -> str:
+        """
+        MWDB Core server version
+        """
+        return await self.run(lambda: self.api.server_version)
+
+    async def supports_version(self, required_version: str) -> bool:
+        """
+        Checks if server version is higher or equal than provided.
+        """
+        return await self.run(self.api.supports_version, required_version)
+
+    async def login(self, username: str, password: str) -> None:
+        """
+        Performs authentication using provided credentials
+        """
+        await self.run(self.api.login, username, password)
+
+    def set_api_key(self, api_key: str) -> None:
+        """
+        Sets API key to be used for authorization
+        """
+        self.api.set_api_key(api_key)
+
+    def logout(self) -> None:
+        """
+        Removes authorization token from APIClient instance
+        """
+        self.api.logout()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        noauth: bool = False,
+        raw: bool = False,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Sends request to MWDB API.
+
+        .. seealso::
+
+            :py:meth:`APIClient.request`
+        """
+        return await self.run(
+            self.api.request, method, url, noauth, raw, *args, **kwargs
+        )
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        return await self.request("get", *args, **kwargs)
+
+    async def post(self, *args: Any, **kwargs: Any) -> Any:
+        return await self.request("post", *args, **kwargs)
+
+    async def put(self, *args: Any, **kwargs: Any) -> Any:
+        return await self.request("put", *args, **kwargs)
+
+    async def delete(self, *args: Any, **kwargs: Any) -> Any:
+        return await self.request("delete", *args, **kwargs)
+
+    def close(self) -> None:
+        """
+        Shuts down the thread pool and closes underlying HTTP session
+        """
+        self.closed = True
+        self.executor.shutdown(wait=False)
+        self.api.session.close()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
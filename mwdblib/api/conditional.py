@@ -0,0 +1,94 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, NamedTuple, Optional
+
+import requests
+
+
+class CachedResponse(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content: bytes
+
+
+class ConditionalCache:
+    """
+    Keeps bodies of GET responses along with their validators (``ETag`` and
+    ``Last-Modified`` headers), so next request for the same resource can be
+    sent as conditional request. If server responds with
+    ``304 Not Modified``, cached body is reused instead of downloading it again.
+
+    Responses without validators are not cached. Least recently used entries
+    are evicted when ``max_size`` is exceeded.
+
+    Enabled by ``conditional_cache_size`` option.
+
+    .. versionadded:: 4.7.0
+
+    :param max_size: Maximum number of cached responses
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        #: Number of requests answered with 304 Not Modified
+        self.not_modified = 0
+        #: Number of response body bytes that didn't need to be transferred
+        self.bytes_saved = 0
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def request_headers(self, entry: CachedResponse) -> Dict[str, str]:
+        """
+        Returns headers that make request conditional
+        """
+        headers = {}
+        if entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, key: Hashable, response: requests.Response) -> None:
+        """
+        Stores response body if it contains any validators
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            if etag is None and last_modified is None:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = CachedResponse(
+                etag=etag, last_modified=last_modified, content=response.content
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def revalidated(self, entry: CachedResponse) -> bytes:
+        """
+        Returns cached body for resource that was not modified
+        """
+        with self._lock:
+            self.not_modified += 1
+            self.bytes_saved += len(entry.content)
+        return entry.content
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "not_modified": self.not_modified,
+                "bytes_saved": self.bytes_saved,
+            }
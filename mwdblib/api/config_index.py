@@ -0,0 +1,159 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, cast
+
+
+class ConfigIndex:
+    """
+    Client-side index of uploaded configurations, mapping
+    :py:func:`mwdblib.config_dhash` of configuration to its identifier.
+
+    When configuration is already in the index, :py:meth:`mwdblib.MWDB.upload_config`
+    doesn't send configuration body again and only adds new parent relationship,
+    tags and attributes to the existing object. Least recently used entries
+    are evicted when ``max_size`` is exceeded.
+
+    Enabled by ``config_index_size`` option.
+
+    .. versionadded:: 4.7.0
+
+    :param max_size: Maximum number of indexed configurations
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, dhash: str) -> Optional[str]:
+        """
+        Returns identifier of uploaded configuration or None if not indexed
+        """
+        with self._lock:
+            config_id = self._entries.get(dhash)
+            if config_id is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(dhash)
+            self.hits += 1
+            return config_id
+
+    def put(self, dhash: str, config_id: str) -> None:
+        with self._lock:
+            self._entries[dhash] = config_id
+            self._entries.move_to_end(dhash)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def evict(self, dhash: str) -> None:
+        with self._lock:
+            self._entries.pop(dhash, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns hit/miss statistics of index
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteConfigIndex(ConfigIndex):
+    """
+    Persistent :class:`ConfigIndex` kept in SQLite database, so it survives
+    restarts and can be shared between processes uploading to the same server.
+
+    Entries are kept per ``namespace`` (MWDB API URL), so the same database
+    can be used for many MWDB instances.
+
+    Enabled by ``config_index_path`` option.
+
+    .. versionadded:: 4.7.0
+
+    :param path: Path to database file
+    :param namespace: Namespace of entries
+    :param max_size: Maximum number of indexed configurations in namespace
+    """
+
+    def __init__(self, path: str, namespace: str = "", max_size: int = 0) -> None:
+        super().__init__(max_size)
+        self.namespace = namespace
+        self._db = sqlite3.connect(
+            os.path.expanduser(path),
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS configs ("
+            "namespace TEXT NOT NULL, dhash TEXT NOT NULL, id TEXT NOT NULL, "
+            "accessed REAL NOT NULL, PRIMARY KEY (namespace, dhash))"
+        )
+
+    def get(self, dhash: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id FROM configs WHERE namespace = ? AND dhash = ?",
+                (self.namespace, dhash),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute(
+                "UPDATE configs SET accessed = ? WHERE namespace = ? AND dhash = ?",
+                (time.time(), self.namespace, dhash),
+            )
+            self.hits += 1
+            return cast(str, row[0])
+
+    def put(self, dhash: str, config_id: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO configs (namespace, dhash, id, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (self.namespace, dhash, config_id, time.time()),
+            )
+            if self.max_size:
+                self._db.execute(
+                    "DELETE FROM configs WHERE namespace = ? AND dhash IN ("
+                    "SELECT dhash FROM configs WHERE namespace = ? "
+                    "ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                    (self.namespace, self.namespace, self.max_size),
+                )
+
+    def evict(self, dhash: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM configs WHERE namespace = ? AND dhash = ?",
+                (self.namespace, dhash),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM configs WHERE namespace = ?", (self.namespace,)
+            )
+
+    def __len__(self) -> int:
+        (size,) = self._db.execute(
+            "SELECT COUNT(*) FROM configs WHERE namespace = ?", (self.namespace,)
+        ).fetchone()
+        return cast(int, size)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
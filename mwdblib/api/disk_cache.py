@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, BinaryIO, Optional, cast
+
+
+class DiskCache:
+    """
+    Persistent cache for immutable API resources (file contents, hashes,
+    configuration and blob bodies), shared between processes.
+
+    Entries are stored as files in content-addressed directory and indexed
+    in SQLite database kept in the same directory. When total size exceeds
+    ``max_size``, least recently used entries are removed.
+
+    Enabled by ``cache_dir`` option.
+
+    .. warning::
+
+       Cached data is not subject to MWDB access control, so cache directory
+       should be accessible only by the user it belongs to.
+
+    .. versionadded:: 4.7.0
+
+    :param path: Path to the cache directory (created if doesn't exist)
+    :param max_size: Maximum total size of cached entries in bytes
+    """
+
+    def __init__(self, path: str, max_size: int = 1024**3) -> None:
+        self.path = os.path.expanduser(path)
+        self.max_size = max_size
+        os.makedirs(os.path.join(self.path, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(self.path, "index.sqlite"),
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+        )
+
+    def _entry_path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.path, "objects", digest[:2], digest)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None
+
+    def open(self, key: str) -> Optional[BinaryIO]:
+        """
+        Opens cached entry for reading or returns None if not cached
+        """
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            if not cursor.rowcount:
+                return None
+        try:
+            return cast(BinaryIO, open(self._entry_path(key), "rb"))
+        except FileNotFoundError:
+            # Entry evicted by another process in the meantime
+            self.evict(key)
+            return None
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Returns cached entry contents or None if not cached
+        """
+        f = self.open(key)
+        if f is None:
+            return None
+        with f:
+            return f.read()
+
+    def get_json(self, key: str) -> Optional[Any]:
+        data = self.get(key)
+        return json.loads(data) if data is not None else None
+
+    def temporary_file(self) -> BinaryIO:
+        """
+        Creates temporary file in cache directory that can be stored
+        later using :py:meth:`put_file`
+        """
+        return cast(
+            BinaryIO,
+            tempfile.NamedTemporaryFile(dir=self.path, prefix=".tmp-", delete=False),
+        )
+
+    def put_file(self, key: str, file_path: str) -> None:
+        """
+        Moves file into the cache as an entry with provided key
+        """
+        size = os.path.getsize(file_path)
+        if size > self.max_size:
+            os.remove(file_path)
+            return
+        entry_path = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        os.replace(file_path, entry_path)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, size, accessed) "
+                "VALUES (?, ?, ?)",
+                (key, size, time.time()),
+            )
+        self._enforce_size()
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Stores entry in the cache
+        """
+        if len(data) > self.max_size:
+            return
+        with self.temporary_file() as f:
+            f.write(data)
+        self.put_file(key, f.name)
+
+    def put_json(self, key: str, value: Any) -> None:
+        self.put(key, json.dumps(value).encode())
+
+    def evict(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _enforce_size(self) -> None:
+        with self._lock:
+            (total_size,) = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            if total_size <= self.max_size:
+                return
+            evicted = []
+            for key, size in self._db.execute(
+                "SELECT key, size FROM entries ORDER BY accessed"
+            ).fetchall():
+                if total_size <= self.max_size:
+                    break
+                evicted.append(key)
+                total_size -= size
+            self._db.executemany(
+                "DELETE FROM entries WHERE key = ?", [(key,) for key in evicted]
+            )
+        for key in evicted:
+            try:
+                os.remove(self._entry_path(key))
+            except FileNotFoundError:
+                pass
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of cached entries in bytes
+        """
+        with self._lock:
+            (total_size,) = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return cast(int, total_size)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,339 @@
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+# Path segments replaced by placeholders, so requests for different objects
+# are aggregated under the same endpoint name
+ENDPOINT_PLACEHOLDERS = [
+    (
+        re.compile(r"^[0-9a-fA-F]{32}$|^[0-9a-fA-F]{40}$|^[0-9a-fA-F]{64,128}$"),
+        "{hash}",
+    ),
+    (
+        re.compile(
+            r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-"
+            r"[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+        ),
+        "{uuid}",
+    ),
+    (re.compile(r"^[0-9]+$"), "{id}"),
+]
+
+
+def endpoint_name(path: str) -> str:
+    """
+    Returns endpoint name for API path e.g. ``object/{hash}/tag``
+    for ``object/<sha256>/tag?tag=...``
+    """
+    path = path.split("?", 1)[0].strip("/")
+    segments = []
+    for segment in path.split("/"):
+        for pattern, placeholder in ENDPOINT_PLACEHOLDERS:
+            if pattern.match(segment):
+                segment = placeholder
+                break
+        segments.append(segment)
+    return "/".join(segments)
+
+
+class RequestInfo:
+    """
+    Information about API call passed to :class:`APIClientHooks` methods.
+    The same object is passed for all attempts of the same call.
+
+    .. versionadded:: 4.7.0
+    """
+
+    def __init__(
+        self, method: str, url: str, endpoint: str, stream: bool = False
+    ) -> None:
+        #: HTTP method
+        self.method = method.upper()
+        #: Full request URL
+        self.url = url
+        #: Endpoint name with object identifiers replaced by placeholders
+        self.endpoint = endpoint
+        #: True if response body is streamed (not read by APIClient)
+        self.stream = stream
+        #: Attempt number, starting from 1
+        self.attempt = 0
+        #: Start time of the current attempt (:py:func:`time.monotonic`)
+        self.start_time = 0.0
+        #: Start time of the whole call including retries
+        self.call_start_time = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Time elapsed since start of the current attempt (in seconds)
+        """
+        return time.monotonic() - self.start_time
+
+    def __repr__(self) -> str:
+        return f"RequestInfo({self.method} {self.endpoint}, attempt={self.attempt})"
+
+
+class APIClientHooks:
+    """
+    Base class for :class:`APIClient` instrumentation hooks.
+    Override methods you're interested in and register hooks using
+    :py:meth:`mwdblib.APIClient.add_hooks`.
+
+    Hooks are called synchronously in the thread that performs the request,
+    so they should be fast and thread-safe.
+
+    .. versionadded:: 4.7.0
+    """
+
+    def on_request_start(self, request: RequestInfo) -> None:
+        """
+        Called before each attempt to send the request
+        """
+
+    def on_request_end(
+        self,
+        request: RequestInfo,
+        response: Optional[requests.Response],
+        error: Optional[BaseException],
+    ) -> None:
+        """
+        Called after each attempt. ``response`` is None if server was unreachable,
+        ``error`` is None if request succeeded.
+        """
+
+    def on_retry(
+        self, request: RequestInfo, error: BaseException, delay: float
+    ) -> None:
+        """
+        Called before retrying request failed due to server downtime
+        """
+
+    def on_ratelimit(self, request: RequestInfo, retry_after: float) -> None:
+        """
+        Called before retrying request rejected by server rate limiter
+        """
+
+    def on_relogin(self, request: RequestInfo) -> None:
+        """
+        Called before re-authentication caused by expired session
+        """
+
+    def on_cache_hit(self, cache: str, key: str) -> None:
+        """
+        Called when data is served by client-side cache ('object', 'disk',
+        'conditional' or 'config_index') instead of being fetched from server.
+        """
+
+
+def _body_length(body: Any) -> int:
+    if body is None:
+        return 0
+    try:
+        return len(body)
+    except TypeError:
+        return 0
+
+
+class EndpointMetrics:
+    def __init__(self, buckets: int) -> None:
+        self.count = 0
+        self.errors = 0
+        self.latency_buckets = [0] * buckets
+        self.latency_sum = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.retries = 0
+        self.ratelimited = 0
+
+
+class MetricsCollector(APIClientHooks):
+    """
+    Hooks that collect request metrics: per-endpoint latency histograms,
+    transferred bytes, errors, retries and cache hits.
+
+    .. code-block:: python
+
+        metrics = MetricsCollector()
+        mwdb.api.add_hooks(metrics)
+        ...
+        print(metrics.to_prometheus())
+
+    .. versionadded:: 4.7.0
+
+    :param buckets: Upper bounds of latency histogram buckets (in seconds)
+    """
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self.relogins = 0
+        self.cache_hits: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def _endpoint(self, request: RequestInfo) -> EndpointMetrics:
+        key = (request.method, request.endpoint)
+        if key not in self.endpoints:
+            self.endpoints[key] = EndpointMetrics(len(self.buckets))
+        return self.endpoints[key]
+
+    def on_request_end(
+        self,
+        request: RequestInfo,
+        response: Optional[requests.Response],
+        error: Optional[BaseException],
+    ) -> None:
+        latency = request.elapsed
+        bytes_out = _body_length(response.request.body) if response is not None else 0
+        bytes_in = 0
+        if response is not None:
+            # Don't consume streamed responses
+            if request.stream:
+                bytes_in = int(response.headers.get("Content-Length", 0))
+            else:
+                bytes_in = len(response.content or b"")
+        with self._lock:
+            metrics = self._endpoint(request)
+            metrics.count += 1
+            if error is not None:
+                metrics.errors += 1
+            metrics.latency_sum += latency
+            for index, bound in enumerate(self.buckets):
+                if latency <= bound:
+                    metrics.latency_buckets[index] += 1
+                    break
+            metrics.bytes_in += bytes_in
+            metrics.bytes_out += bytes_out
+
+    def on_retry(
+        self, request: RequestInfo, error: BaseException, delay: float
+    ) -> None:
+        with self._lock:
+            self._endpoint(request).retries += 1
+
+    def on_ratelimit(self, request: RequestInfo, retry_after: float) -> None:
+        with self._lock:
+            self._endpoint(request).ratelimited += 1
+
+    def on_relogin(self, request: RequestInfo) -> None:
+        with self._lock:
+            self.relogins += 1
+
+    def on_cache_hit(self, cache: str, key: str) -> None:
+        with self._lock:
+            self.cache_hits[cache] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.endpoints.clear()
+            self.relogins = 0
+            self.cache_hits.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns collected metrics as JSON-serializable dict
+        """
+        with self._lock:
+            endpoints: List[Dict[str, Any]] = []
+            for (method, endpoint), metrics in sorted(self.endpoints.items()):
+                endpoints.append(
+                    {
+                        "method": method,
+                        "endpoint": endpoint,
+                        "count": metrics.count,
+                        "errors": metrics.errors,
+                        "latency_sum": metrics.latency_sum,
+                        "latency_avg": (
+                            metrics.latency_sum / metrics.count if metrics.count else 0
+                        ),
+                        "latency_histogram": {
+                            **{
+                                str(bound): count
+                                for bound, count in zip(
+                                    self.buckets, metrics.latency_buckets
+                                )
+                            },
+                            "+Inf": metrics.count - sum(metrics.latency_buckets),
+                        },
+                        "bytes_in": metrics.bytes_in,
+                        "bytes_out": metrics.bytes_out,
+                        "retries": metrics.retries,
+                        "ratelimited": metrics.ratelimited,
+                    }
+                )
+            return {
+                "endpoints": endpoints,
+                "relogins": self.relogins,
+                "cache_hits": dict(self.cache_hits),
+            }
+
+    def to_prometheus(self, prefix: str = "mwdblib") -> str:
+        """
+        Returns collected metrics in Prometheus text exposition format
+        """
+
+        def labels(**values: str) -> str:
+            escaped = (
+                '{}="{}"'.format(key, value.replace("\\", "\\\\").replace('"', '\\"'))
+                for key, value in values.items()
+            )
+            return "{" + ",".join(escaped) + "}"
+
+        lines = []
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+            lines += [
+                f"# HELP {prefix}_request_duration_seconds API request latency",
+                f"# TYPE {prefix}_request_duration_seconds histogram",
+            ]
+            for (method, endpoint), metrics in endpoints:
+                cumulative = 0
+                for bound, count in zip(self.buckets, metrics.latency_buckets):
+                    cumulative += count
+                    lines.append(
+                        f"{prefix}_request_duration_seconds_bucket"
+                        f"{labels(method=method, endpoint=endpoint, le=str(bound))} "
+                        f"{cumulative}"
+                    )
+                endpoint_labels = labels(method=method, endpoint=endpoint)
+                lines += [
+                    f"{prefix}_request_duration_seconds_bucket"
+                    f"{labels(method=method, endpoint=endpoint, le='+Inf')} "
+                    f"{metrics.count}",
+                    f"{prefix}_request_duration_seconds_sum{endpoint_labels} "
+                    f"{metrics.latency_sum}",
+                    f"{prefix}_request_duration_seconds_count{endpoint_labels} "
+                    f"{metrics.count}",
+                ]
+            counters = [
+                ("request_errors_total", "Failed API requests", "errors"),
+                ("request_bytes_total", "Bytes sent in request bodies", "bytes_out"),
+                ("response_bytes_total", "Bytes received in responses", "bytes_in"),
+                ("retries_total", "Requests retried due to downtime", "retries"),
+                ("ratelimited_total", "Requests rejected by rate limit", "ratelimited"),
+            ]
+            for name, description, attribute in counters:
+                lines += [
+                    f"# HELP {prefix}_{name} {description}",
+                    f"# TYPE {prefix}_{name} counter",
+                ]
+                for (method, endpoint), metrics in endpoints:
+                    lines.append(
+                        f"{prefix}_{name}{labels(method=method, endpoint=endpoint)} "
+                        f"{getattr(metrics, attribute)}"
+                    )
+            lines += [
+                f"# HELP {prefix}_relogins_total Re-authentications",
+                f"# TYPE {prefix}_relogins_total counter",
+                f"{prefix}_relogins_total {self.relogins}",
+                f"# HELP {prefix}_cache_hits_total Data served by client-side cache",
+                f"# TYPE {prefix}_cache_hits_total counter",
+            ]
+            for cache, hits in sorted(self.cache_hits.items()):
+                lines.append(f"{prefix}_cache_hits_total{labels(cache=cache)} {hits}")
+        return "\n".join(lines) + "\n"
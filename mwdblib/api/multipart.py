@@ -0,0 +1,121 @@
+import io
+import os
+import uuid
+from typing import BinaryIO, Callable, List, Optional, Tuple, Union
+
+MultipartField = Tuple[str, Optional[str], Union[bytes, BinaryIO]]
+ProgressCallback = Callable[[int, int], None]
+
+
+class MultipartEncoder:
+    """
+    Streaming ``multipart/form-data`` request body.
+
+    Unlike ``files=`` argument of requests library, contents of file fields are
+    not loaded into memory. Body is read in chunks directly from provided
+    seekable file objects while request is being sent. Pass encoder as ``data``
+    and :py:attr:`content_type` as ``Content-Type`` header.
+
+    Encoder is seekable, so request can be retried from the beginning.
+
+    .. versionadded:: 4.7.0
+
+    :param fields: List of (field name, file name or None, contents) tuples.
+        Contents can be bytes or seekable binary file object.
+    :param progress_callback: Function called with number of bytes read so far
+        and total body length each time a chunk is read.
+    """
+
+    def __init__(
+        self,
+        fields: List[MultipartField],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> None:
+        self.boundary = uuid.uuid4().hex
+        self.progress_callback = progress_callback
+        self._position = 0
+        self._segment_index = 0
+        self._segment_offset = 0
+        self._segment_positioned = False
+        # Body segments: (stream, start position, length)
+        self._segments: List[Tuple[BinaryIO, int, int]] = []
+        for name, filename, contents in fields:
+            disposition = f'form-data; name="{name}"'
+            if filename is not None:
+                filename = filename.replace("\\", "\\\\").replace('"', '\\"')
+                disposition += f'; filename="{filename}"'
+            self._add_bytes(
+                f"--{self.boundary}\r\n"
+                f"Content-Disposition: {disposition}\r\n\r\n".encode()
+            )
+            if isinstance(contents, bytes):
+                self._add_bytes(contents)
+            else:
+                start = contents.tell()
+                end = contents.seek(0, os.SEEK_END)
+                self._segments.append((contents, start, end - start))
+            self._add_bytes(b"\r\n")
+        self._add_bytes(f"--{self.boundary}--\r\n".encode())
+        self.length = sum(length for _, _, length in self._segments)
+        self.seek(0)
+
+    def _add_bytes(self, data: bytes) -> None:
+        self._segments.append((io.BytesIO(data), 0, len(data)))
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self.length
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self.length
+        self._position = max(0, min(offset, self.length))
+        # Find segment containing the new position
+        self._segment_index = 0
+        self._segment_offset = self._position
+        while (
+            self._segment_index < len(self._segments)
+            and self._segment_offset >= self._segments[self._segment_index][2]
+        ):
+            self._segment_offset -= self._segments[self._segment_index][2]
+            self._segment_index += 1
+        self._segment_positioned = False
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.length - self._position
+        chunks = []
+        while size > 0 and self._segment_index < len(self._segments):
+            stream, start, length = self._segments[self._segment_index]
+            if self._segment_offset == length:
+                # Empty segment, nothing to read
+                self._segment_index += 1
+                self._segment_offset = 0
+                continue
+            if not self._segment_positioned:
+                stream.seek(start + self._segment_offset)
+                self._segment_positioned = True
+            chunk = stream.read(min(size, length - self._segment_offset))
+            if not chunk:
+                raise IOError("File has been truncated during upload")
+            chunks.append(chunk)
+            size -= len(chunk)
+            self._segment_offset += len(chunk)
+            if self._segment_offset == length:
+                self._segment_index += 1
+                self._segment_offset = 0
+                self._segment_positioned = False
+        data = b"".join(chunks)
+        self._position += len(data)
+        if self.progress_callback is not None and data:
+            self.progress_callback(self._position, self.length)
+        return data
@@ -0,0 +1,90 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class ObjectCache:
+    """
+    Identity map of objects created by single :class:`APIClient`.
+
+    Objects are kept by (type, id) key, so the same object reached in different
+    ways (search results, parents, children, share reasons) is represented by the
+    same instance and lazy-loaded data is fetched only once. Least recently used
+    entries are evicted when ``max_size`` is exceeded and entries older than
+    ``ttl`` seconds are dropped on access.
+
+    Enabled by ``object_cache_size`` option.
+
+    .. versionadded:: 4.7.0
+
+    :param max_size: Maximum number of cached objects
+    :param ttl: Time after which cached object is considered stale (in seconds).
+        If None, objects are kept until evicted.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns cached object or None if not cached or stale
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None:
+                if time.monotonic() - entry[0] > self.ttl:
+                    del self._entries[key]
+                    self.evictions += 1
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns cached object without affecting statistics and LRU order
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[1] if entry is not None else None
+
+    def put(self, key: Hashable, obj: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), obj)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def evict(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns hit/miss statistics of cache
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
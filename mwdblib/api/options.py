@@ -26,6 +26,8 @@ class OptionsField:
             value = config_parser.getboolean(section, self.name, fallback=None)
         elif self.value_type is int:
             value = config_parser.getint(section, self.name, fallback=None)
+        elif self.value_type is float:
+            value = config_parser.getfloat(section, self.name, fallback=None)
         else:
             value = config_parser.get(section, self.name, fallback=None)
         if value is not None:
@@ -48,6 +50,8 @@ class OptionsField:
         return self.default_value
 
     def __set__(self, instance: Any, value: Any) -> None:
+        if self.value_type is float and type(value) is int:
+            value = float(value)
         if not (self.nullable and value is None) and type(value) is not self.value_type:
             raise TypeError(
                 f"Expected '{self.name}' to be {self.value_type} not {type(value)}"
@@ -83,6 +87,26 @@ class APIClientOptions:
     retry_idempotent = OptionsField(True)
     use_keyring = OptionsField(True)
     emit_warnings = OptionsField(True)
+    pool_connections = OptionsField(10)
+    pool_maxsize = OptionsField(10)
+    pool_block = OptionsField(False)
+    connect_timeout = OptionsField(value_type=float)
+    read_timeout = OptionsField(value_type=float)
+    tcp_keepalive = OptionsField(False)
+    object_cache_size = OptionsField(0)
+    object_cache_ttl = OptionsField(value_type=float)
+    cache_dir = OptionsField(value_type=str)
+    cache_max_size = OptionsField(1024**3)
+    conditional_cache_size = OptionsField(0)
+    config_index_size = OptionsField(0)
+    config_index_path = OptionsField(value_type=str)
+    rate_limit = OptionsField(value_type=float)
+    rate_limit_burst = OptionsField(value_type=int)
+    max_concurrency = OptionsField(value_type=int)
+    retry_backoff = OptionsField(False)
+    retry_backoff_max = OptionsField(300.0)
+    request_deadline = OptionsField(value_type=float)
+    retry_budget_ratio = OptionsField(value_type=float)
 
     # General options that can be set both globally or for specific instance
     GENERAL_OPTIONS = [
@@ -94,6 +118,26 @@ class APIClientOptions:
         retry_idempotent,
         use_keyring,
         emit_warnings,
+        pool_connections,
+        pool_maxsize,
+        pool_block,
+        connect_timeout,
+        read_timeout,
+        tcp_keepalive,
+        object_cache_size,
+        object_cache_ttl,
+        cache_dir,
+        cache_max_size,
+        conditional_cache_size,
+        config_index_size,
+        config_index_path,
+        rate_limit,
+        rate_limit_burst,
+        max_concurrency,
+        retry_backoff,
+        retry_backoff_max,
+        request_deadline,
+        retry_budget_ratio,
     ]
     # Options that apply only to global mwdblib configuration
     GLOBAL_ONLY_OPTIONS = [api_url]
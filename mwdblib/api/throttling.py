@@ -0,0 +1,166 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Client-side rate limiter that keeps request rate below ``rate`` requests
+    per second, allowing bursts of up to ``burst`` requests.
+
+    Tokens are reserved under a lock and waiting is done outside of it,
+    so the bucket can be shared by many threads, including thread pool
+    used by :class:`mwdblib.AsyncAPIClient`.
+
+    Enabled by ``rate_limit`` option.
+
+    .. versionadded:: 4.7.0
+
+    :param rate: Number of requests per second
+    :param burst: Maximum number of requests that can be sent at once
+        (default: ``rate`` rounded up)
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, round(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns number of seconds the caller needs to wait
+        before sending the request.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """
+        Blocks until request can be sent
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Holds back all requests for the specified number of seconds
+        e.g. when server has responded with HTTP 429 and ``Retry-After`` header.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+class ConcurrencyLimiter:
+    """
+    Adaptive limit of requests in flight using AIMD
+    (additive increase, multiplicative decrease) algorithm.
+
+    The limit grows by one after each window of successful requests and is
+    multiplied by ``backoff_factor`` when server signals overload with
+    HTTP 429, 502 or 504. Requests that were started before the decrease
+    don't decrease the limit again, so burst of errors is counted once.
+
+    Enabled by ``max_concurrency`` option.
+
+    .. versionadded:: 4.7.0
+
+    :param max_limit: Maximum number of requests in flight
+    :param min_limit: Minimum number of requests in flight (default: 1)
+    :param backoff_factor: Multiplier applied on overload (default: 0.5)
+    """
+
+    def __init__(
+        self, max_limit: int, min_limit: int = 1, backoff_factor: float = 0.5
+    ) -> None:
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("Expected 1 <= min_limit <= max_limit")
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.backoff_factor = backoff_factor
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self._epoch = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> int:
+        """
+        Blocks until request can be sent. Returned value needs to be passed
+        to :py:meth:`release`.
+        """
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+            return self._epoch
+
+    def release(self, epoch: int, overloaded: bool = False) -> None:
+        """
+        Marks request as finished and adjusts the limit
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if overloaded:
+                if epoch == self._epoch:
+                    self.limit = max(
+                        float(self.min_limit), self.limit * self.backoff_factor
+                    )
+                    self._epoch += 1
+            else:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+
+class RetryBudget:
+    """
+    Limits number of retries to a fraction of sent requests, so clients don't
+    multiply the load of overloaded server. Budget is shared by all threads
+    using the same client.
+
+    Each request deposits ``ratio`` of a token and each retry withdraws
+    one token. Budget starts full with ``max_tokens`` tokens.
+
+    Enabled by ``retry_budget_ratio`` option.
+
+    .. versionadded:: 4.7.0
+
+    :param ratio: Allowed number of retries per request e.g. 0.1 for 10%
+    :param max_tokens: Maximum number of retries that can be done at once
+        (default: 10)
+    """
+
+    def __init__(self, ratio: float, max_tokens: float = 10.0) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Takes a token for retry. Returns False if budget is exhausted.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
@@ -0,0 +1,504 @@
+import asyncio
+import os
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .api import APIClientOptions
+from .api.async_api import AsyncAPIClient
+from .blob import MWDBBlob
+from .checkpoint import Checkpoint
+from .config import MWDBConfig
+from .core import MWDB, UploadResult
+from .file import MWDBFile
+from .karton import MWDBKartonAnalysis
+from .listener import ListenerCursor
+from .object import MWDBObject
+from .record import MWDBObjectRecord
+
+T = TypeVar("T")
+MWDBObjectVar = TypeVar("MWDBObjectVar", bound=MWDBObject)
+
+
+class AsyncMWDB:
+    """
+    Asyncio counterpart of :class:`MWDB`.
+
+    Exposes the same query, search, listen and upload methods as coroutines
+    and asynchronous iterators, so many lookups can be driven concurrently from
+    a single event loop. Returned objects are regular :class:`MWDBObject`
+    instances. Their lazy-loaded properties are blocking, so use
+    :py:meth:`fetch` to load them without blocking the event loop.
+
+    .. note::
+
+       Requests are performed by the blocking client in a thread pool of
+       :class:`AsyncAPIClient`, one thread per request in flight. At most
+       ``max_workers`` requests are sent concurrently, others wait for a free
+       worker, so set ``max_workers`` to the concurrency you need (e.g.
+       ``max_workers=256`` for hundreds of concurrent lookups). Connection
+       pool is sized to the same value.
+
+    :param api: Custom :class:`AsyncAPIClient` to be used for communication
+    :param max_workers: Maximum number of requests in flight (default: 64)
+
+    Other keyword arguments are the same as in :class:`MWDB`.
+
+    .. versionadded:: 4.7.0
+
+    Usage example:
+
+    .. code-block:: python
+
+        import asyncio
+        from mwdblib import AsyncMWDB
+
+        async def main(hashes):
+            async with AsyncMWDB(max_workers=64) as mwdb:
+                files = await asyncio.gather(
+                    *[mwdb.query_file(h, raise_not_found=False) for h in hashes]
+                )
+                async for cfg in mwdb.search_configs("family:evil"):
+                    print(cfg.id)
+    """
+
+    def __init__(
+        self,
+        api: Optional[AsyncAPIClient] = None,
+        max_workers: int = 64,
+        **api_options: Any,
+    ) -> None:
+        self.api = api or AsyncAPIClient(max_workers=max_workers, **api_options)
+        self.mwdb = MWDB(api=self.api.api)
+
+    @property
+    def options(self) -> APIClientOptions:
+        """
+        Returns object with current configuration of MWDB client
+        """
+        return self.api.options
+
+    async def login(self, username: str, password: str) -> None:
+        """
+        Performs user authentication using provided username and password.
+        """
+        await self.api.login(username, password)
+
+    def logout(self) -> None:
+        """
+        Performs session logout and removes previously set API key.
+        """
+        self.api.logout()
+
+    async def _iterate(self, iterator: Iterator[T]) -> AsyncIterator[T]:
+        """
+        Drives blocking iterator in the client thread pool.
+
+        If asynchronous iterator is closed before exhaustion, blocking
+        generator is closed as well, so its background threads and
+        connections are released.
+        """
+        sentinel = object()
+        # Generator can't be closed while it's advanced by another thread
+        lock = threading.Lock()
+
+        def locked(fn: Callable[..., Any], *args: Any) -> Any:
+            with lock:
+                return fn(*args)
+
+        try:
+            while True:
+                element = await self.api.run(locked, next, iterator, sentinel)
+                if element is sentinel:
+                    return
+                yield cast(T, element)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                if self.api.closed:
+                    # Thread pool is already shut down
+                    locked(close)
+                else:
+                    await self.api.run(locked, close)
+
+    def _recent(
+        self,
+        object_type: Type[MWDBObjectVar],
+        query: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[MWDBObjectVar]:
+        return self._iterate(
+            self.mwdb._recent(
+                object_type, query=query, chunk_size=chunk_size, prefetch=prefetch
+            )
+        )
+
+    def recent_objects(
+        self, chunk_size: Optional[int] = None, prefetch: int = 0
+    ) -> AsyncIterator[MWDBObject]:
+        """
+        Retrieves recently uploaded objects
+
+        .. seealso:: :py:meth:`MWDB.recent_objects`
+        """
+        return self._recent(MWDBObject, chunk_size=chunk_size, prefetch=prefetch)
+
+    def recent_files(
+        self, chunk_size: Optional[int] = None, prefetch: int = 0
+    ) -> AsyncIterator[MWDBFile]:
+        """
+        Retrieves recently uploaded files
+        """
+        return self._recent(MWDBFile, chunk_size=chunk_size, prefetch=prefetch)
+
+    def recent_configs(
+        self, chunk_size: Optional[int] = None, prefetch: int = 0
+    ) -> AsyncIterator[MWDBConfig]:
+        """
+        Retrieves recently uploaded configuration objects
+        """
+        return self._recent(MWDBConfig, chunk_size=chunk_size, prefetch=prefetch)
+
+    def recent_blobs(
+        self, chunk_size: Optional[int] = None, prefetch: int = 0
+    ) -> AsyncIterator[MWDBBlob]:
+        """
+        Retrieves recently uploaded blob objects
+        """
+        return self._recent(MWDBBlob, chunk_size=chunk_size, prefetch=prefetch)
+
+    def search(
+        self, query: str, chunk_size: Optional[int] = None, prefetch: int = 0
+    ) -> AsyncIterator[MWDBObject]:
+        """
+        Advanced search for objects using Lucene syntax.
+
+        .. seealso:: :py:meth:`MWDB.search`
+        """
+        return self._recent(MWDBObject, query, chunk_size=chunk_size, prefetch=prefetch)
+
+    def search_files(
+        self, query: str, chunk_size: Optional[int] = None, prefetch: int = 0
+    ) -> AsyncIterator[MWDBFile]:
+        """
+        Advanced search for files using Lucene syntax.
+        """
+        return self._recent(MWDBFile, query, chunk_size=chunk_size, prefetch=prefetch)
+
+    def search_configs(
+        self, query: str, chunk_size: Optional[int] = None, prefetch: int = 0
+    ) -> AsyncIterator[MWDBConfig]:
+        """
+        Advanced search for configuration objects using Lucene syntax.
+        """
+        return self._recent(MWDBConfig, query, chunk_size=chunk_size, prefetch=prefetch)
+
+    def search_blobs(
+        self, query: str, chunk_size: Optional[int] = None, prefetch: int = 0
+    ) -> AsyncIterator[MWDBBlob]:
+        """
+        Advanced search for blob objects using Lucene syntax.
+        """
+        return self._recent(MWDBBlob, query, chunk_size=chunk_size, prefetch=prefetch)
+
+    def iter_records(
+        self,
+        object_type: str = "object",
+        query: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[MWDBObjectRecord]:
+        """
+        Retrieves recently uploaded objects or search results as compact,
+        read-only records.
+
+        .. seealso:: :py:meth:`MWDB.iter_records`
+        """
+        return self._iterate(
+            self.mwdb.iter_records(
+                object_type, query=query, chunk_size=chunk_size, prefetch=prefetch
+            )
+        )
+
+    async def _listen(
+        self,
+        last_object: Optional[Union[MWDBObjectVar, str]],
+        object_type: Type[MWDBObjectVar],
+        blocking: bool,
+        interval: int,
+        query: Optional[str],
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> AsyncIterator[MWDBObjectVar]:
+        """
+        Generic implementation of listen_* methods.
+
+        Each poll is performed by :class:`ListenerCursor` in the client thread
+        pool. Waiting between polls doesn't occupy any thread.
+        """
+        cursor = ListenerCursor(self.mwdb, object_type, query=query)
+        await self.api.run(cursor.start_from_checkpoint, checkpoint, last_object)
+        while True:
+            for obj in await self.api.run(cursor.poll):
+                yield cast(MWDBObjectVar, obj)
+                # Consumer requested the next object, so this one is processed
+                if checkpoint is not None:
+                    await self.api.run(checkpoint.ack, obj)
+            if checkpoint is not None:
+                await self.api.run(checkpoint.commit)
+            if not blocking:
+                break
+            await asyncio.sleep(interval)
+
+    def listen_for_objects(
+        self,
+        last_object: Optional[Union[MWDBObject, str]] = None,
+        blocking: bool = True,
+        interval: int = 15,
+        query: Optional[str] = None,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> AsyncIterator[MWDBObject]:
+        """
+        Listens for recent objects and yields newly added.
+
+        .. seealso:: :py:meth:`MWDB.listen_for_objects`
+        """
+        return self._listen(
+            last_object, MWDBObject, blocking, interval, query, checkpoint
+        )
+
+    def listen_for_files(
+        self,
+        last_object: Optional[Union[MWDBFile, str]] = None,
+        blocking: bool = True,
+        interval: int = 15,
+        query: Optional[str] = None,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> AsyncIterator[MWDBFile]:
+        """
+        Listens for recent files and yields newly added.
+        """
+        return self._listen(
+            last_object, MWDBFile, blocking, interval, query, checkpoint
+        )
+
+    def listen_for_configs(
+        self,
+        last_object: Optional[Union[MWDBConfig, str]] = None,
+        blocking: bool = True,
+        interval: int = 15,
+        query: Optional[str] = None,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> AsyncIterator[MWDBConfig]:
+        """
+        Listens for recent configs and yields newly added.
+        """
+        return self._listen(
+            last_object, MWDBConfig, blocking, interval, query, checkpoint
+        )
+
+    def listen_for_blobs(
+        self,
+        last_object: Optional[Union[MWDBBlob, str]] = None,
+        blocking: bool = True,
+        interval: int = 15,
+        query: Optional[str] = None,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> AsyncIterator[MWDBBlob]:
+        """
+        Listens for recent blobs and yields newly added.
+        """
+        return self._listen(
+            last_object, MWDBBlob, blocking, interval, query, checkpoint
+        )
+
+    async def query(
+        self, hash: str, raise_not_found: bool = True
+    ) -> Optional[MWDBObject]:
+        """
+        Queries for object using provided hash.
+
+        .. seealso:: :py:meth:`MWDB.query`
+        """
+        return await self.api.run(self.mwdb.query, hash, raise_not_found)
+
+    async def query_file(
+        self, hash: str, raise_not_found: bool = True
+    ) -> Optional[MWDBFile]:
+        """
+        Queries for file using provided hash
+        """
+        return await self.api.run(self.mwdb.query_file, hash, raise_not_found)
+
+    async def query_config(
+        self, hash: str, raise_not_found: bool = True
+    ) -> Optional[MWDBConfig]:
+        """
+        Queries for configuration object using provided hash
+        """
+        return await self.api.run(self.mwdb.query_config, hash, raise_not_found)
+
+    async def query_blob(
+        self, hash: str, raise_not_found: bool = True
+    ) -> Optional[MWDBBlob]:
+        """
+        Queries for blob object using provided hash
+        """
+        return await self.api.run(self.mwdb.query_blob, hash, raise_not_found)
+
+    async def count(self, query: Optional[str] = None) -> int:
+        """
+        Returns number of objects matching provided query in Lucene syntax.
+        """
+        return await self.api.run(self.mwdb.count, query)
+
+    async def count_files(self, query: Optional[str] = None) -> int:
+        return await self.api.run(self.mwdb.count_files, query)
+
+    async def count_configs(self, query: Optional[str] = None) -> int:
+        return await self.api.run(self.mwdb.count_configs, query)
+
+    async def count_blobs(self, query: Optional[str] = None) -> int:
+        return await self.api.run(self.mwdb.count_blobs, query)
+
+    async def upload_file(self, *args: Any, **kwargs: Any) -> MWDBFile:
+        """
+        Upload file object
+
+        .. seealso:: :py:meth:`MWDB.upload_file`
+        """
+        return await self.api.run(self.mwdb.upload_file, *args, **kwargs)
+
+    async def upload_config(self, *args: Any, **kwargs: Any) -> MWDBConfig:
+        """
+        Upload configuration object
+
+        .. seealso:: :py:meth:`MWDB.upload_config`
+        """
+        return await self.api.run(self.mwdb.upload_config, *args, **kwargs)
+
+    async def upload_blob(self, *args: Any, **kwargs: Any) -> MWDBBlob:
+        """
+        Upload blob object
+
+        .. seealso:: :py:meth:`MWDB.upload_blob`
+        """
+        return await self.api.run(self.mwdb.upload_blob, *args, **kwargs)
+
+    def upload_many(self, *args: Any, **kwargs: Any) -> AsyncIterator[UploadResult]:
+        """
+        Uploads many files concurrently
+
+        .. seealso:: :py:meth:`MWDB.upload_many`
+        """
+        return self._iterate(self.mwdb.upload_many(*args, **kwargs))
+
+    async def fetch(self, obj: MWDBObjectVar, *properties: str) -> MWDBObjectVar:
+        """
+        Loads lazy-loaded properties of object (e.g. ``"tags"``, ``"comments"``,
+        ``"attributes"``) concurrently, so they can be accessed afterwards
+        without blocking the event loop.
+
+        :param obj: Object to be loaded
+        :param properties: Names of properties to be loaded
+        :return: The same object
+        """
+        await asyncio.gather(*[self.api.run(getattr, obj, prop) for prop in properties])
+        return obj
+
+    async def download(self, file: MWDBFile) -> bytes:
+        """
+        Downloads file contents
+
+        .. seealso:: :py:meth:`MWDBFile.download`
+        """
+        return await self.api.run(file.download)
+
+    async def download_to(
+        self,
+        file: MWDBFile,
+        target: Union[str, "os.PathLike[str]", BinaryIO],
+        chunk_size: int = 1024 * 1024,
+    ) -> int:
+        """
+        Downloads file contents directly to the file path or file-like object
+
+        .. seealso:: :py:meth:`MWDBFile.download_to`
+        """
+        return await self.api.run(file.download_to, target, chunk_size)
+
+    async def add_tag(self, obj: MWDBObject, tag: str) -> None:
+        """
+        Tags object using specified tag
+        """
+        await self.api.run(obj.add_tag, tag)
+
+    async def remove_tag(self, obj: MWDBObject, tag: str) -> None:
+        """
+        Untags object using specified tag
+        """
+        await self.api.run(obj.remove_tag, tag)
+
+    async def add_comment(self, obj: MWDBObject, comment: str) -> None:
+        """
+        Adds comment to object
+        """
+        await self.api.run(obj.add_comment, comment)
+
+    async def add_attribute(self, obj: MWDBObject, key: str, value: Any) -> None:
+        """
+        Adds attribute to object
+        """
+        await self.api.run(obj.add_attribute, key, value)
+
+    async def add_child(self, obj: MWDBObject, child: Union[MWDBObject, str]) -> None:
+        """
+        Adds reference to child with given object as parent
+        """
+        await self.api.run(obj.add_child, child)
+
+    async def share_with(self, obj: MWDBObject, group: str) -> None:
+        """
+        Shares object with specified group
+        """
+        await self.api.run(obj.share_with, group)
+
+    async def reanalyze(
+        self, obj: MWDBObject, arguments: Optional[Dict[str, Any]] = None
+    ) -> MWDBKartonAnalysis:
+        """
+        Submits new Karton analysis for given object.
+        """
+        return await self.api.run(obj.reanalyze, arguments)
+
+    async def remove(self, obj: MWDBObject) -> None:
+        """
+        Removes object from MWDB
+        """
+        await self.api.run(obj.remove)
+
+    def close(self) -> None:
+        self.api.close()
+
+    async def __aenter__(self) -> "AsyncMWDB":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"AsyncMWDB(api_url={repr(self.options.api_url)}, "
+            f"username={repr(self.api.logged_user)})"
+        )
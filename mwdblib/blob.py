@@ -10,6 +10,12 @@ if TYPE_CHECKING:
 class MWDBBlob(MWDBObject):
     URL_TYPE: str = "blob"
     TYPE: str = "text_blob"
+    IMMUTABLE_FIELDS = MWDBObject.IMMUTABLE_FIELDS + (
+        "blob_name",
+        "blob_size",
+        "blob_type",
+        "content",
+    )
 
     @property
     def blob_name(self) -> str:
@@ -17,7 +23,7 @@ class MWDBBlob(MWDBObject):
         Blob name
         """
         if "blob_name" not in self.data:
-            self._load()
+            self._load_immutable("blob_name")
         return cast(str, self.data["blob_name"])
 
     @property
@@ -26,7 +32,7 @@ class MWDBBlob(MWDBObject):
         Blob size in bytes
         """
         if "blob_size" not in self.data:
-            self._load()
+            self._load_immutable("blob_size")
         return cast(int, self.data["blob_size"])
 
     @property
@@ -35,7 +41,7 @@ class MWDBBlob(MWDBObject):
         Blob semantic type
         """
         if "blob_type" not in self.data:
-            self._load()
+            self._load_immutable("blob_type")
         return cast(str, self.data["blob_type"])
 
     @property
@@ -68,7 +74,7 @@ class MWDBBlob(MWDBObject):
            Returned type is guaranteed to be utf8-encoded bytes
         """
         if "content" not in self.data:
-            self._load()
+            self._load_immutable("content")
         content = cast(str, self.data["content"])
         return content.encode("utf-8")
 
@@ -0,0 +1,257 @@
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Set, Union
+
+from .object import MWDBObject
+
+CheckpointState = Dict[str, Any]
+
+
+class HighWaterMark:
+    """
+    Position in object listing: upload time of the newest seen object
+    and identifiers of seen objects uploaded at that time.
+
+    Objects must be marked as seen in upload order.
+
+    .. versionadded:: 4.7.0
+    """
+
+    def __init__(
+        self, mark: Optional[datetime.datetime] = None, ids: Optional[Set[str]] = None
+    ) -> None:
+        #: Upload time of the newest seen object
+        self.mark = mark
+        #: Identifiers of seen objects uploaded at ``mark``
+        self.ids: Set[str] = set(ids or ())
+
+    def see(self, object_id: str, upload_time: datetime.datetime) -> None:
+        """
+        Marks object as seen
+        """
+        if self.mark is None or upload_time > self.mark:
+            self.mark = upload_time
+            self.ids = {object_id}
+        elif upload_time == self.mark:
+            self.ids.add(object_id)
+
+    def reached(self, object_id: str, upload_time: datetime.datetime) -> bool:
+        """
+        Checks whether object has been already seen or is older than mark
+        """
+        return object_id in self.ids or (
+            self.mark is not None and upload_time < self.mark
+        )
+
+    def copy(self) -> "HighWaterMark":
+        return HighWaterMark(self.mark, self.ids)
+
+    def to_dict(self) -> CheckpointState:
+        return {
+            "mark": self.mark.isoformat() if self.mark is not None else None,
+            "ids": sorted(self.ids),
+        }
+
+    @classmethod
+    def from_dict(cls, state: CheckpointState) -> "HighWaterMark":
+        mark = state.get("mark")
+        return cls(
+            datetime.datetime.fromisoformat(mark) if mark is not None else None,
+            set(state.get("ids", [])),
+        )
+
+
+class CheckpointStore:
+    """
+    Base class for durable storage of listener positions
+
+    .. versionadded:: 4.7.0
+    """
+
+    def load(self, name: str) -> Optional[CheckpointState]:
+        """
+        Returns saved state of checkpoint or None if it doesn't exist
+        """
+        raise NotImplementedError
+
+    def save(self, name: str, state: CheckpointState) -> None:
+        """
+        Durably saves state of checkpoint
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Keeps checkpoints in JSON file. File is replaced atomically on each save,
+    so it's never left partially written.
+
+    .. versionadded:: 4.7.0
+
+    :param path: Path to JSON file
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, CheckpointState]:
+        try:
+            with open(self.path) as f:
+                return dict(json.load(f))
+        except FileNotFoundError:
+            return {}
+
+    def load(self, name: str) -> Optional[CheckpointState]:
+        with self._lock:
+            return self._read().get(name)
+
+    def save(self, name: str, state: CheckpointState) -> None:
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[name] = state
+            temporary_path = f"{self.path}.tmp"
+            with open(temporary_path, "w") as f:
+                json.dump(checkpoints, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary_path, self.path)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Keeps checkpoints in SQLite database
+
+    .. versionadded:: 4.7.0
+
+    :param path: Path to database file
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints "
+                "(name TEXT PRIMARY KEY, state TEXT NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def load(self, name: str) -> Optional[CheckpointState]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT state FROM checkpoints WHERE name = ?", (name,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(json.loads(row[0]))
+
+    def save(self, name: str, state: CheckpointState) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO checkpoints (name, state, updated) "
+                "VALUES (?, ?, ?)",
+                (name, json.dumps(state), time.time()),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class Checkpoint:
+    """
+    Durable position of listener, that allows to resume listening after
+    restart without processing all objects again.
+
+    Position advances only for acknowledged objects and it's saved in
+    batches: every ``commit_every`` acknowledged objects, at least every
+    ``commit_interval`` seconds when objects are processed and when listener
+    waits for new objects. Objects processed after the last commit are
+    delivered again after restart (at-least-once delivery).
+
+    .. code-block:: python
+
+        from mwdblib import MWDB
+        from mwdblib.checkpoint import Checkpoint, SQLiteCheckpointStore
+
+        checkpoint = Checkpoint(SQLiteCheckpointStore("state.db"), "karton-feeder")
+        for file in mwdb.listen_for_files(checkpoint=checkpoint):
+            process(file)
+
+    .. versionadded:: 4.7.0
+
+    :param store: Checkpoint storage
+    :param name: Checkpoint name, unique for each consumer
+    :param commit_every: Number of acknowledged objects that triggers commit
+    :param commit_interval: Maximum time between commits while objects are
+        being acknowledged (in seconds)
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStore,
+        name: str,
+        commit_every: int = 100,
+        commit_interval: float = 10.0,
+    ) -> None:
+        self.store = store
+        self.name = name
+        self.commit_every = commit_every
+        self.commit_interval = commit_interval
+        #: Position of the last acknowledged object
+        self.position: Optional[HighWaterMark] = None
+        self.pending = 0
+        self._last_commit = time.monotonic()
+        self._lock = threading.RLock()
+
+    def load(self) -> Optional[HighWaterMark]:
+        """
+        Loads saved position. Returns None if checkpoint doesn't exist yet.
+        """
+        state = self.store.load(self.name)
+        with self._lock:
+            self.position = HighWaterMark.from_dict(state) if state else None
+            return self.position.copy() if self.position else None
+
+    def reset(self, position: HighWaterMark) -> None:
+        """
+        Sets and commits initial position
+        """
+        with self._lock:
+            self.position = position.copy()
+            self.pending = 1
+            self.commit()
+
+    def ack(self, obj: MWDBObject) -> None:
+        """
+        Acknowledges processed object. Objects must be acknowledged
+        in upload order.
+        """
+        with self._lock:
+            if self.position is None:
+                self.position = HighWaterMark()
+            self.position.see(obj.id, obj.upload_time)
+            self.pending += 1
+            if (
+                self.pending >= self.commit_every
+                or time.monotonic() - self._last_commit >= self.commit_interval
+            ):
+                self.commit()
+
+    def commit(self) -> None:
+        """
+        Saves position if there are uncommitted acknowledgements
+        """
+        with self._lock:
+            if not self.pending or self.position is None:
+                return
+            self.store.save(self.name, self.position.to_dict())
+            self.pending = 0
+            self._last_commit = time.monotonic()
@@ -35,12 +35,17 @@ def fetch_command(mwdb, hash, destination, keep_name):
                 )
         if not output_path:
             output_path = hash
-        with open(output_path, "wb") as f:
-            f.write(object.content)
     else:
         output_path = destination
-        with click.open_file(destination, "wb") as f:
-            f.write(object.content)
+    if isinstance(object, MWDBFile) and output_path != "-":
+        # Incomplete file is removed if contents don't match SHA256
+        object.download_to(output_path)
+    else:
+        with click.open_file(output_path, "wb") as f:
+            if isinstance(object, MWDBFile):
+                object.download_to(f)
+            else:
+                f.write(object.content)
     return dict(
         message="Downloaded {object_id} => {output_path}",
         object_id=object.id,
@@ -6,6 +6,7 @@ from click.globals import get_current_context
 from .. import __version__
 from ..core import MWDB
 from ..exc import MWDBError, NotAuthenticatedError
+from .profile import Profiler
 
 
 def pass_mwdb(*fn, autologin=True):
@@ -30,6 +31,11 @@ def pass_mwdb(*fn, autologin=True):
             if config_path:
                 mwdb_options["config_path"] = config_path
             mwdb = MWDB(autologin=autologin, **mwdb_options)
+            profiler = None
+            main_options = ctx.find_root().params
+            if main_options.get("profile") or main_options.get("trace_file"):
+                profiler = Profiler()
+                mwdb.api.add_hooks(profiler)
             try:
                 return fn(mwdb=mwdb, *args, **kwargs)
             except NotAuthenticatedError:
@@ -44,6 +50,12 @@ def pass_mwdb(*fn, autologin=True):
                     "{}: {}".format(error.__class__.__name__, error.args[0]), err=True
                 )
                 ctx.abort()
+            finally:
+                if profiler is not None:
+                    if main_options.get("profile"):
+                        profiler.print_summary()
+                    if main_options.get("trace_file"):
+                        profiler.write_trace(main_options["trace_file"])
 
         return wrapper
 
@@ -54,7 +66,19 @@ def pass_mwdb(*fn, autologin=True):
 
 
 @click.group()
-def main():
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Print summary of API requests made by command",
+)
+@click.option(
+    "--trace-file",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Write trace of API requests to JSON file (Chrome trace event format)",
+)
+def main(profile, trace_file):
     """MWDB Core API client"""
     pass
 
@@ -0,0 +1,127 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+import click
+
+from ..api import MetricsCollector
+from ..object import MWDBElement
+
+
+def find_lazy_property():
+    """
+    Finds MWDB object property or method that triggered the request
+    by walking up the call stack
+    """
+    frame = sys._getframe(2)
+    while frame is not None:
+        obj = frame.f_locals.get("self")
+        name = frame.f_code.co_name
+        if isinstance(obj, MWDBElement) and not name.startswith("_"):
+            return f"{obj.__class__.__name__}.{name}"
+        frame = frame.f_back
+    return None
+
+
+class Profiler(MetricsCollector):
+    """
+    Collects API requests made by CLI command for ``--profile``
+    and ``--trace-file`` options
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.start_time = time.monotonic()
+        self.triggers = Counter()
+        self.trace_events = []
+        self._triggers = {}
+
+    def on_request_start(self, request):
+        trigger = find_lazy_property()
+        with self._lock:
+            self._triggers[id(request)] = trigger
+            if trigger is not None and request.attempt == 1:
+                self.triggers[trigger] += 1
+
+    def on_request_end(self, request, response, error):
+        super().on_request_end(request, response, error)
+        with self._lock:
+            trigger = self._triggers.pop(id(request), None)
+            self.trace_events.append(
+                {
+                    "name": f"{request.method} {request.endpoint}",
+                    "cat": "request",
+                    "ph": "X",
+                    "ts": (request.start_time - self.start_time) * 1e6,
+                    "dur": request.elapsed * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": {
+                        "url": request.url,
+                        "attempt": request.attempt,
+                        "status": (
+                            response.status_code if response is not None else None
+                        ),
+                        "error": repr(error) if error is not None else None,
+                        "triggered_by": trigger,
+                    },
+                }
+            )
+
+    def print_summary(self):
+        wall_time = time.monotonic() - self.start_time
+        metrics = self.to_dict()
+        endpoints = sorted(
+            metrics["endpoints"], key=lambda e: e["latency_sum"], reverse=True
+        )
+        total_count = sum(e["count"] for e in endpoints)
+        total_time = sum(e["latency_sum"] for e in endpoints)
+        echo = functools.partial(click.echo, err=True)
+        echo(
+            f"Profile: {total_count} requests, {total_time:.3f}s in requests, "
+            f"{wall_time:.3f}s wall time"
+        )
+        if endpoints:
+            echo(f"{'count':>7} {'total':>9} {'avg':>9}  endpoint")
+            for e in endpoints:
+                echo(
+                    f"{e['count']:>7} {e['latency_sum']:>8.3f}s "
+                    f"{e['latency_avg']:>8.3f}s  {e['method']} {e['endpoint']}"
+                )
+        if self.triggers:
+            echo("Requests triggered by object properties:")
+            for trigger, count in self.triggers.most_common():
+                echo(f"{count:>7}  {trigger}")
+        if metrics["cache_hits"]:
+            echo(
+                "Cache hits: "
+                + ", ".join(
+                    f"{cache}={hits}" for cache, hits in metrics["cache_hits"].items()
+                )
+            )
+
+    def write_trace(self, path):
+        """
+        Writes trace in Chrome trace event format, that can be loaded
+        in chrome://tracing or Perfetto UI
+        """
+        command_event = {
+            "name": " ".join(["mwdb"] + sys.argv[1:]),
+            "cat": "command",
+            "ph": "X",
+            "ts": 0,
+            "dur": (time.monotonic() - self.start_time) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.main_thread().ident,
+        }
+        with self._lock:
+            trace = {
+                "traceEvents": [command_event] + self.trace_events,
+                "displayTimeUnit": "ms",
+            }
+        with click.open_file(path, "w") as f:
+            json.dump(trace, f)
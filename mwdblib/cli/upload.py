@@ -74,18 +74,17 @@ def upload_params(fn):
 @pass_mwdb
 def upload_file(mwdb, file, name, parent, private, public, share_with, tag):
     """Upload file object"""
-    with click.open_file(file, "rb") as f:
-        content = f.read()
     name = name or os.path.basename(file)
-    obj = mwdb.upload_file(
-        name=name,
-        content=content,
-        parent=parent,
-        private=private,
-        public=public,
-        share_with=share_with,
-        tags=tag,
-    )
+    with click.open_file(file, "rb") as f:
+        obj = mwdb.upload_file(
+            name=name,
+            content=f,
+            parent=parent,
+            private=private,
+            public=public,
+            share_with=share_with,
+            tags=tag,
+        )
     return dict(message="Uploaded file {object_id}", object_id=obj.id)
 
 
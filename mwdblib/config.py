@@ -7,6 +7,7 @@ from .object import MWDBObject
 class MWDBConfig(MWDBObject):
     URL_TYPE = "config"
     TYPE = "static_config"
+    IMMUTABLE_FIELDS = MWDBObject.IMMUTABLE_FIELDS + ("family", "config_type", "cfg")
 
     @property
     def family(self) -> str:
@@ -14,7 +15,7 @@ class MWDBConfig(MWDBObject):
         Configuration family
         """
         if "family" not in self.data:
-            self._load()
+            self._load_immutable("family")
         return cast(str, self.data["family"])
 
     @property
@@ -23,7 +24,7 @@ class MWDBConfig(MWDBObject):
         Configuration type ('static' or 'dynamic')
         """
         if "config_type" not in self.data:
-            self._load()
+            self._load_immutable("config_type")
         return cast(str, self.data["config_type"])
 
     @property
@@ -33,7 +34,7 @@ class MWDBConfig(MWDBObject):
         (in-blob keys are not mapped to :class:`MWDBBlob` objects)
         """
         if "cfg" not in self.data:
-            self._load()
+            self._load_immutable("cfg")
         return cast(Dict[str, Any], self.data["cfg"])
 
     def _map_blobs(self, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,14 +1,24 @@
+import contextlib
+import datetime
 import getpass
+import io
 import json
-import time
+import os
+import shutil
+import tempfile
 from typing import (
     TYPE_CHECKING,
     Any,
     BinaryIO,
+    Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
+    NamedTuple,
     Optional,
+    Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -16,16 +26,51 @@ from typing import (
 )
 
 from .api import APIClient
+from .api.config_index import ConfigIndex
+from .api.multipart import MultipartEncoder, ProgressCallback
+from .api.object_cache import ObjectCache
 from .blob import MWDBBlob
+from .checkpoint import Checkpoint
 from .config import MWDBConfig
 from .exc import ObjectNotFoundError, ValidationError
+from .export import ExportPath, default_columns, export_table
 from .file import MWDBFile
-from .object import MWDBObject
+from .listener import Listener, ListenerCursor, StreamResult, process_stream
+from .object import MWDBElementData, MWDBObject, preload_fields
+from .record import RECORD_TYPES, MWDBObjectRecord
+from .util import (
+    calc_sha256,
+    config_dhash,
+    iter_concurrently,
+    iter_merged,
+    iter_prefetched,
+)
 
 if TYPE_CHECKING:
     from .api.options import APIClientOptions
 
 MWDBObjectVar = TypeVar("MWDBObjectVar", bound=MWDBObject)
+UploadItem = Union[str, "os.PathLike[str]", Tuple[str, Union[bytes, BinaryIO]]]
+# Non-seekable upload streams are spooled in memory up to this size
+# and in temporary file above it
+UPLOAD_SPOOL_SIZE = 8 * 1024 * 1024
+
+
+class UploadResult(NamedTuple):
+    """
+    Result of single item upload yielded by :py:meth:`MWDB.upload_many`
+
+    .. versionadded:: 4.7.0
+    """
+
+    #: Item passed to :py:meth:`MWDB.upload_many`
+    item: UploadItem
+    #: Uploaded or already existing file, None if upload failed
+    object: Optional[MWDBFile]
+    #: True if file already existed and upload was skipped
+    skipped: bool
+    #: Exception raised during upload, None if succeeded
+    error: Optional[BaseException]
 
 
 class MWDB:
@@ -59,6 +104,64 @@ class MWDB:
         Default is ``True``.
     :param emit_warnings: If ``True``, warnings are emitted by APIClient.
         Default is ``True``.
+    :param pool_connections: Number of connection pools to cache (default: 10)
+    :param pool_maxsize: Maximum number of connections kept in the pool.
+        Set it to the number of threads using the client concurrently.
+        Default is 10.
+    :param pool_block: If ``True``, requests wait for a free connection when
+        the pool is full instead of opening a new one that is discarded afterwards.
+        Default is ``False``.
+    :param connect_timeout: Timeout for establishing connection (in seconds).
+        Default is no timeout.
+    :param read_timeout: Timeout for receiving data from server socket
+        (in seconds). Default is no timeout.
+    :param tcp_keepalive: If ``True``, TCP keep-alive probes are enabled for
+        pooled connections. Default is ``False``.
+    :param object_cache_size: Maximum number of objects kept in the identity map
+        (see :attr:`object_cache`). Default is 0 (identity map disabled).
+    :param object_cache_ttl: Time after which object kept in the identity map
+        is considered stale (in seconds). Default is no expiration.
+    :param cache_dir: Path to the directory used as persistent cache of immutable
+        data: file contents, hashes, configuration and blob bodies (see
+        :class:`mwdblib.api.DiskCache`). Default is no cache.
+    :param cache_max_size: Maximum size of persistent cache in bytes.
+        Default is 1 GiB.
+    :param conditional_cache_size: Number of GET responses kept with their
+        ``ETag``/``Last-Modified`` validators, so refreshing them is done by
+        conditional requests (see :class:`mwdblib.api.ConditionalCache`).
+        Useful only if server or reverse proxy provides validators.
+        Default is 0 (disabled).
+    :param config_index_size: Maximum number of uploaded configurations kept
+        in the index used by :py:meth:`upload_config` to skip sending
+        configurations that were already uploaded
+        (see :class:`mwdblib.api.ConfigIndex`). Default is 0 (disabled).
+    :param config_index_path: Path to SQLite database used as persistent
+        index of uploaded configurations
+        (see :class:`mwdblib.api.SQLiteConfigIndex`). If ``config_index_size``
+        is set too, it limits the number of entries in database.
+        Default is no persistent index.
+    :param rate_limit: Maximum number of requests per second sent by the client
+        (see :class:`mwdblib.api.throttling.TokenBucket`). Limit is shared by
+        all threads using the same client. Default is no limit.
+    :param rate_limit_burst: Number of requests that can be sent at once without
+        waiting when ``rate_limit`` is set. Default is ``rate_limit``.
+    :param max_concurrency: If set, number of requests in flight is adapted
+        to the server load up to this value: decreased on HTTP 429/502/504
+        and slowly increased afterwards
+        (see :class:`mwdblib.api.throttling.ConcurrencyLimiter`).
+        Default is no limit.
+    :param retry_backoff: If ``True``, delay between retries caused by downtime
+        grows exponentially starting from ``downtime_timeout`` and is randomized
+        (full jitter), so many clients don't retry at the same moment.
+        Default is ``False`` (fixed ``downtime_timeout`` delay).
+    :param retry_backoff_max: Maximum delay between retries when ``retry_backoff``
+        is enabled (in seconds). Default is 300.
+    :param request_deadline: Total time limit for single API call including
+        all retries (in seconds). Retry that wouldn't fit in the limit is not
+        attempted and the last error is raised. Default is no limit.
+    :param retry_budget_ratio: Maximum ratio of retries to requests, shared by all
+        threads using the client (see :class:`mwdblib.api.throttling.RetryBudget`).
+        Default is no limit.
     :param config_path: Path to the configuration file (default is `~/.mwdb`).
         If None, configuration file will not be used by APIClient
     :param api: Custom :class:`APIClient` to be used for communication with MWDB
@@ -83,6 +186,29 @@ class MWDB:
     .. versionadded:: 4.4.0
        Added ``autologin`` option.
 
+    .. versionadded:: 4.7.0
+       Added ``pool_connections``, ``pool_maxsize``, ``pool_block``,
+       ``connect_timeout``, ``read_timeout`` and ``tcp_keepalive`` options.
+
+    .. versionadded:: 4.7.0
+       Added ``object_cache_size`` and ``object_cache_ttl`` options.
+
+    .. versionadded:: 4.7.0
+       Added ``cache_dir`` and ``cache_max_size`` options.
+
+    .. versionadded:: 4.7.0
+       Added ``conditional_cache_size`` option.
+
+    .. versionadded:: 4.7.0
+       Added ``config_index_size`` and ``config_index_path`` options.
+
+    .. versionadded:: 4.7.0
+       Added ``rate_limit``, ``rate_limit_burst`` and ``max_concurrency`` options.
+
+    .. versionadded:: 4.7.0
+       Added ``retry_backoff``, ``retry_backoff_max``, ``request_deadline``
+       and ``retry_budget_ratio`` options.
+
     Usage example:
 
     .. code-block:: python
@@ -108,6 +234,19 @@ class MWDB:
         """
         return self.api.options
 
+    @property
+    def object_cache(self) -> Optional[ObjectCache]:
+        """
+        Identity map of objects returned by this client or None if disabled.
+
+        When enabled via ``object_cache_size`` option, the same object is
+        represented by the same instance, so lazy-loaded properties are fetched
+        only once. Use :py:meth:`ObjectCache.stats` to get hit/miss statistics.
+
+        .. versionadded:: 4.7.0
+        """
+        return self.api.object_cache
+
     def login(
         self, username: Optional[str] = None, password: Optional[str] = None
     ) -> None:
@@ -154,35 +293,83 @@ class MWDB:
         """
         self.api.logout()
 
-    def _recent(
+    def _listing_pages(
         self,
-        object_type: Type[MWDBObjectVar],
+        url_type: str,
         query: Optional[str] = None,
         chunk_size: Optional[int] = None,
-    ) -> Iterator[MWDBObjectVar]:
+    ) -> Iterator[List[MWDBElementData]]:
         """
-        Generic implementation of recent_* methods
+        Yields consecutive pages of raw listing entries
         """
         try:
-            last_object: Optional[MWDBObject] = None
+            last_id: Optional[str] = None
             while True:
-                params = {"older_than": last_object.id} if last_object else {}
+                params = {"older_than": last_id} if last_id else {}
                 if query is not None:
                     params["query"] = query
                 if chunk_size is not None:
                     params["count"] = str(chunk_size)
                 # 'object', 'file', 'config' or 'blob'?
-                result = self.api.get(object_type.URL_TYPE, params=params)
-                key = object_type.URL_TYPE + "s"
+                result = self.api.get(url_type, params=params)
+                key = url_type + "s"
                 if key not in result or len(result[key]) == 0:
                     return
-                for obj in result[key]:
-                    last_object = object_type.create(self.api, obj)
-                    yield cast(MWDBObjectVar, last_object)
+                last_id = result[key][-1]["id"]
+                yield result[key]
         except ObjectNotFoundError:
             return
 
-    def recent_objects(self, chunk_size: Optional[int] = None) -> Iterator[MWDBObject]:
+    def _recent_pages(
+        self,
+        object_type: Type[MWDBObjectVar],
+        query: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        include: Sequence[str] = (),
+    ) -> Iterator[List[MWDBObjectVar]]:
+        """
+        Yields consecutive pages of recent_* results
+        with ``include`` properties already loaded
+        """
+        for entries in self._listing_pages(
+            object_type.URL_TYPE, query=query, chunk_size=chunk_size
+        ):
+            page = [
+                cast(MWDBObjectVar, object_type.create(self.api, obj))
+                for obj in entries
+            ]
+            if include:
+                preload_fields(page, include)
+            yield page
+
+    def _recent(
+        self,
+        object_type: Type[MWDBObjectVar],
+        query: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 0,
+        include: Sequence[str] = (),
+    ) -> Iterator[MWDBObjectVar]:
+        """
+        Generic implementation of recent_* methods
+
+        If ``prefetch`` is set, up to ``prefetch`` next pages are fetched
+        on a background thread while current page is being consumed.
+        """
+        pages = self._recent_pages(
+            object_type, query=query, chunk_size=chunk_size, include=include
+        )
+        if prefetch:
+            pages = iter_prefetched(pages, prefetch)
+        for page in pages:
+            yield from page
+
+    def recent_objects(
+        self,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 0,
+        include: Sequence[str] = (),
+    ) -> Iterator[MWDBObject]:
         """
         Retrieves recently uploaded objects
         If you already know type of object you are looking for,
@@ -206,45 +393,150 @@ class MWDB:
             files = islice(mwdb.recent_files(), 25)
             print([(f.name, f.tags) for f in files])
 
+        .. versionadded:: 4.7.0
+            Added ``prefetch`` and ``include`` parameters
+
         :param chunk_size: Number of objects returned per API request
         :type chunk_size: int
+        :param prefetch: Number of pages fetched ahead on a background thread
+            while current page is being consumed (default: 0, disabled)
+        :type prefetch: int, optional
+        :param include: Lazy-loaded properties (e.g. ``("tags", "attributes")``)
+            loaded concurrently for each page before objects are yielded
+        :type include: Sequence[str], optional
         :rtype: Iterator[:class:`MWDBObject`]
         :raises: requests.exceptions.HTTPError
         """
-        return self._recent(MWDBObject, chunk_size=chunk_size)
+        return self._recent(
+            MWDBObject, chunk_size=chunk_size, prefetch=prefetch, include=include
+        )
 
-    def recent_files(self, chunk_size: Optional[int] = None) -> Iterator[MWDBFile]:
+    def recent_files(
+        self,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 0,
+        include: Sequence[str] = (),
+    ) -> Iterator[MWDBFile]:
         """
         Retrieves recently uploaded files
 
         :param chunk_size: Number of files returned per API request
         :type chunk_size: int
+        :param prefetch: Number of pages fetched ahead on a background thread
+            while current page is being consumed (default: 0, disabled)
+        :type prefetch: int, optional
+        :param include: Lazy-loaded properties (e.g. ``("tags", "attributes")``)
+            loaded concurrently for each page before objects are yielded
+        :type include: Sequence[str], optional
         :rtype: Iterator[:class:`MWDBFile`]
         :raises: requests.exceptions.HTTPError
         """
-        return self._recent(MWDBFile, chunk_size=chunk_size)
+        return self._recent(
+            MWDBFile, chunk_size=chunk_size, prefetch=prefetch, include=include
+        )
 
-    def recent_configs(self, chunk_size: Optional[int] = None) -> Iterator[MWDBConfig]:
+    def recent_configs(
+        self,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 0,
+        include: Sequence[str] = (),
+    ) -> Iterator[MWDBConfig]:
         """
         Retrieves recently uploaded configuration objects
 
         :param chunk_size: Number of configs returned per API request
         :type chunk_size: int
+        :param prefetch: Number of pages fetched ahead on a background thread
+            while current page is being consumed (default: 0, disabled)
+        :type prefetch: int, optional
+        :param include: Lazy-loaded properties (e.g. ``("tags", "attributes")``)
+            loaded concurrently for each page before objects are yielded
+        :type include: Sequence[str], optional
         :rtype: Iterator[:class:`MWDBConfig`]
         :raises: requests.exceptions.HTTPError
         """
-        return self._recent(MWDBConfig, chunk_size=chunk_size)
+        return self._recent(
+            MWDBConfig, chunk_size=chunk_size, prefetch=prefetch, include=include
+        )
 
-    def recent_blobs(self, chunk_size: Optional[int] = None) -> Iterator[MWDBBlob]:
+    def recent_blobs(
+        self,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 0,
+        include: Sequence[str] = (),
+    ) -> Iterator[MWDBBlob]:
         """
         Retrieves recently uploaded blob objects
 
         :param chunk_size: Number of blobs returned per API request
         :type chunk_size: int
+        :param prefetch: Number of pages fetched ahead on a background thread
+            while current page is being consumed (default: 0, disabled)
+        :type prefetch: int, optional
+        :param include: Lazy-loaded properties (e.g. ``("tags", "attributes")``)
+            loaded concurrently for each page before objects are yielded
+        :type include: Sequence[str], optional
         :rtype: Iterator[:class:`MWDBBlob`]
         :raises: requests.exceptions.HTTPError
         """
-        return self._recent(MWDBBlob, chunk_size=chunk_size)
+        return self._recent(
+            MWDBBlob, chunk_size=chunk_size, prefetch=prefetch, include=include
+        )
+
+    def iter_records(
+        self,
+        object_type: str = "object",
+        query: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Iterator[MWDBObjectRecord]:
+        """
+        Retrieves recently uploaded objects or search results as compact,
+        read-only records containing only listing fields.
+
+        Records use much less memory than :class:`MWDBObject` instances,
+        which is useful when many results need to be kept e.g. for
+        deduplication. Use :py:meth:`MWDBObjectRecord.to_object` to get full
+        object for chosen record.
+
+        .. code-block:: python
+
+            # Set of hashes of all PE files uploaded in the last year
+            hashes = {
+                record.sha256
+                for record in mwdb.iter_records(
+                    "file", "file.type:PE32* AND upload_time:>=now-1y"
+                )
+            }
+
+        .. versionadded:: 4.7.0
+
+        :param object_type: Type of listed objects: 'object', 'file', 'config'
+            or 'blob'
+        :type object_type: str
+        :param query: Search query (optional, all objects are listed if not set)
+        :type query: str, optional
+        :param chunk_size: Number of objects returned per API request
+        :type chunk_size: int
+        :param prefetch: Number of pages fetched ahead on a background thread
+            while current page is being consumed (default: 0, disabled)
+        :type prefetch: int, optional
+        :rtype: Iterator[:class:`MWDBObjectRecord`]
+        :raises: requests.exceptions.HTTPError
+        """
+        if object_type not in RECORD_TYPES:
+            raise ValueError(f"Unknown object type: {object_type}")
+        record_type = RECORD_TYPES[object_type]
+        pages: Iterator[List[MWDBObjectRecord]] = (
+            [record_type(self.api, entry) for entry in entries]
+            for entries in self._listing_pages(
+                object_type, query=query, chunk_size=chunk_size
+            )
+        )
+        if prefetch:
+            pages = iter_prefetched(pages, prefetch)
+        for page in pages:
+            yield from page
 
     def _listen(
         self,
@@ -253,56 +545,13 @@ class MWDB:
         blocking: bool,
         interval: int,
         query: Optional[str],
+        checkpoint: Optional[Checkpoint] = None,
     ) -> Iterator[MWDBObjectVar]:
         """
         Generic implementation of listen_* methods
         """
-        last: Optional[MWDBObjectVar]
-        if last_object is None:
-            last = next(self._recent(object_type, query=query), None)
-            # If there are no elements (even first element):
-            # just get new samples from now on
-        elif isinstance(last_object, MWDBObject):
-            # If we are requesting for typed objects,
-            # we should additionally check the object type
-            if object_type is not MWDBObject and not isinstance(
-                last_object, object_type
-            ):
-                raise TypeError(
-                    "latest_object type must be 'str' or '{}'".format(
-                        object_type.__name__
-                    )
-                )
-            # If object instance provided: get ID from instance
-            last = cast(MWDBObjectVar, last_object)
-        elif isinstance(last_object, str):
-            # If not: first check whether object exists in repository
-            last = self._query(object_type, last_object, raise_not_found=True)
-        else:
-            raise TypeError("'last_object' must be MWDBObject instance, str or None")
-
-        while True:
-            objects: List[MWDBObjectVar] = []
-            for recent_object in self._recent(object_type, query=query):
-                if last:
-                    if recent_object.id == last.id:
-                        break
-
-                    if recent_object.upload_time < last.upload_time:
-                        raise RuntimeError(
-                            f"Newly fetched object [{recent_object.id}] is older than "
-                            f"the pivot [{last.id}]"
-                        )
-                objects.append(recent_object)
-
-            # Return fetched objects in reversed order (from oldest to latest)
-            for obj in objects[::-1]:
-                last = obj
-                yield obj
-            if blocking:
-                time.sleep(interval)
-            else:
-                break
+        cursor = ListenerCursor(self, object_type, query=query)
+        return Listener(cursor, blocking, interval, checkpoint, last_object)
 
     def listen_for_objects(
         self,
@@ -310,6 +559,7 @@ class MWDB:
         blocking: bool = True,
         interval: int = 15,
         query: Optional[str] = None,
+        checkpoint: Optional[Checkpoint] = None,
     ) -> Iterator[MWDBObject]:
         """
         Listens for recent objects and yields newly added.
@@ -355,6 +605,17 @@ class MWDB:
             over the whole database by throwing an exception if they detect that
             there is something wrong with the pivot object
 
+        .. versionadded:: 4.7.0
+            Added ``checkpoint`` parameter
+
+        .. versionchanged:: 4.7.0
+            Position is tracked by :class:`mwdblib.listener.ListenerCursor`
+            using upload time of the newest seen object, so each poll usually
+            costs a single request and removal of pivot object doesn't break
+            the listener. Pivot that is newer than listed objects is not
+            treated as an error anymore. Use :class:`ListenerEngine` to listen
+            for many queries using shared pool of poller threads.
+
         :param last_object: MWDBObject instance or object hash
         :type last_object: MWDBObject or str
         :param blocking: Enable blocking mode (default)
@@ -364,6 +625,11 @@ class MWDB:
         :type interval: int, optional
         :param query: Lucene query to be used for listening for only specific objects
         :type query: str, optional
+        :param checkpoint: Durable position of listener. If checkpoint was saved
+            before, ``last_object`` is ignored and listening is resumed after
+            the last committed object. Object is acknowledged when the next one
+            is requested.
+        :type checkpoint: :class:`mwdblib.checkpoint.Checkpoint`, optional
         :rtype: Iterator[:class:`MWDBObject`]
         """
         return self._listen(
@@ -372,6 +638,7 @@ class MWDB:
             blocking=blocking,
             interval=interval,
             query=query,
+            checkpoint=checkpoint,
         )
 
     def listen_for_files(
@@ -380,6 +647,7 @@ class MWDB:
         blocking: bool = True,
         interval: int = 15,
         query: Optional[str] = None,
+        checkpoint: Optional[Checkpoint] = None,
     ) -> Iterator[MWDBFile]:
         """
         Listens for recent files and yields newly added.
@@ -398,6 +666,17 @@ class MWDB:
             over the whole database by throwing an exception if they detect that
             there is something wrong with the pivot object
 
+        .. versionadded:: 4.7.0
+            Added ``checkpoint`` parameter
+
+        .. versionchanged:: 4.7.0
+            Position is tracked by :class:`mwdblib.listener.ListenerCursor`
+            using upload time of the newest seen object, so each poll usually
+            costs a single request and removal of pivot object doesn't break
+            the listener. Pivot that is newer than listed objects is not
+            treated as an error anymore. Use :class:`ListenerEngine` to listen
+            for many queries using shared pool of poller threads.
+
         :param last_object: MWDBFile instance or object hash
         :type last_object: MWDBFile or str
         :param blocking: Enable blocking mode (default)
@@ -407,6 +686,11 @@ class MWDB:
         :type interval: int, optional
         :param query: Lucene query to be used for listening for only specific files
         :type query: str, optional
+        :param checkpoint: Durable position of listener. If checkpoint was saved
+            before, ``last_object`` is ignored and listening is resumed after
+            the last committed object. Object is acknowledged when the next one
+            is requested.
+        :type checkpoint: :class:`mwdblib.checkpoint.Checkpoint`, optional
         :rtype: Iterator[:class:`MWDBFile`]
         """
         return self._listen(
@@ -415,6 +699,7 @@ class MWDB:
             blocking=blocking,
             interval=interval,
             query=query,
+            checkpoint=checkpoint,
         )
 
     def listen_for_configs(
@@ -423,6 +708,7 @@ class MWDB:
         blocking: bool = True,
         interval: int = 15,
         query: Optional[str] = None,
+        checkpoint: Optional[Checkpoint] = None,
     ) -> Iterator[MWDBConfig]:
         """
         Listens for recent configs and yields newly added.
@@ -441,6 +727,17 @@ class MWDB:
             over the whole database by throwing an exception if they detect that
             there is something wrong with the pivot object
 
+        .. versionadded:: 4.7.0
+            Added ``checkpoint`` parameter
+
+        .. versionchanged:: 4.7.0
+            Position is tracked by :class:`mwdblib.listener.ListenerCursor`
+            using upload time of the newest seen object, so each poll usually
+            costs a single request and removal of pivot object doesn't break
+            the listener. Pivot that is newer than listed objects is not
+            treated as an error anymore. Use :class:`ListenerEngine` to listen
+            for many queries using shared pool of poller threads.
+
         :param last_object: MWDBConfig instance or object hash
         :type last_object: MWDBConfig or str
         :param blocking: Enable blocking mode (default)
@@ -450,6 +747,11 @@ class MWDB:
         :type interval: int, optional
         :param query: Lucene query to be used for listening for only specific configs
         :type query: str, optional
+        :param checkpoint: Durable position of listener. If checkpoint was saved
+            before, ``last_object`` is ignored and listening is resumed after
+            the last committed object. Object is acknowledged when the next one
+            is requested.
+        :type checkpoint: :class:`mwdblib.checkpoint.Checkpoint`, optional
         :rtype: Iterator[:class:`MWDBConfig`]
         """
         return self._listen(
@@ -458,6 +760,7 @@ class MWDB:
             blocking=blocking,
             interval=interval,
             query=query,
+            checkpoint=checkpoint,
         )
 
     def listen_for_blobs(
@@ -466,6 +769,7 @@ class MWDB:
         blocking: bool = True,
         interval: int = 15,
         query: Optional[str] = None,
+        checkpoint: Optional[Checkpoint] = None,
     ) -> Iterator[MWDBBlob]:
         """
         Listens for recent blobs and yields newly added.
@@ -484,6 +788,17 @@ class MWDB:
             over the whole database by throwing an exception if they detect that
             there is something wrong with the pivot object
 
+        .. versionadded:: 4.7.0
+            Added ``checkpoint`` parameter
+
+        .. versionchanged:: 4.7.0
+            Position is tracked by :class:`mwdblib.listener.ListenerCursor`
+            using upload time of the newest seen object, so each poll usually
+            costs a single request and removal of pivot object doesn't break
+            the listener. Pivot that is newer than listed objects is not
+            treated as an error anymore. Use :class:`ListenerEngine` to listen
+            for many queries using shared pool of poller threads.
+
         :param last_object: MWDBBlob instance or object hash
         :type last_object: MWDBBlob or str
         :param blocking: Enable blocking mode (default)
@@ -493,6 +808,11 @@ class MWDB:
         :type interval: int, optional
         :param query: Lucene query to be used for listening for only specific blobs
         :type query: str, optional
+        :param checkpoint: Durable position of listener. If checkpoint was saved
+            before, ``last_object`` is ignored and listening is resumed after
+            the last committed object. Object is acknowledged when the next one
+            is requested.
+        :type checkpoint: :class:`mwdblib.checkpoint.Checkpoint`, optional
         :rtype: Iterator[:class:`MWDBBlob`]
         """
         return self._listen(
@@ -501,10 +821,84 @@ class MWDB:
             blocking=blocking,
             interval=interval,
             query=query,
+            checkpoint=checkpoint,
+        )
+
+    def process_stream(
+        self,
+        listener: Iterable[MWDBObjectVar],
+        handler: Callable[[MWDBObjectVar], Any],
+        workers: int = 4,
+        max_inflight: Optional[int] = None,
+        ack_failed: bool = False,
+    ) -> Iterator[StreamResult]:
+        """
+        Processes objects delivered by listener using a pool of workers.
+
+        Listener is advanced on a background thread and each object is passed
+        to ``handler`` in the pool. At most ``max_inflight`` objects are taken
+        from listener before they're processed, so slow handler doesn't make
+        memory usage grow. Results are yielded in the same order as objects
+        were delivered, as soon as all previous objects are processed.
+
+        Exception raised by handler doesn't stop the stream: it's reported in
+        :py:attr:`mwdblib.listener.StreamResult.error` of the corresponding result.
+
+        If listener has a checkpoint (see :py:meth:`listen_for_objects`),
+        objects are acknowledged in order, only after they're processed.
+        Checkpoint never advances past an object that is still processed, so
+        after restart all unfinished objects are delivered again.
+
+        .. warning::
+            By default, checkpoint stops at the first object for which handler
+            failed: following results are still yielded, but they're not
+            acknowledged, so all of them are delivered again after restart.
+            Set ``ack_failed=True`` to acknowledge failed objects as well.
+            Then they're never retried, so handle ``result.error`` yourself.
+
+        When iteration over results is stopped (e.g. generator is closed),
+        listener returned by listen_for_* methods or subscription is closed
+        as well and background thread is stopped.
+
+        Usage example:
+
+        .. code-block:: python
+
+            checkpoint = Checkpoint(SQLiteCheckpointStore("feeder.db"), "feeder")
+            listener = mwdb.listen_for_files(checkpoint=checkpoint)
+            for result in mwdb.process_stream(listener, analyze, workers=8):
+                if result.error:
+                    print(f"Failed to analyze {result.object.id}: {result.error}")
+
+        .. versionadded:: 4.7.0
+
+        :param listener: Iterable with objects, usually returned by
+            listen_for_* methods or :py:meth:`mwdblib.ListenerEngine.subscribe`
+        :param handler: Function called for each object
+        :param workers: Number of worker threads (default: 4)
+        :type workers: int, optional
+        :param max_inflight: Maximum number of objects taken from listener and
+            not yielded yet (default: twice the number of workers)
+        :type max_inflight: int, optional
+        :param ack_failed: Acknowledge objects for which handler raised
+            an exception (default: False)
+        :type ack_failed: bool, optional
+        :rtype: Iterator[:class:`mwdblib.listener.StreamResult`]
+        """
+        return process_stream(
+            listener,
+            handler,
+            workers=workers,
+            max_inflight=max_inflight,
+            ack_failed=ack_failed,
         )
 
     def _query(
-        self, object_type: Type[MWDBObjectVar], hash: str, raise_not_found: bool
+        self,
+        object_type: Type[MWDBObjectVar],
+        hash: str,
+        raise_not_found: bool,
+        include: Sequence[str] = (),
     ) -> Optional[MWDBObjectVar]:
         """
         Generic implementation of query_* methods
@@ -512,14 +906,19 @@ class MWDB:
         try:
             url_pattern = object_type.URL_TYPE + "/{id}"
             result = self.api.get(url_pattern.format(id=hash))
-            return cast(MWDBObjectVar, object_type.create(self.api, result))
+            obj = cast(MWDBObjectVar, object_type.create(self.api, result))
+            if include:
+                preload_fields([obj], include)
+            return obj
         except ObjectNotFoundError:
             if not raise_not_found:
                 return None
             else:
                 raise
 
-    def query(self, hash: str, raise_not_found: bool = True) -> Optional[MWDBObject]:
+    def query(
+        self, hash: str, raise_not_found: bool = True, include: Sequence[str] = ()
+    ) -> Optional[MWDBObject]:
         """
         Queries for object using provided hash.
         If you already know type of object you are looking for,
@@ -535,20 +934,30 @@ class MWDB:
         .. versionchanged:: 3.0.0
            Fallback to :py:meth:`query_file` if other hash than SHA256 was provided
 
+        .. versionadded:: 4.7.0
+           Added ``include`` argument
+
         :param hash: Object hash (identifier, MD5, SHA-1, SHA-2)
         :type hash: str
         :param raise_not_found: If True (default), method raises HTTPError
             when object is not found
         :type raise_not_found: bool, optional
+        :param include: Lazy-loaded properties (e.g. ``("comments", "attributes")``)
+            loaded concurrently before object is returned
+        :type include: Sequence[str], optional
         :rtype: :class:`MWDBObject` or None (if raise_not_found=False)
         :raises: requests.exceptions.HTTPError
         """
         if len(hash) != 64:
             # If different hash than SHA256 was provided
-            return self.query_file(hash, raise_not_found=raise_not_found)
-        return self._query(MWDBObject, hash, raise_not_found)
+            return self.query_file(
+                hash, raise_not_found=raise_not_found, include=include
+            )
+        return self._query(MWDBObject, hash, raise_not_found, include=include)
 
-    def query_file(self, hash: str, raise_not_found: bool = True) -> Optional[MWDBFile]:
+    def query_file(
+        self, hash: str, raise_not_found: bool = True, include: Sequence[str] = ()
+    ) -> Optional[MWDBFile]:
         """
         Queries for file using provided hash
 
@@ -557,13 +966,16 @@ class MWDB:
         :param raise_not_found: If True (default), method raises HTTPError
             when object is not found
         :type raise_not_found: bool
+        :param include: Lazy-loaded properties (e.g. ``("comments", "attributes")``)
+            loaded concurrently before object is returned
+        :type include: Sequence[str], optional
         :rtype: :class:`MWDBFile` or None (if raise_not_found=False)
         :raises: requests.exceptions.HTTPError
         """
-        return self._query(MWDBFile, hash, raise_not_found)
+        return self._query(MWDBFile, hash, raise_not_found, include=include)
 
     def query_config(
-        self, hash: str, raise_not_found: bool = True
+        self, hash: str, raise_not_found: bool = True, include: Sequence[str] = ()
     ) -> Optional[MWDBConfig]:
         """
         Queries for configuration object using provided hash
@@ -573,12 +985,17 @@ class MWDB:
         :param raise_not_found: If True (default), method raises HTTPError
             when object is not found
         :type raise_not_found: bool
+        :param include: Lazy-loaded properties (e.g. ``("comments", "attributes")``)
+            loaded concurrently before object is returned
+        :type include: Sequence[str], optional
         :rtype: :class:`MWDBConfig` or None (if raise_not_found=False)
         :raises: requests.exceptions.HTTPError
         """
-        return self._query(MWDBConfig, hash, raise_not_found)
+        return self._query(MWDBConfig, hash, raise_not_found, include=include)
 
-    def query_blob(self, hash: str, raise_not_found: bool = True) -> Optional[MWDBBlob]:
+    def query_blob(
+        self, hash: str, raise_not_found: bool = True, include: Sequence[str] = ()
+    ) -> Optional[MWDBBlob]:
         """
         Queries for blob object using provided hash
 
@@ -587,13 +1004,144 @@ class MWDB:
         :param raise_not_found: If True (default), method raises HTTPError
             when object is not found
         :type raise_not_found: bool
+        :param include: Lazy-loaded properties (e.g. ``("comments", "attributes")``)
+            loaded concurrently before object is returned
+        :type include: Sequence[str], optional
         :rtype: :class:`MWDBBlob` or None (if raise_not_found=False)
         :raises: requests.exceptions.HTTPError
         """
-        return self._query(MWDBBlob, hash, raise_not_found)
+        return self._query(MWDBBlob, hash, raise_not_found, include=include)
+
+    def _query_many(
+        self,
+        query_method: Callable[[str], Optional[MWDBObjectVar]],
+        hashes: Iterable[str],
+        workers: int,
+        ordered: bool,
+    ) -> Iterator[Tuple[str, Optional[MWDBObjectVar]]]:
+        """
+        Generic implementation of query_*_many methods
+        """
+        for hash, future in iter_concurrently(
+            query_method, hashes, workers=workers, ordered=ordered
+        ):
+            yield hash, future.result()
+
+    def query_many(
+        self, hashes: Iterable[str], workers: int = 8, ordered: bool = False
+    ) -> Iterator[Tuple[str, Optional[MWDBObject]]]:
+        """
+        Queries for many objects concurrently using a pool of worker threads.
+        Objects that are not found are yielded as None.
+
+        If you already know type of objects you are looking for,
+        use specialized variants:
+
+        - :py:meth:`query_files_many`
+        - :py:meth:`query_configs_many`
+        - :py:meth:`query_blobs_many`
+
+        Workers share connection pool of the client, which keeps up to
+        ``pool_maxsize`` connections (default: 10). If you use more workers,
+        set ``pool_maxsize`` accordingly, otherwise connections over the limit
+        are closed after each request instead of being reused.
+
+        Usage example:
+
+        .. code-block:: python
+
+            mwdb = MWDB(pool_maxsize=16)
+            hashes = open("hashes.txt").read().split()
+            for hash, obj in mwdb.query_many(hashes, workers=16):
+                if obj is None:
+                    print(f"{hash} is missing")
+
+        .. versionadded:: 4.7.0
+
+        :param hashes: Iterable with object hashes (identifier, MD5, SHA-1, SHA-2).
+            Hashes are consumed lazily, so it can be a generator.
+        :type hashes: Iterable[str]
+        :param workers: Number of concurrent requests (default: 8)
+        :type workers: int, optional
+        :param ordered: If True, results are yielded in the same order as hashes.
+            Otherwise (default), results are yielded as soon as they arrive.
+        :type ordered: bool, optional
+        :rtype: Iterator[Tuple[str, Optional[:class:`MWDBObject`]]]
+        """
+        return self._query_many(
+            lambda hash: self.query(hash, raise_not_found=False),
+            hashes,
+            workers=workers,
+            ordered=ordered,
+        )
+
+    def query_files_many(
+        self, hashes: Iterable[str], workers: int = 8, ordered: bool = False
+    ) -> Iterator[Tuple[str, Optional[MWDBFile]]]:
+        """
+        Queries for many files concurrently using a pool of worker threads.
+
+        .. seealso::
+            More details can be found here: :meth:`query_many`
+
+        .. versionadded:: 4.7.0
+
+        :rtype: Iterator[Tuple[str, Optional[:class:`MWDBFile`]]]
+        """
+        return self._query_many(
+            lambda hash: self.query_file(hash, raise_not_found=False),
+            hashes,
+            workers=workers,
+            ordered=ordered,
+        )
+
+    def query_configs_many(
+        self, hashes: Iterable[str], workers: int = 8, ordered: bool = False
+    ) -> Iterator[Tuple[str, Optional[MWDBConfig]]]:
+        """
+        Queries for many configuration objects concurrently
+        using a pool of worker threads.
+
+        .. seealso::
+            More details can be found here: :meth:`query_many`
+
+        .. versionadded:: 4.7.0
+
+        :rtype: Iterator[Tuple[str, Optional[:class:`MWDBConfig`]]]
+        """
+        return self._query_many(
+            lambda hash: self.query_config(hash, raise_not_found=False),
+            hashes,
+            workers=workers,
+            ordered=ordered,
+        )
+
+    def query_blobs_many(
+        self, hashes: Iterable[str], workers: int = 8, ordered: bool = False
+    ) -> Iterator[Tuple[str, Optional[MWDBBlob]]]:
+        """
+        Queries for many blob objects concurrently using a pool of worker threads.
+
+        .. seealso::
+            More details can be found here: :meth:`query_many`
+
+        .. versionadded:: 4.7.0
+
+        :rtype: Iterator[Tuple[str, Optional[:class:`MWDBBlob`]]]
+        """
+        return self._query_many(
+            lambda hash: self.query_blob(hash, raise_not_found=False),
+            hashes,
+            workers=workers,
+            ordered=ordered,
+        )
 
     def search(
-        self, query: str, chunk_size: Optional[int] = None
+        self,
+        query: str,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 0,
+        include: Sequence[str] = (),
     ) -> Iterator[MWDBObject]:
         """
         Advanced search for objects using Lucene syntax.
@@ -613,17 +1161,32 @@ class MWDB:
             # Search for samples tagged as evil and with size less than 100kB
             results = mwdb.search_files("tag:evil AND file.size:[0 TO 100000]")
 
+        .. versionadded:: 4.7.0
+            Added ``prefetch`` and ``include`` parameters
+
         :param query: Search query
         :type query: str
         :param chunk_size: Number of objects returned per API request
         :type chunk_size: int
+        :param prefetch: Number of pages fetched ahead on a background thread
+            while current page is being consumed (default: 0, disabled)
+        :type prefetch: int, optional
+        :param include: Lazy-loaded properties (e.g. ``("tags", "attributes")``)
+            loaded concurrently for each page before objects are yielded
+        :type include: Sequence[str], optional
         :rtype: Iterator[:class:`MWDBObject`]
         :raises: requests.exceptions.HTTPError
         """
-        return self._recent(MWDBObject, query, chunk_size=chunk_size)
+        return self._recent(
+            MWDBObject, query, chunk_size=chunk_size, prefetch=prefetch, include=include
+        )
 
     def search_files(
-        self, query: str, chunk_size: Optional[int] = None
+        self,
+        query: str,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 0,
+        include: Sequence[str] = (),
     ) -> Iterator[MWDBFile]:
         """
         Advanced search for files using Lucene syntax.
@@ -632,13 +1195,25 @@ class MWDB:
         :type query: str
         :param chunk_size: Number of files returned per API request
         :type chunk_size: int
+        :param prefetch: Number of pages fetched ahead on a background thread
+            while current page is being consumed (default: 0, disabled)
+        :type prefetch: int, optional
+        :param include: Lazy-loaded properties (e.g. ``("tags", "attributes")``)
+            loaded concurrently for each page before objects are yielded
+        :type include: Sequence[str], optional
         :rtype: Iterator[:class:`MWDBFile`]
         :raises: requests.exceptions.HTTPError
         """
-        return self._recent(MWDBFile, query, chunk_size=chunk_size)
+        return self._recent(
+            MWDBFile, query, chunk_size=chunk_size, prefetch=prefetch, include=include
+        )
 
     def search_configs(
-        self, query: str, chunk_size: Optional[int] = None
+        self,
+        query: str,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 0,
+        include: Sequence[str] = (),
     ) -> Iterator[MWDBConfig]:
         """
         Advanced search for configuration objects using Lucene syntax.
@@ -647,13 +1222,25 @@ class MWDB:
         :type query: str
         :param chunk_size: Number of configs returned per API request
         :type chunk_size: int
+        :param prefetch: Number of pages fetched ahead on a background thread
+            while current page is being consumed (default: 0, disabled)
+        :type prefetch: int, optional
+        :param include: Lazy-loaded properties (e.g. ``("tags", "attributes")``)
+            loaded concurrently for each page before objects are yielded
+        :type include: Sequence[str], optional
         :rtype: Iterator[:class:`MWDBConfig`]
         :raises: requests.exceptions.HTTPError
         """
-        return self._recent(MWDBConfig, query, chunk_size=chunk_size)
+        return self._recent(
+            MWDBConfig, query, chunk_size=chunk_size, prefetch=prefetch, include=include
+        )
 
     def search_blobs(
-        self, query: str, chunk_size: Optional[int] = None
+        self,
+        query: str,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 0,
+        include: Sequence[str] = (),
     ) -> Iterator[MWDBBlob]:
         """
         Advanced search for blob objects using Lucene syntax.
@@ -662,10 +1249,277 @@ class MWDB:
         :type query: str
         :param chunk_size: Number of blobs returned per API request
         :type chunk_size: int
+        :param prefetch: Number of pages fetched ahead on a background thread
+            while current page is being consumed (default: 0, disabled)
+        :type prefetch: int, optional
+        :param include: Lazy-loaded properties (e.g. ``("tags", "attributes")``)
+            loaded concurrently for each page before objects are yielded
+        :type include: Sequence[str], optional
         :rtype: Iterator[:class:`MWDBBlob`]
         :raises: requests.exceptions.HTTPError
         """
-        return self._recent(MWDBBlob, query, chunk_size=chunk_size)
+        return self._recent(
+            MWDBBlob, query, chunk_size=chunk_size, prefetch=prefetch, include=include
+        )
+
+    def _search_partitioned(
+        self,
+        object_type: Type[MWDBObjectVar],
+        query: Optional[str],
+        partitions: int,
+        since: Union[datetime.date, datetime.datetime],
+        until: Optional[Union[datetime.date, datetime.datetime]],
+        ordered: bool,
+        chunk_size: Optional[int],
+        prefetch: int,
+    ) -> Iterator[MWDBObjectVar]:
+        """
+        Generic implementation of search_*_partitioned methods
+        """
+        if partitions < 1:
+            raise ValueError("Number of partitions must be positive")
+        if prefetch < 1:
+            raise ValueError("Number of prefetched pages must be positive")
+        if isinstance(since, datetime.datetime):
+            since = since.date()
+        if until is None:
+            until = datetime.datetime.utcnow().date()
+        elif isinstance(until, datetime.datetime):
+            until = until.date()
+        days = (until - since).days + 1
+        if days < 1:
+            raise ValueError("'since' must not be later than 'until'")
+        partitions = min(partitions, days)
+        # Split [since, until] into disjoint day ranges, starting from the newest
+        ranges = []
+        for index in range(partitions, 0, -1):
+            start = since + datetime.timedelta(days=(index - 1) * days // partitions)
+            end = since + datetime.timedelta(days=index * days // partitions - 1)
+            ranges.append(f"upload_time:[{start.isoformat()} TO {end.isoformat()}]")
+        page_iterators = [
+            self._recent_pages(
+                object_type,
+                query=f"({query}) AND {range_query}" if query else range_query,
+                chunk_size=chunk_size,
+            )
+            for range_query in ranges
+        ]
+        for page in iter_merged(page_iterators, ordered=ordered, buffer=prefetch):
+            yield from page
+
+    def search_partitioned(
+        self,
+        query: Optional[str],
+        since: Union[datetime.date, datetime.datetime],
+        until: Optional[Union[datetime.date, datetime.datetime]] = None,
+        partitions: int = 4,
+        ordered: bool = False,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 2,
+    ) -> Iterator[MWDBObject]:
+        """
+        Advanced search for objects using Lucene syntax, that splits query
+        into disjoint ``upload_time`` ranges and walks them concurrently.
+
+        Useful for exporting large parts of repository, where a single
+        :py:meth:`search` cursor is limited by round-trip latency. Ranges have
+        day granularity and both ``since`` and ``until`` days are included.
+
+        If you already know type of objects you are looking for,
+        use specialized variants:
+
+        - :py:meth:`search_files_partitioned`
+        - :py:meth:`search_configs_partitioned`
+        - :py:meth:`search_blobs_partitioned`
+
+        Usage example:
+
+        .. code-block:: python
+
+            import datetime
+
+            # Export all samples tagged as evil uploaded during last year
+            for obj in mwdb.search_files_partitioned(
+                "tag:evil",
+                since=datetime.date.today() - datetime.timedelta(days=365),
+                partitions=8,
+            ):
+                print(obj.sha256)
+
+        .. versionadded:: 4.7.0
+
+        :param query: Search query or None if all objects should be returned
+        :type query: str, optional
+        :param since: The oldest upload day to be included
+        :type since: datetime.date or datetime.datetime
+        :param until: The newest upload day to be included (default: today, UTC)
+        :type until: datetime.date or datetime.datetime, optional
+        :param partitions: Number of ranges walked concurrently (default: 4)
+        :type partitions: int, optional
+        :param ordered: If True, objects are yielded from the latest as
+            in :py:meth:`search`. Otherwise (default), objects from all ranges
+            are yielded as soon as they arrive.
+        :type ordered: bool, optional
+        :param chunk_size: Number of objects returned per API request
+        :type chunk_size: int, optional
+        :param prefetch: Number of pages fetched ahead for each range when
+            ``ordered`` is set or for all ranges together otherwise (default: 2).
+            Must be positive.
+        :type prefetch: int, optional
+        :rtype: Iterator[:class:`MWDBObject`]
+        """
+        return self._search_partitioned(
+            MWDBObject, query, partitions, since, until, ordered, chunk_size, prefetch
+        )
+
+    def search_files_partitioned(
+        self,
+        query: Optional[str],
+        since: Union[datetime.date, datetime.datetime],
+        until: Optional[Union[datetime.date, datetime.datetime]] = None,
+        partitions: int = 4,
+        ordered: bool = False,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 2,
+    ) -> Iterator[MWDBFile]:
+        """
+        Advanced search for files that walks disjoint ``upload_time``
+        ranges concurrently.
+
+        .. seealso::
+            More details can be found here: :meth:`search_partitioned`
+
+        .. versionadded:: 4.7.0
+
+        :rtype: Iterator[:class:`MWDBFile`]
+        """
+        return self._search_partitioned(
+            MWDBFile, query, partitions, since, until, ordered, chunk_size, prefetch
+        )
+
+    def search_configs_partitioned(
+        self,
+        query: Optional[str],
+        since: Union[datetime.date, datetime.datetime],
+        until: Optional[Union[datetime.date, datetime.datetime]] = None,
+        partitions: int = 4,
+        ordered: bool = False,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 2,
+    ) -> Iterator[MWDBConfig]:
+        """
+        Advanced search for configuration objects that walks disjoint
+        ``upload_time`` ranges concurrently.
+
+        .. seealso::
+            More details can be found here: :meth:`search_partitioned`
+
+        .. versionadded:: 4.7.0
+
+        :rtype: Iterator[:class:`MWDBConfig`]
+        """
+        return self._search_partitioned(
+            MWDBConfig, query, partitions, since, until, ordered, chunk_size, prefetch
+        )
+
+    def search_blobs_partitioned(
+        self,
+        query: Optional[str],
+        since: Union[datetime.date, datetime.datetime],
+        until: Optional[Union[datetime.date, datetime.datetime]] = None,
+        partitions: int = 4,
+        ordered: bool = False,
+        chunk_size: Optional[int] = None,
+        prefetch: int = 2,
+    ) -> Iterator[MWDBBlob]:
+        """
+        Advanced search for blob objects that walks disjoint ``upload_time``
+        ranges concurrently.
+
+        .. seealso::
+            More details can be found here: :meth:`search_partitioned`
+
+        .. versionadded:: 4.7.0
+
+        :rtype: Iterator[:class:`MWDBBlob`]
+        """
+        return self._search_partitioned(
+            MWDBBlob, query, partitions, since, until, ordered, chunk_size, prefetch
+        )
+
+    def search_to_table(
+        self,
+        query: Optional[str],
+        columns: Optional[Sequence[str]] = None,
+        format: str = "arrow",
+        path: Optional[ExportPath] = None,
+        object_type: str = "file",
+        chunk_size: Optional[int] = None,
+        batch_size: int = 10000,
+        prefetch: int = 0,
+    ) -> Any:
+        """
+        Exports search results as columnar table.
+
+        Listing pages are converted into batches of ``batch_size`` rows and
+        written to ``path`` one by one, so memory usage doesn't depend on
+        number of results. If ``path`` is not set, batches are written into
+        in-memory Arrow buffer backing the returned table.
+
+        Hashes are stored as fixed-size binary columns, sizes as 64-bit
+        integers and timestamps as UTC timestamps. Only listing fields are
+        available as columns.
+
+        Arrow and Parquet formats require ``pyarrow`` package
+        (``pip install mwdblib[arrow]``). CSV is written using standard library.
+
+        .. code-block:: python
+
+            table = mwdb.search_to_table(
+                "tag:ripped*", columns=["sha256", "file_size", "tags"]
+            )
+            df = table.to_pandas()
+
+            mwdb.search_to_table(
+                "upload_time:>=now-7d", format="parquet", path="last-week.parquet"
+            )
+
+        .. versionadded:: 4.7.0
+
+        :param query: Search query, None exports all objects
+        :type query: str, optional
+        :param columns: Exported columns (default: all listing fields)
+        :type columns: Sequence[str], optional
+        :param format: Output format: 'arrow', 'parquet' or 'csv'
+        :type format: str
+        :param path: Output path or file object. Required for 'parquet' and
+            'csv' formats. If not set for 'arrow' format, :class:`pyarrow.Table`
+            is returned.
+        :param object_type: Type of exported objects: 'object', 'file', 'config'
+            or 'blob' (default: 'file')
+        :type object_type: str
+        :param chunk_size: Number of objects returned per API request
+        :type chunk_size: int, optional
+        :param batch_size: Number of rows converted and written at once
+        :type batch_size: int
+        :param prefetch: Number of pages fetched ahead on a background thread
+            while current batch is being converted (default: 0, disabled)
+        :type prefetch: int, optional
+        :return: :class:`pyarrow.Table` if ``path`` is not set, number of
+            exported rows otherwise
+        """
+        if object_type not in RECORD_TYPES:
+            raise ValueError(f"Unknown object type: {object_type}")
+        pages = self._listing_pages(object_type, query=query, chunk_size=chunk_size)
+        if prefetch:
+            pages = iter_prefetched(pages, prefetch)
+        return export_table(
+            pages,
+            columns=columns or default_columns(object_type),
+            format=format,
+            path=path,
+            batch_size=batch_size,
+        )
 
     def _count(
         self, object_type: Type[MWDBObjectVar], query: Optional[str] = None
@@ -812,6 +1666,7 @@ class MWDB:
         share_with: Optional[str] = None,
         private: bool = False,
         public: bool = False,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> MWDBFile:
         """
         Upload file object
@@ -842,6 +1697,9 @@ class MWDB:
         :type private: bool, optional
         :param public: True if sample should be visible for everyone
         :type public: bool, optional
+        :param progress_callback: Function called with number of bytes sent so far
+            and total request body length while file is being uploaded
+        :type progress_callback: Callable[[int, int], None], optional
         :rtype: :class:`MWDBFile`
 
         .. versionadded:: 4.0.0
@@ -854,40 +1712,192 @@ class MWDB:
             Use ``karton_id`` instead of ``metakeys={"karton": "<id>"}`` if
             you use MWDB Core >= 2.3.0
 
+        .. versionadded:: 4.7.0
+            File objects are streamed to the server without loading
+            them into memory. Non-seekable streams are spooled to a temporary
+            file first. Added ``progress_callback`` parameter.
+
         Usage example:
 
         .. code-block:: python
 
-           mwdb.upload_file(
-               "malware.exe",
-               open("malware.exe", "rb").read(),
-               parent="3629344675705286607dd0f680c66c19f7e310a1",
-               public=True)
+           with open("malware.exe", "rb") as f:
+               mwdb.upload_file(
+                   "malware.exe",
+                   f,
+                   parent="3629344675705286607dd0f680c66c19f7e310a1",
+                   public=True)
         """
-        result = self.api.post(
-            "file",
-            files={
-                "file": (name, content),
-                "options": (
-                    None,
-                    json.dumps(
-                        self._upload_params(
-                            parent=parent,
-                            metakeys=metakeys,
-                            attributes=attributes,
-                            karton_id=karton_id,
-                            karton_arguments=karton_arguments,
-                            tags=tags,
-                            share_with=share_with,
-                            private=private,
-                            public=public,
-                        )
-                    ),
-                ),
-            },
+        options = json.dumps(
+            self._upload_params(
+                parent=parent,
+                metakeys=metakeys,
+                attributes=attributes,
+                karton_id=karton_id,
+                karton_arguments=karton_arguments,
+                tags=tags,
+                share_with=share_with,
+                private=private,
+                public=public,
+            )
         )
+        if isinstance(content, (bytes, bytearray, memoryview, str)):
+            if progress_callback is not None:
+                content = io.BytesIO(
+                    content.encode() if isinstance(content, str) else bytes(content)
+                )
+        if not hasattr(content, "read"):
+            # Small in-memory contents are sent as usual
+            result = self.api.post(
+                "file",
+                files={"file": (name, content), "options": (None, options)},
+            )
+            return MWDBFile(self.api, result)
+        stream = cast(BinaryIO, content)
+        with contextlib.ExitStack() as stack:
+            if not (hasattr(stream, "seekable") and stream.seekable()):
+                # Non-seekable streams (e.g. pipes) are spooled to temporary file,
+                # so they're not kept in memory and request can be retried
+                spooled = stack.enter_context(
+                    tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE)
+                )
+                shutil.copyfileobj(stream, spooled)
+                spooled.seek(0)
+                stream = cast(BinaryIO, spooled)
+            body = MultipartEncoder(
+                [("file", name, stream), ("options", None, options.encode())],
+                progress_callback=progress_callback,
+            )
+            result = self.api.post(
+                "file", data=body, headers={"Content-Type": body.content_type}
+            )
         return MWDBFile(self.api, result)
 
+    def _upload_one(
+        self, item: UploadItem, skip_existing: bool, upload_options: Dict[str, Any]
+    ) -> Tuple[MWDBFile, bool]:
+        """
+        Uploads single item of upload_many batch.
+        Returns uploaded or already existing file and flag if upload was skipped.
+        """
+        if isinstance(item, tuple):
+            name, content = item
+            return self._upload_content(name, content, skip_existing, upload_options)
+        with open(item, "rb") as f:
+            return self._upload_content(
+                os.path.basename(item), f, skip_existing, upload_options
+            )
+
+    def _upload_content(
+        self,
+        name: str,
+        content: Union[bytes, BinaryIO],
+        skip_existing: bool,
+        upload_options: Dict[str, Any],
+    ) -> Tuple[MWDBFile, bool]:
+        if skip_existing:
+            existing = self.query_file(calc_sha256(content), raise_not_found=False)
+            if existing is not None:
+                self._update_existing_file(existing, upload_options)
+                return existing, True
+        return self.upload_file(name, content, **upload_options), False
+
+    def _update_existing_file(
+        self, file: MWDBFile, upload_options: Dict[str, Any]
+    ) -> None:
+        """
+        Internal method that applies upload options to the file that already
+        exists, so skipped upload has the same effect as uploading it again
+        """
+        params = self._upload_params(
+            parent=upload_options.get("parent"),
+            metakeys=upload_options.get("metakeys"),
+            attributes=upload_options.get("attributes"),
+            karton_id=upload_options.get("karton_id"),
+            karton_arguments=upload_options.get("karton_arguments"),
+            tags=upload_options.get("tags"),
+            share_with=upload_options.get("share_with"),
+            private=upload_options.get("private", False),
+            public=upload_options.get("public", False),
+        )
+        parent = upload_options.get("parent")
+        if isinstance(parent, MWDBObject):
+            parent.add_child(file)
+        elif parent is not None:
+            self.api.put(f"object/{parent}/child/{file.id}")
+        existing_tags = set(file.tags)
+        for tag in params.get("tags", []):
+            if tag["tag"] not in existing_tags:
+                file.add_tag(tag["tag"])
+        for attribute in params.get("attributes", []):
+            file.add_attribute(attribute["key"], attribute["value"])
+        for metakey in params.get("metakeys", []):
+            file.add_metakey(metakey["key"], metakey["value"])
+        if "karton_id" in params:
+            file.assign_analysis(params["karton_id"])
+        # Files are shared with uploader groups on upload, so only
+        # explicitly requested groups need to be added
+        if params["upload_as"] not in ("*", self.api.logged_user):
+            file.share_with(params["upload_as"])
+
+    def upload_many(
+        self,
+        items: Iterable[UploadItem],
+        workers: int = 8,
+        skip_existing: bool = True,
+        ordered: bool = False,
+        **upload_options: Any,
+    ) -> Iterator[UploadResult]:
+        """
+        Uploads many files concurrently using a pool of worker threads.
+
+        If ``skip_existing`` is set (default), SHA256 of each file is computed
+        locally and file is uploaded only if it doesn't exist in MWDB yet.
+        Upload options are applied to the existing files without sending their
+        contents: parent relationship, tags, attributes (or metakeys), Karton
+        analysis and sharing with group set by ``share_with`` or ``public``.
+
+        Failed uploads don't abort the batch: exception is reported in
+        :py:attr:`UploadResult.error` of the corresponding result.
+
+        Usage example:
+
+        .. code-block:: python
+
+            paths = glob.glob("dropped/*")
+            for result in mwdb.upload_many(paths, workers=16, tags=["dropped"]):
+                if result.error:
+                    print(f"Failed to upload {result.item}: {result.error}")
+
+        .. versionadded:: 4.7.0
+
+        :param items: Iterable with paths or (name, contents) tuples.
+            Items are consumed lazily, so it can be a generator.
+        :type items: Iterable[Union[str, Tuple[str, Union[bytes, BinaryIO]]]]
+        :param workers: Number of concurrent uploads (default: 8)
+        :type workers: int, optional
+        :param skip_existing: Don't upload files that already exist (default: True)
+        :type skip_existing: bool, optional
+        :param ordered: If True, results are yielded in the same order as items.
+            Otherwise (default), results are yielded as soon as they are ready.
+        :type ordered: bool, optional
+        :param upload_options: Other arguments passed to :py:meth:`upload_file`
+            for each uploaded file e.g. ``tags``, ``parent`` or ``share_with``
+        :rtype: Iterator[:class:`UploadResult`]
+        """
+        for item, future in iter_concurrently(
+            lambda item: self._upload_one(item, skip_existing, upload_options),
+            items,
+            workers=workers,
+            ordered=ordered,
+        ):
+            error = future.exception()
+            if error is not None:
+                yield UploadResult(item=item, object=None, skipped=False, error=error)
+            else:
+                obj, skipped = future.result()
+                yield UploadResult(item=item, object=obj, skipped=skipped, error=None)
+
     def upload_config(
         self,
         family: str,
@@ -947,6 +1957,15 @@ class MWDB:
             Use ``karton_id`` instead of ``metakeys={"karton": "<id>"}`` if
             you use MWDB Core >= 2.3.0
 
+        .. versionchanged:: 4.7.0
+            If ``config_index_size`` or ``config_index_path`` option is set,
+            configuration found in the index of uploaded configurations isn't
+            sent again. Only ``parent``, ``tags`` and ``attributes`` are added
+            to the existing object, so returned :class:`MWDBConfig` has only
+            identifier loaded. If there is nothing to add, existence of the
+            configuration is checked instead. Configurations uploaded with
+            ``metakeys``, ``karton_id`` or sharing options are always sent.
+
         .. code-block:: python
 
            mwdb.upload_config(
@@ -976,9 +1995,73 @@ class MWDB:
                 public=public,
             )
         )
+        config_index = self.api.config_index
+        if config_index is not None:
+            dhash = config_dhash(cfg)
+            # Options that can be applied only during upload need to be sent
+            if not (
+                metakeys
+                or karton_id
+                or karton_arguments
+                or share_with
+                or private
+                or public
+            ):
+                config = self._update_indexed_config(
+                    config_index, dhash, parent, attributes, tags
+                )
+                if config is not None:
+                    return config
         result = self.api.post("config", json=params)
+        if config_index is not None:
+            config_index.put(dhash, result["id"])
         return MWDBConfig(self.api, result)
 
+    def _update_indexed_config(
+        self,
+        config_index: ConfigIndex,
+        dhash: str,
+        parent: Optional[Union[MWDBObject, str]],
+        attributes: Optional[Dict[str, Union[Any, List[Any]]]],
+        tags: Optional[List[str]],
+    ) -> Optional[MWDBConfig]:
+        """
+        Internal method that adds parent, tags and attributes to the configuration
+        found in config index instead of uploading it again.
+        Returns None if configuration is not indexed or doesn't exist anymore.
+        """
+        config_id = config_index.get(dhash)
+        if config_id is None:
+            return None
+        self.api.call_hooks("on_cache_hit", "config_index", config_id)
+        if not (parent or tags or attributes):
+            # Nothing to apply, so index entry is verified using single request
+            existing = self.query_config(config_id, raise_not_found=False)
+            if existing is None:
+                config_index.evict(dhash)
+            return existing
+        config = MWDBConfig(self.api, {"id": config_id, "type": MWDBConfig.TYPE})
+        try:
+            if isinstance(parent, MWDBObject):
+                parent.add_child(config)
+            elif parent is not None:
+                self.api.put(f"object/{parent}/child/{config_id}")
+            for tag in tags or []:
+                config.add_tag(tag)
+            for key, value_list in (attributes or {}).items():
+                for value in (
+                    value_list if isinstance(value_list, list) else [value_list]
+                ):
+                    config.add_attribute(key, value)
+        except ObjectNotFoundError:
+            # Missing parent is reported to the caller, but if configuration
+            # was removed, it must be uploaded again
+            if self.query_config(config_id, raise_not_found=False) is not None:
+                raise
+            config_index.evict(dhash)
+            return None
+        return config
+
     def upload_blob(
         self,
         name: str,
@@ -145,6 +145,17 @@ class ObjectNotFoundError(ObjectError):
     pass
 
 
+class IntegrityError(ObjectError):
+    """
+    Downloaded object contents don't match the expected hash.
+    Download was probably interrupted or corrupted in transit.
+
+    .. versionadded:: 4.7.0
+    """
+
+    pass
+
+
 class TypeConflictError(ObjectError):
     """
     Object you want to upload exists yet and has different type.
@@ -0,0 +1,215 @@
+"""
+Columnar export of listing and search results
+"""
+
+import csv
+import datetime
+import os
+from typing import IO, Any, Iterator, List, Optional, Sequence, Union, cast
+
+from .object import MWDBElementData
+from .record import RECORD_TYPES
+
+ExportPath = Union[str, "os.PathLike[str]", IO[Any]]
+
+# Column kinds determine column type in exported table:
+# - hash: fixed-size binary in Arrow/Parquet, hex string in CSV
+# - int: 64-bit integer
+# - str: string
+# - tags: list of strings, comma-separated in CSV
+# - time: timestamp (UTC), ISO 8601 string in CSV
+COLUMN_KINDS = {
+    "id": "hash",
+    "type": "str",
+    "tags": "tags",
+    "upload_time": "time",
+    "sha256": "hash",
+    "md5": "hash",
+    "sha1": "hash",
+    "file_name": "str",
+    "file_size": "int",
+    "file_type": "str",
+    "family": "str",
+    "config_type": "str",
+    "blob_name": "str",
+    "blob_size": "int",
+    "blob_type": "str",
+    "last_seen": "time",
+}
+
+HASH_SIZES = {"id": 32, "sha256": 32, "md5": 16, "sha1": 20}
+
+EXPORT_FORMATS = ("arrow", "parquet", "csv")
+
+
+def default_columns(object_type: str) -> List[str]:
+    """
+    Returns all listing columns available for given object type
+    """
+    return ["id", "type", "tags", "upload_time"] + list(
+        RECORD_TYPES[object_type].LISTING_FIELDS
+    )
+
+
+def _column_values(entries: List[MWDBElementData], column: str) -> List[Any]:
+    if column == "tags":
+        return [[tag["tag"] for tag in entry.get("tags", [])] for entry in entries]
+    # Object identifier is sha256 hash, but it's not always listed separately
+    key = "id" if column == "sha256" else column
+    return [entry.get(key) for entry in entries]
+
+
+def _iter_batches(
+    pages: Iterator[List[MWDBElementData]], batch_size: int
+) -> Iterator[List[MWDBElementData]]:
+    batch: List[MWDBElementData] = []
+    for page in pages:
+        batch.extend(page)
+        while len(batch) >= batch_size:
+            yield batch[:batch_size]
+            batch = batch[batch_size:]
+    if batch:
+        yield batch
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Arrow and Parquet export. "
+            "Install it using `pip install mwdblib[arrow]`"
+        ) from e
+    return pyarrow
+
+
+def _arrow_type(pa: Any, column: str) -> Any:
+    kind = COLUMN_KINDS[column]
+    if kind == "hash":
+        return pa.binary(HASH_SIZES[column])
+    elif kind == "int":
+        return pa.int64()
+    elif kind == "tags":
+        return pa.list_(pa.string())
+    elif kind == "time":
+        return pa.timestamp("us", tz="UTC")
+    return pa.string()
+
+
+def _arrow_array(pa: Any, values: List[Any], column: str) -> Any:
+    kind = COLUMN_KINDS[column]
+    arrow_type = _arrow_type(pa, column)
+    if kind == "hash":
+        values = [bytes.fromhex(value) if value else None for value in values]
+    elif kind == "time":
+        strings = pa.array(values, type=pa.string())
+        try:
+            return strings.cast(arrow_type)
+        except pa.ArrowInvalid:
+            # Older pyarrow versions don't parse UTC offsets
+            values = [
+                datetime.datetime.fromisoformat(value) if value else None
+                for value in values
+            ]
+    return pa.array(values, type=arrow_type)
+
+
+def _arrow_batches(
+    pa: Any, batches: Iterator[List[MWDBElementData]], columns: Sequence[str]
+) -> Iterator[Any]:
+    for entries in batches:
+        yield pa.RecordBatch.from_arrays(
+            [
+                _arrow_array(pa, _column_values(entries, column), column)
+                for column in columns
+            ],
+            names=list(columns),
+        )
+
+
+def _csv_value(value: Any, column: str) -> Any:
+    if value is None:
+        return ""
+    if COLUMN_KINDS[column] == "tags":
+        return ",".join(value)
+    return value
+
+
+def _write_csv(
+    batches: Iterator[List[MWDBElementData]], columns: Sequence[str], f: IO[str]
+) -> int:
+    writer = csv.writer(f)
+    writer.writerow(columns)
+    rows = 0
+    for entries in batches:
+        values = [_column_values(entries, column) for column in columns]
+        writer.writerows(
+            [_csv_value(value, column) for value, column in zip(row, columns)]
+            for row in zip(*values)
+        )
+        rows += len(entries)
+    return rows
+
+
+def export_table(
+    pages: Iterator[List[MWDBElementData]],
+    columns: Sequence[str],
+    format: str,
+    path: Optional[ExportPath],
+    batch_size: int,
+) -> Any:
+    """
+    Converts pages of listing entries into table in chosen format.
+
+    Returns :class:`pyarrow.Table` if Arrow table is requested without
+    ``path``. Otherwise, table is written in batches to ``path`` and number of
+    written rows is returned.
+    """
+    unknown = [column for column in columns if column not in COLUMN_KINDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown columns: {', '.join(unknown)}. "
+            f"Available columns: {', '.join(COLUMN_KINDS)}"
+        )
+    if format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unknown format: {format}. "
+            f"Available formats: {', '.join(EXPORT_FORMATS)}"
+        )
+    if path is None and format != "arrow":
+        raise ValueError(f"Path is required for '{format}' format")
+    batches = _iter_batches(pages, batch_size)
+
+    if format == "csv":
+        if isinstance(path, (str, os.PathLike)):
+            with open(path, "w", newline="") as f:
+                return _write_csv(batches, columns, f)
+        return _write_csv(batches, columns, cast(IO[str], path))
+
+    pa = _import_pyarrow()
+    schema = pa.schema([(column, _arrow_type(pa, column)) for column in columns])
+    record_batches = _arrow_batches(pa, batches, columns)
+    if path is None:
+        # Batches are serialized one by one into single in-memory buffer,
+        # so converted entries are released as soon as batch is written
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            for batch in record_batches:
+                writer.write_batch(batch)
+        return pa.ipc.open_stream(sink.getvalue()).read_all()
+    if isinstance(path, os.PathLike):
+        path = os.fspath(path)
+    rows = 0
+    if format == "arrow":
+        with pa.ipc.new_file(path, schema) as writer:
+            for batch in record_batches:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    else:
+        import pyarrow.parquet
+
+        with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+            for batch in record_batches:
+                writer.write_table(pa.Table.from_batches([batch]))
+                rows += batch.num_rows
+    return rows
@@ -1,6 +1,11 @@
-from typing import TYPE_CHECKING, Optional, cast
+import hashlib
+import os
+from typing import TYPE_CHECKING, BinaryIO, Iterator, List, Optional, Union, cast
+
+import requests
 
 from .api import APIClient
+from .exc import IntegrityError
 from .object import MWDBObject
 
 if TYPE_CHECKING:
@@ -11,6 +16,17 @@ if TYPE_CHECKING:
 class MWDBFile(MWDBObject):
     URL_TYPE = "file"
     TYPE = "file"
+    IMMUTABLE_FIELDS = MWDBObject.IMMUTABLE_FIELDS + (
+        "file_name",
+        "file_size",
+        "file_type",
+        "md5",
+        "sha1",
+        "sha256",
+        "sha512",
+        "crc32",
+        "ssdeep",
+    )
 
     def __init__(self, api: APIClient, data: "MWDBElementData"):
         self._content: Optional[bytes] = None
@@ -19,31 +35,31 @@ class MWDBFile(MWDBObject):
     @property
     def md5(self) -> str:
         if "md5" not in self.data:
-            self._load()
+            self._load_immutable("md5")
         return cast(str, self.data["md5"])
 
     @property
     def sha1(self) -> str:
         if "sha1" not in self.data:
-            self._load()
+            self._load_immutable("sha1")
         return cast(str, self.data["sha1"])
 
     @property
     def sha512(self) -> str:
         if "sha512" not in self.data:
-            self._load()
+            self._load_immutable("sha512")
         return cast(str, self.data["sha512"])
 
     @property
     def crc32(self) -> str:
         if "crc32" not in self.data:
-            self._load()
+            self._load_immutable("crc32")
         return cast(str, self.data["crc32"])
 
     @property
     def ssdeep(self) -> str:
         if "ssdeep" not in self.data:
-            self._load()
+            self._load_immutable("ssdeep")
         return cast(str, self.data["ssdeep"])
 
     @property
@@ -52,7 +68,7 @@ class MWDBFile(MWDBObject):
         Sample original name
         """
         if "file_name" not in self.data:
-            self._load()
+            self._load_immutable("file_name")
         return cast(str, self.data["file_name"])
 
     @property
@@ -61,7 +77,7 @@ class MWDBFile(MWDBObject):
         Sample size in bytes
         """
         if "file_size" not in self.data:
-            self._load()
+            self._load_immutable("file_size")
         return cast(int, self.data["file_size"])
 
     @property
@@ -70,7 +86,7 @@ class MWDBFile(MWDBObject):
         Sample type
         """
         if "file_type" not in self.data:
-            self._load()
+            self._load_immutable("file_type")
         return cast(str, self.data["file_type"])
 
     @property
@@ -122,11 +138,18 @@ class MWDBFile(MWDBObject):
             else None
         )
 
-    @APIClient.requires("2.2.0")
+    def _content_cache_key(self) -> str:
+        # Contents are verified against SHA256, so they can be shared
+        # between MWDB instances
+        return f"file-content/{self.id.lower()}"
+
     def download(self) -> bytes:
         """
         Downloads file contents
 
+        .. versionchanged:: 4.7.0
+           Contents are served from :class:`mwdblib.api.DiskCache` if enabled
+
         :return: File contents
         :rtype: bytes
 
@@ -143,15 +166,139 @@ class MWDBFile(MWDBObject):
 
            print("Downloaded {}".format(dropper.file_name))
         """
+        if self.api.disk_cache is None:
+            return cast(bytes, self._download())
+        chunks: List[bytes] = []
+        try:
+            # Contents are written to the cache file while being downloaded
+            chunks.extend(self.iter_content())
+        except IntegrityError:
+            # Contents that don't match SHA256 are returned, but not cached
+            pass
+        return b"".join(chunks)
+
+    @APIClient.requires("2.2.0")
+    def _download(self) -> bytes:
         download_endpoint = "file/{id}/download".format(**self.data)
         return cast(bytes, self.api.get(download_endpoint, raw=True))
 
-    @download.fallback("2.0.0")
+    @_download.fallback("2.0.0")
     def download_legacy(self) -> bytes:
         token = self.api.post("request/sample/{id}".format(**self.data))["url"].split(
             "/"
         )[-1]
         return cast(bytes, self.api.get("download/{}".format(token), raw=True))
 
+    @APIClient.requires("2.2.0")
+    def _open_download(self) -> requests.Response:
+        """
+        Opens streamed response with file contents
+        """
+        download_endpoint = "file/{id}/download".format(**self.data)
+        return cast(requests.Response, self.api.get(download_endpoint, stream=True))
+
+    @_open_download.fallback("2.0.0")
+    def _open_download_legacy(self) -> requests.Response:
+        token = self.api.post("request/sample/{id}".format(**self.data))["url"].split(
+            "/"
+        )[-1]
+        return cast(
+            requests.Response, self.api.get("download/{}".format(token), stream=True)
+        )
+
+    def iter_content(self, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """
+        Downloads file contents in chunks without loading the whole file
+        into memory.
+
+        SHA256 of downloaded data is verified incrementally and
+        :class:`mwdblib.exc.IntegrityError` is raised after the last chunk
+        if it doesn't match the object identifier.
+
+        If :class:`mwdblib.api.DiskCache` is enabled, verified contents
+        are stored in cache and served from there next time.
+
+        .. versionadded:: 4.7.0
+
+        :param chunk_size: Size of yielded chunks in bytes (default: 1 MiB)
+        :rtype: Iterator[bytes]
+        """
+        cache = self.api.disk_cache
+        if cache is not None:
+            cached = cache.open(self._content_cache_key())
+            if cached is not None:
+                self.api.call_hooks("on_cache_hit", "disk", self._content_cache_key())
+                with cached:
+                    for chunk in iter(lambda: cached.read(chunk_size), b""):
+                        yield chunk
+                return
+        # Downloaded contents are stored in cache after successful verification
+        cache_file = cache.temporary_file() if cache is not None else None
+        try:
+            sha256 = hashlib.sha256()
+            with self._open_download() as response:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    sha256.update(chunk)
+                    if cache_file is not None:
+                        cache_file.write(chunk)
+                    yield chunk
+            if sha256.hexdigest() != self.id.lower():
+                raise IntegrityError(
+                    f"Downloaded contents of {self.id} don't match the expected "
+                    f"SHA256 (got {sha256.hexdigest()})"
+                )
+            if cache is not None and cache_file is not None:
+                cache_file.close()
+                cache.put_file(self._content_cache_key(), cache_file.name)
+                cache_file = None
+        finally:
+            if cache_file is not None:
+                cache_file.close()
+                os.remove(cache_file.name)
+
+    def download_to(
+        self,
+        target: Union[str, "os.PathLike[str]", BinaryIO],
+        chunk_size: int = 1024 * 1024,
+    ) -> int:
+        """
+        Downloads file contents directly to the file path or file-like object,
+        keeping memory usage constant regardless of file size.
+
+        If target is a path and downloaded contents don't match the expected
+        SHA256, incomplete file is removed and
+        :class:`mwdblib.exc.IntegrityError` is raised.
+
+        .. versionadded:: 4.7.0
+
+        :param target: Path or binary file-like object opened for writing
+        :param chunk_size: Size of chunks written at once (default: 1 MiB)
+        :return: Number of written bytes
+        :rtype: int
+
+        Example - download sample under its original name:
+
+        .. code-block:: python
+
+           sample = mwdb.query_file("3629344675705286607dd0f680c66c19f7e310a1")
+           sample.download_to(sample.file_name)
+        """
+        if not isinstance(target, (str, os.PathLike)):
+            return self._download_to_fileobj(target, chunk_size)
+        try:
+            with open(target, "wb") as f:
+                return self._download_to_fileobj(f, chunk_size)
+        except BaseException:
+            if os.path.exists(target):
+                os.remove(target)
+            raise
+
+    def _download_to_fileobj(self, fileobj: BinaryIO, chunk_size: int) -> int:
+        written = 0
+        for chunk in self.iter_content(chunk_size=chunk_size):
+            fileobj.write(chunk)
+            written += len(chunk)
+        return written
+
     def __repr__(self) -> str:
         return f"MWDBFile(sha256={repr(self.id)}, name={repr(self.file_name)})"
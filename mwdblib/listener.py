@@ -0,0 +1,658 @@
+import datetime
+import heapq
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .blob import MWDBBlob
+from .checkpoint import Checkpoint, HighWaterMark
+from .config import MWDBConfig
+from .file import MWDBFile
+from .object import MWDBElementData, MWDBObject
+
+if TYPE_CHECKING:
+    from .core import MWDB
+
+MWDBObjectVar = TypeVar("MWDBObjectVar", bound=MWDBObject)
+
+OBJECT_TYPES: Dict[str, Type[MWDBObject]] = {
+    object_type.URL_TYPE: object_type
+    for object_type in (MWDBObject, MWDBFile, MWDBConfig, MWDBBlob)
+}
+
+
+def _upload_time(entry: MWDBElementData) -> datetime.datetime:
+    return datetime.datetime.fromisoformat(entry["upload_time"])
+
+
+class ListenerCursor:
+    """
+    High-water mark of object listing used by listeners.
+
+    Cursor keeps upload time of the newest seen object and identifiers of
+    seen objects uploaded at that time. Listing is walked from the newest
+    object until already seen or older object is reached, so poll usually
+    costs a single listing request and doesn't depend on pivot object still
+    being present.
+
+    .. versionadded:: 4.7.0
+
+    :param mwdb: :class:`mwdblib.MWDB` object
+    :param object_type: Type of listed objects
+    :param query: Lucene query that limits listed objects
+    :param page_size: Number of objects fetched per listing request
+    """
+
+    def __init__(
+        self,
+        mwdb: "MWDB",
+        object_type: Type[MWDBObject] = MWDBObject,
+        query: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> None:
+        self.mwdb = mwdb
+        self.object_type = object_type
+        self.query = query
+        self.page_size = page_size
+        #: Position of the newest object returned by cursor
+        self.position = HighWaterMark()
+
+    def start(self, last_object: Optional[Union[MWDBObject, str]] = None) -> None:
+        """
+        Sets initial position of cursor. Objects uploaded after ``last_object``
+        will be returned by :py:meth:`poll`. If ``last_object`` is not provided,
+        cursor starts from the newest object.
+        """
+        if isinstance(last_object, MWDBObject):
+            # If we are requesting for typed objects,
+            # we should additionally check the object type
+            if self.object_type is not MWDBObject and not isinstance(
+                last_object, self.object_type
+            ):
+                raise TypeError(
+                    "latest_object type must be 'str' or '{}'".format(
+                        self.object_type.__name__
+                    )
+                )
+        elif last_object is not None and not isinstance(last_object, str):
+            raise TypeError("'last_object' must be MWDBObject instance, str or None")
+        if last_object is None:
+            page = next(
+                self.mwdb._listing_pages(
+                    self.object_type.URL_TYPE, query=self.query, chunk_size=1
+                ),
+                [],
+            )
+            if page:
+                self.position.see(page[0]["id"], _upload_time(page[0]))
+            return
+        if isinstance(last_object, str):
+            last_object = cast(
+                MWDBObject,
+                self.mwdb._query(self.object_type, last_object, raise_not_found=True),
+            )
+        self.position.see(last_object.id, last_object.upload_time)
+
+    def restore(self, position: HighWaterMark) -> None:
+        """
+        Sets position of cursor e.g. loaded from checkpoint
+        """
+        self.position = position.copy()
+
+    def poll(self) -> List[MWDBObject]:
+        """
+        Returns objects uploaded since the last poll, from the oldest one
+        """
+        entries: List[MWDBElementData] = []
+        for page in self.mwdb._listing_pages(
+            self.object_type.URL_TYPE, query=self.query, chunk_size=self.page_size
+        ):
+            reached = False
+            for entry in page:
+                if self.position.reached(entry["id"], _upload_time(entry)):
+                    reached = True
+                    break
+                entries.append(entry)
+            if reached:
+                break
+        entries.reverse()
+        for entry in entries:
+            self.position.see(entry["id"], _upload_time(entry))
+        return [self.object_type.create(self.mwdb.api, entry) for entry in entries]
+
+    def start_from_checkpoint(
+        self,
+        checkpoint: Optional[Checkpoint],
+        last_object: Optional[Union[MWDBObject, str]] = None,
+    ) -> None:
+        """
+        Restores position from checkpoint if it was saved before. Otherwise,
+        starts from ``last_object`` and commits initial position.
+        """
+        position = checkpoint.load() if checkpoint is not None else None
+        if position is not None:
+            self.restore(position)
+            return
+        self.start(last_object)
+        if checkpoint is not None:
+            checkpoint.reset(self.position)
+
+
+class AdaptiveInterval:
+    """
+    Poll interval that drops to ``min_interval`` when new objects appear
+    and grows by ``factor`` up to ``max_interval`` while listener is idle.
+
+    .. versionadded:: 4.7.0
+    """
+
+    def __init__(
+        self, min_interval: float, max_interval: float, factor: float = 2.0
+    ) -> None:
+        if min_interval > max_interval:
+            raise ValueError("min_interval must not be greater than max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.current = min_interval
+
+    def update(self, new_objects: int) -> float:
+        """
+        Returns delay before the next poll based on number of new objects
+        """
+        if new_objects:
+            self.current = self.min_interval
+        else:
+            self.current = min(self.max_interval, self.current * self.factor)
+        return self.current
+
+
+class ListenerIterator(Generic[MWDBObjectVar]):
+    """
+    Base class of listener iterators.
+
+    If listener has :class:`mwdblib.checkpoint.Checkpoint`, object is
+    acknowledged when the next one is requested, so checkpoint advances only
+    past objects that were processed by consumer. Set :py:attr:`auto_ack` to
+    False to acknowledge objects explicitly using :py:meth:`ack`.
+
+    .. versionadded:: 4.7.0
+    """
+
+    def __init__(self, checkpoint: Optional[Checkpoint] = None) -> None:
+        self.checkpoint = checkpoint
+        #: Acknowledge previous object when the next one is requested
+        self.auto_ack = True
+        self._delivered: Optional[MWDBObjectVar] = None
+
+    def __iter__(self) -> "ListenerIterator[MWDBObjectVar]":
+        return self
+
+    def __next__(self) -> MWDBObjectVar:
+        delivered, self._delivered = self._delivered, None
+        if self.auto_ack and delivered is not None:
+            self.ack(delivered)
+        self._delivered = self._next()
+        return self._delivered
+
+    def _next(self) -> MWDBObjectVar:
+        raise NotImplementedError
+
+    def ack(self, obj: MWDBObject) -> None:
+        """
+        Acknowledges processed object. Objects must be acknowledged in the
+        same order as they were delivered.
+        """
+        if self.checkpoint is not None:
+            self.checkpoint.ack(obj)
+
+    def commit(self) -> None:
+        """
+        Commits checkpoint with acknowledged objects
+        """
+        if self.checkpoint is not None:
+            self.checkpoint.commit()
+
+    def close(self) -> None:
+        """
+        Stops listener, interrupting wait for new objects
+        """
+        raise NotImplementedError
+
+
+class Listener(ListenerIterator[MWDBObjectVar]):
+    """
+    Iterator returned by :py:meth:`mwdblib.MWDB.listen_for_objects`
+    and its specialized variants.
+
+    Cursor is started (from checkpoint or ``last_object``) when the first
+    object is requested, so creating listener doesn't make any request.
+
+    .. versionadded:: 4.7.0
+    """
+
+    def __init__(
+        self,
+        cursor: ListenerCursor,
+        blocking: bool,
+        interval: float,
+        checkpoint: Optional[Checkpoint] = None,
+        last_object: Optional[Union[MWDBObject, str]] = None,
+    ) -> None:
+        super().__init__(checkpoint)
+        self.cursor = cursor
+        self.blocking = blocking
+        self.interval = interval
+        self.last_object = last_object
+        self._pending: Deque[MWDBObjectVar] = deque()
+        self._started = False
+        self._polled = False
+        self._closed = threading.Event()
+
+    def _next(self) -> MWDBObjectVar:
+        if self._closed.is_set():
+            raise StopIteration
+        if not self._started:
+            # If object identifier is provided, cursor checks whether
+            # object exists in repository
+            self.cursor.start_from_checkpoint(self.checkpoint, self.last_object)
+            self._started = True
+        while not self._pending:
+            if self._polled:
+                # Commit acknowledged objects before waiting for new ones
+                self.commit()
+                if not self.blocking or self._closed.wait(self.interval):
+                    raise StopIteration
+            self._pending.extend(cast(List[MWDBObjectVar], self.cursor.poll()))
+            self._polled = True
+        return self._pending.popleft()
+
+    def close(self) -> None:
+        """
+        Stops listener. Objects that are already polled are not delivered.
+        """
+        self._closed.set()
+
+
+class Subscription(ListenerIterator[MWDBObject]):
+    """
+    Iterator over new objects delivered by :class:`ListenerEngine`.
+    Iteration blocks until new objects appear. If poll fails, exception is
+    raised by iterator and subscription is closed.
+
+    .. versionadded:: 4.7.0
+    """
+
+    def __init__(
+        self,
+        engine: "ListenerEngine",
+        cursor: ListenerCursor,
+        interval: AdaptiveInterval,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> None:
+        super().__init__(checkpoint)
+        self.engine = engine
+        self.cursor = cursor
+        self.interval = interval
+        self.closed = False
+        self.queue: "queue.Queue[Any]" = queue.Queue()
+
+    def _next(self) -> MWDBObject:
+        if self.queue.empty():
+            # Commit acknowledged objects before waiting for new ones
+            self.commit()
+            if self.closed:
+                raise StopIteration
+        item = self.queue.get()
+        if item is None:
+            raise StopIteration
+        if isinstance(item, BaseException):
+            raise item
+        return cast(MWDBObject, item)
+
+    def close(self) -> None:
+        """
+        Unsubscribes from engine and commits checkpoint. Objects that are
+        already queued can still be consumed.
+        """
+        self.engine.unsubscribe(self)
+        self.commit()
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class ListenerEngine:
+    """
+    Listens for new objects matching many queries using single scheduler
+    thread.
+
+    Each subscription keeps its own :class:`ListenerCursor` and adaptive poll
+    interval: subscriptions that get new objects are polled every
+    ``min_interval`` seconds, idle ones are polled less frequently, up to
+    ``max_interval``. Subscriptions with more than ``max_pending`` objects
+    waiting for consumer are not polled until consumer catches up.
+
+    Due subscriptions are polled concurrently by up to ``workers`` threads,
+    so slow query doesn't delay polls of other subscriptions unless all
+    workers are busy. Each subscription is polled by at most one worker
+    at once.
+
+    .. code-block:: python
+
+        from mwdblib import MWDB, ListenerEngine
+
+        mwdb = MWDB()
+        with ListenerEngine(mwdb) as engine:
+            emotet = engine.subscribe("config", query="family:emotet")
+            dumps = engine.subscribe("file", query="tag:dump*")
+            for cfg in emotet:
+                ...
+
+    .. versionadded:: 4.7.0
+
+    :param mwdb: :class:`mwdblib.MWDB` object used for polling
+    :param min_interval: Minimum interval between polls of the same
+        subscription (in seconds)
+    :param max_interval: Maximum interval between polls of idle subscription
+        (in seconds)
+    :param max_pending: Maximum number of objects queued for subscription
+        consumer before polling is paused
+    :param workers: Maximum number of concurrent polls
+    """
+
+    def __init__(
+        self,
+        mwdb: "MWDB",
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        max_pending: int = 1000,
+        workers: int = 4,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("Number of workers must be positive")
+        self.mwdb = mwdb
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_pending = max_pending
+        self.workers = workers
+        self.subscriptions: Set[Subscription] = set()
+        # Heap of (next poll time, sequence number, subscription)
+        self._schedule: List[Tuple[float, int, Subscription]] = []
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def subscribe(
+        self,
+        object_type: str = "object",
+        query: Optional[str] = None,
+        last_object: Optional[Union[MWDBObject, str]] = None,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> Subscription:
+        """
+        Subscribes for new objects. Starts engine if it's not running yet.
+
+        :param object_type: Type of objects: 'object', 'file', 'config' or 'blob'
+        :param query: Lucene query that limits listened objects
+        :param last_object: Objects uploaded after that object will be delivered
+            (default: objects uploaded after subscription)
+        :param min_interval: Overrides engine ``min_interval`` for subscription
+        :param max_interval: Overrides engine ``max_interval`` for subscription
+        :param checkpoint: Durable position of subscription. If checkpoint was
+            saved before, ``last_object`` is ignored and delivery is resumed
+            from the last committed object.
+        """
+        if object_type not in OBJECT_TYPES:
+            raise ValueError(f"Unknown object type: {object_type}")
+        cursor = ListenerCursor(self.mwdb, OBJECT_TYPES[object_type], query=query)
+        cursor.start_from_checkpoint(checkpoint, last_object)
+        interval = AdaptiveInterval(
+            self.min_interval if min_interval is None else min_interval,
+            self.max_interval if max_interval is None else max_interval,
+        )
+        subscription = Subscription(self, cursor, interval, checkpoint)
+        with self._condition:
+            self.subscriptions.add(subscription)
+            self._schedule_poll(subscription, time.monotonic())
+        self.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Removes subscription. Subscription iterator stops after consuming
+        already queued objects.
+        """
+        with self._condition:
+            if subscription not in self.subscriptions:
+                return
+            self.subscriptions.remove(subscription)
+            subscription.closed = True
+            subscription.queue.put(None)
+            self._condition.notify()
+
+    def _schedule_poll(self, subscription: Subscription, when: float) -> None:
+        self._sequence += 1
+        heapq.heappush(self._schedule, (when, self._sequence, subscription))
+        self._condition.notify()
+
+    def _next_due(self) -> Optional[Subscription]:
+        """
+        Waits for the next subscription to be polled. Returns None if engine
+        has been stopped.
+        """
+        with self._condition:
+            while self._running:
+                if not self._schedule:
+                    self._condition.wait()
+                    continue
+                when, _, subscription = self._schedule[0]
+                if subscription not in self.subscriptions:
+                    heapq.heappop(self._schedule)
+                    continue
+                delay = when - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                heapq.heappop(self._schedule)
+                return subscription
+            return None
+
+    def _poll(self, subscription: Subscription) -> None:
+        if subscription.queue.qsize() >= self.max_pending:
+            delay = subscription.interval.min_interval
+        else:
+            try:
+                objects = subscription.cursor.poll()
+            except Exception as e:
+                subscription.queue.put(e)
+                self.unsubscribe(subscription)
+                return
+            for obj in objects:
+                subscription.queue.put(obj)
+            delay = subscription.interval.update(len(objects))
+        with self._condition:
+            if subscription in self.subscriptions:
+                self._schedule_poll(subscription, time.monotonic() + delay)
+
+    def _run(self) -> None:
+        # Subscription is scheduled again when its poll is finished,
+        # so it's never polled by two workers at once
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                subscription = self._next_due()
+                if subscription is None:
+                    return
+                pool.submit(self._poll, subscription)
+
+    def start(self) -> None:
+        """
+        Starts scheduler thread
+        """
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops scheduler thread and closes all subscriptions. Waits for polls
+        that are in progress.
+        """
+        with self._condition:
+            self._running = False
+            thread, self._thread = self._thread, None
+            for subscription in list(self.subscriptions):
+                self.unsubscribe(subscription)
+            self._schedule.clear()
+            self._condition.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def __enter__(self) -> "ListenerEngine":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
+
+class StreamResult(NamedTuple):
+    """
+    Result of processing single object yielded by
+    :py:meth:`mwdblib.MWDB.process_stream`
+
+    .. versionadded:: 4.7.0
+    """
+
+    #: Processed object
+    object: MWDBObject
+    #: Value returned by handler, None if handler failed
+    result: Any
+    #: Exception raised by handler, None if succeeded
+    error: Optional[BaseException]
+
+
+def process_stream(
+    listener: Iterable[MWDBObjectVar],
+    handler: Callable[[MWDBObjectVar], Any],
+    workers: int = 4,
+    max_inflight: Optional[int] = None,
+    ack_failed: bool = False,
+) -> Iterator[StreamResult]:
+    """
+    Generic implementation of :py:meth:`mwdblib.MWDB.process_stream`
+    """
+    if workers < 1:
+        raise ValueError("Number of workers must be positive")
+    max_inflight = max_inflight or workers * 2
+    acknowledged: Optional[ListenerIterator[Any]] = None
+    if isinstance(listener, ListenerIterator):
+        # Acknowledge objects only when they are processed
+        acknowledged = listener
+        acknowledged.auto_ack = False
+    pool = ThreadPoolExecutor(max_workers=workers)
+    # Limits number of objects taken from listener but not yielded yet
+    slots = threading.Semaphore(max_inflight)
+    # Submitted (object, future) pairs in listener order, None marks the end
+    submitted: "queue.Queue[Any]" = queue.Queue()
+    stopped = threading.Event()
+    held = False
+
+    def feed() -> None:
+        try:
+            for obj in listener:
+                while not slots.acquire(timeout=0.5):
+                    if stopped.is_set():
+                        return
+                if stopped.is_set():
+                    return
+                submitted.put((obj, pool.submit(handler, obj)))
+            submitted.put(None)
+        except BaseException as e:
+            submitted.put(e)
+
+    # Listener blocks while waiting for new objects, so it's advanced on
+    # a separate thread and completed objects are yielded in the meantime
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    try:
+        while True:
+            item = submitted.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            obj, future = item
+            error = future.exception()
+            if error is not None and not ack_failed:
+                # Checkpoint is held before the first failed object,
+                # so it will be delivered again after restart
+                held = True
+            if acknowledged is not None and not held:
+                acknowledged.ack(obj)
+            slots.release()
+            yield StreamResult(
+                object=obj,
+                result=future.result() if error is None else None,
+                error=error,
+            )
+    finally:
+        stopped.set()
+        if acknowledged is not None:
+            # Interrupt listener waiting for new objects, so it doesn't
+            # poll or commit checkpoint after stream is closed
+            acknowledged.close()
+            feeder.join()
+        # Work that is not completed isn't acknowledged,
+        # so it will be delivered again after restart
+        while True:
+            try:
+                item = submitted.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, tuple):
+                item[1].cancel()
+        pool.shutdown(wait=False)
+        if acknowledged is not None:
+            acknowledged.commit()
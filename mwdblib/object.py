@@ -1,9 +1,22 @@
 import datetime
 import warnings
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 from .api import APIClient
+from .util import iter_concurrently
 
 if TYPE_CHECKING:
     from .comment import MWDBComment
@@ -13,6 +26,19 @@ if TYPE_CHECKING:
 MWDBElementData = Dict[str, Any]
 MWDBElementDataMapper = Callable[[MWDBElementData], Any]
 
+# Lazy-loaded properties that can be requested via ``include`` argument,
+# mapped to the data key that is filled when property is loaded.
+# 'parents' and 'children' are loaded by the same request.
+PRELOADABLE_FIELDS = {
+    "tags": "tags",
+    "comments": "comments",
+    "shares": "shares",
+    "attributes": "attributes",
+    "analyses": "analyses",
+    "parents": "parents",
+    "children": "parents",
+}
+
 
 class MWDBElement:
     """
@@ -54,15 +80,44 @@ class MWDBObject(MWDBElement):
 
     URL_TYPE: str = "object"  # Type name in URL endpoint
     TYPE: str = "object"  # Type name in 'type' object field
+    # Fields that never change for given object, can be kept in disk cache
+    IMMUTABLE_FIELDS: Tuple[str, ...] = ("upload_time",)
 
     def _load(
         self,
         url_pattern: Optional[str] = None,
         mapper: Optional[MWDBElementDataMapper] = None,
     ) -> None:
-        if url_pattern is None:
-            url_pattern = self.URL_TYPE + "/{id}"
-        return super()._load(url_pattern, mapper=mapper)
+        if url_pattern is not None:
+            return super()._load(url_pattern, mapper=mapper)
+        super()._load(self.URL_TYPE + "/{id}", mapper=mapper)
+        cache = self.api.disk_cache
+        if cache is not None and self._disk_cache_key() not in cache:
+            cache.put_json(
+                self._disk_cache_key(),
+                {
+                    key: self.data[key]
+                    for key in self.IMMUTABLE_FIELDS
+                    if key in self.data
+                },
+            )
+
+    def _disk_cache_key(self) -> str:
+        return f"{self.api.options.api_url}{self.URL_TYPE}/{self.data['id']}"
+
+    def _load_immutable(self, key: str) -> None:
+        """
+        Loads immutable field from disk cache if available.
+        Otherwise, loads object using API.
+        """
+        cache = self.api.disk_cache
+        if cache is not None:
+            cached = cache.get_json(self._disk_cache_key())
+            if cached is not None and key in cached:
+                self.api.call_hooks("on_cache_hit", "disk", self._disk_cache_key())
+                self.data.update(cached)
+                return
+        self._load()
 
     @staticmethod
     def create(api: APIClient, data: MWDBElementData) -> "MWDBObject":
@@ -74,13 +129,40 @@ class MWDBObject(MWDBElement):
         from .file import MWDBFile
 
         type = data["type"]
+        if api.object_cache is not None:
+            # Reuse instance from identity map, refreshing fields provided in data
+            cached = api.object_cache.get((type, data["id"]))
+            if cached is not None:
+                api.call_hooks("on_cache_hit", "object", f"{type}/{data['id']}")
+                cached.data.update(data)
+                return cast(MWDBObject, cached)
+        obj: MWDBObject
         if type == MWDBFile.TYPE:
-            return MWDBFile(api, data)
+            obj = MWDBFile(api, data)
         elif type == MWDBConfig.TYPE:
-            return MWDBConfig(api, data)
+            obj = MWDBConfig(api, data)
         elif type == MWDBBlob.TYPE:
-            return MWDBBlob(api, data)
-        raise RuntimeError(f"Unsupported object type: '{type}'")
+            obj = MWDBBlob(api, data)
+        else:
+            raise RuntimeError(f"Unsupported object type: '{type}'")
+        if api.object_cache is not None:
+            api.object_cache.put((type, data["id"]), obj)
+        return obj
+
+    def _invalidate_cached(self, force: bool = False) -> None:
+        """
+        Evicts object from identity map if cached instance is not this one
+        (so it would serve outdated data) or if ``force`` is set.
+        """
+        if self.api.object_cache is None:
+            return
+        key = (self.TYPE, self.data["id"])
+        if force or self.api.object_cache.peek(key) is not self:
+            self.api.object_cache.evict(key)
+
+    def _expire(self, key: str) -> None:
+        super()._expire(key)
+        self._invalidate_cached()
 
     def remove(self) -> None:
         """
@@ -90,6 +172,7 @@ class MWDBObject(MWDBElement):
         """
         self.api.delete("object/{}".format(self.data["id"]))
         self.flush()
+        self._invalidate_cached(force=True)
 
     @property
     def id(self) -> str:
@@ -239,7 +322,7 @@ class MWDBObject(MWDBElement):
         :return: datetime object with object upload timestamp
         """
         if "upload_time" not in self.data:
-            self._load()
+            self._load_immutable("upload_time")
         return datetime.datetime.fromisoformat(self.data["upload_time"])
 
     @property
@@ -498,3 +581,40 @@ class MWDBObject(MWDBElement):
         All object-specific properties will be lazy-loaded using API
         """
         self.data = {"id": self.data["id"], "type": self.data["type"]}
+        self._invalidate_cached()
+
+
+def preload_fields(
+    objects: Iterable[MWDBObject], include: Sequence[str], workers: int = 8
+) -> None:
+    """
+    Loads requested lazy-loaded properties of objects concurrently.
+    Properties that are already loaded don't trigger any request.
+
+    :param objects: Objects to be loaded
+    :param include: Names of properties e.g. ``("tags", "attributes")``
+    :param workers: Number of concurrent requests
+    """
+    for field in include:
+        if field not in PRELOADABLE_FIELDS:
+            raise ValueError(
+                f"Field '{field}' can't be included. "
+                f"Supported fields: {', '.join(PRELOADABLE_FIELDS)}"
+            )
+    # Deduplicate fields loaded by the same request
+    fields = {PRELOADABLE_FIELDS[field]: field for field in include}
+    tasks: List[Tuple[MWDBObject, str]] = [
+        (obj, field)
+        for obj in objects
+        for key, field in fields.items()
+        if key not in obj.data
+    ]
+    if not tasks:
+        return
+    for _, future in iter_concurrently(
+        lambda task: getattr(task[0], task[1]),
+        tasks,
+        workers=min(workers, len(tasks)),
+        ordered=False,
+    ):
+        future.result()
@@ -0,0 +1,162 @@
+import datetime
+import sys
+from typing import Any, Dict, Optional, Tuple, Type
+
+from .api import APIClient
+from .object import MWDBElementData, MWDBObject
+
+
+class MWDBObjectRecord:
+    """
+    Compact, read-only representation of object listing entry
+    yielded by :py:meth:`mwdblib.MWDB.iter_records`.
+
+    Contains only fields returned by listing endpoints and doesn't
+    lazy-load anything, so it's much cheaper to keep millions of them
+    in memory than :class:`mwdblib.MWDBObject` instances.
+    Use :py:meth:`to_object` to get full object when needed.
+
+    .. versionadded:: 4.7.0
+    """
+
+    __slots__ = ("api", "id", "object_type", "tags", "upload_time")
+
+    #: Listing fields specific for object type
+    LISTING_FIELDS: Tuple[str, ...] = ()
+    # Fields with small set of repeating values, interned to share memory
+    INTERNED_FIELDS: Tuple[str, ...] = ()
+    DATETIME_FIELDS: Tuple[str, ...] = ()
+
+    api: APIClient
+    #: Object identifier (sha256)
+    id: str
+    #: Object type ('file', 'static_config' or 'text_blob')
+    object_type: str
+    #: Tuple of tags
+    tags: Tuple[str, ...]
+    #: Timestamp of first object upload
+    upload_time: datetime.datetime
+
+    def __init__(self, api: APIClient, data: MWDBElementData) -> None:
+        set_field = super().__setattr__
+        set_field("api", api)
+        set_field("id", data["id"])
+        set_field("object_type", sys.intern(data["type"]))
+        set_field("tags", tuple(sys.intern(tag["tag"]) for tag in data.get("tags", [])))
+        set_field("upload_time", datetime.datetime.fromisoformat(data["upload_time"]))
+        for key in self.LISTING_FIELDS:
+            value = data.get(key)
+            if value is not None:
+                if key in self.INTERNED_FIELDS:
+                    value = sys.intern(value)
+                elif key in self.DATETIME_FIELDS:
+                    value = datetime.datetime.fromisoformat(value)
+            set_field(key, value)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    @property
+    def sha256(self) -> str:
+        """
+        Object identifier (sha256)
+        """
+        return self.id
+
+    def to_dict(self) -> MWDBElementData:
+        """
+        Returns record as listing entry in API format
+        """
+        data: Dict[str, Any] = {
+            "id": self.id,
+            "type": self.object_type,
+            "tags": [{"tag": tag} for tag in self.tags],
+            "upload_time": self.upload_time.isoformat(),
+        }
+        for key in self.LISTING_FIELDS:
+            value = getattr(self, key)
+            if value is None:
+                continue
+            if isinstance(value, datetime.datetime):
+                value = value.isoformat()
+            data[key] = value
+        return data
+
+    def to_object(self) -> MWDBObject:
+        """
+        Returns full :class:`mwdblib.MWDBObject` with listing fields already
+        loaded. Other properties are lazy-loaded as usual.
+        """
+        return MWDBObject.create(self.api, self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(id={repr(self.id)})"
+
+
+class MWDBFileRecord(MWDBObjectRecord):
+    """
+    Compact, read-only representation of file listing entry
+
+    .. versionadded:: 4.7.0
+    """
+
+    __slots__ = ("file_name", "file_size", "file_type", "md5", "sha1")
+
+    LISTING_FIELDS = ("file_name", "file_size", "file_type", "md5", "sha1")
+    INTERNED_FIELDS = ("file_type",)
+
+    file_name: str
+    file_size: int
+    file_type: str
+    md5: str
+    sha1: str
+
+    def __repr__(self) -> str:
+        return f"MWDBFileRecord(sha256={repr(self.id)}, name={repr(self.file_name)})"
+
+
+class MWDBConfigRecord(MWDBObjectRecord):
+    """
+    Compact, read-only representation of configuration listing entry
+
+    .. versionadded:: 4.7.0
+    """
+
+    __slots__ = ("family", "config_type")
+
+    LISTING_FIELDS = ("family", "config_type")
+    INTERNED_FIELDS = ("family", "config_type")
+
+    family: str
+    config_type: str
+
+
+class MWDBBlobRecord(MWDBObjectRecord):
+    """
+    Compact, read-only representation of blob listing entry
+
+    .. versionadded:: 4.7.0
+    """
+
+    __slots__ = ("blob_name", "blob_size", "blob_type", "last_seen")
+
+    LISTING_FIELDS = ("blob_name", "blob_size", "blob_type", "last_seen")
+    INTERNED_FIELDS = ("blob_type",)
+    DATETIME_FIELDS = ("last_seen",)
+
+    blob_name: str
+    blob_size: int
+    blob_type: str
+    last_seen: Optional[datetime.datetime]
+
+
+# Record classes for listing endpoints ('object', 'file', 'config' and 'blob')
+RECORD_TYPES: Dict[str, Type[MWDBObjectRecord]] = {
+    "object": MWDBObjectRecord,
+    "file": MWDBFileRecord,
+    "config": MWDBConfigRecord,
+    "blob": MWDBBlobRecord,
+}
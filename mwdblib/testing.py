@@ -0,0 +1,168 @@
+"""
+Helpers for testing code that uses mwdblib
+
+.. versionadded:: 4.7.0
+"""
+
+import fnmatch
+import threading
+from collections import Counter
+from types import TracebackType
+from typing import Any, Dict, Optional, Type
+
+from .api import APIClient, APIClientHooks, RequestInfo
+
+__all__ = ["RequestBudgetExceeded", "RequestCounter"]
+
+
+class RequestBudgetExceeded(AssertionError):
+    """
+    Raised by :class:`RequestCounter` when code made more API requests
+    than expected.
+
+    .. versionadded:: 4.7.0
+    """
+
+    pass
+
+
+def _get_api_client(client: Any) -> APIClient:
+    # MWDB and AsyncMWDB wrap API client, AsyncAPIClient wraps APIClient
+    while not isinstance(client, APIClient):
+        if not hasattr(client, "api"):
+            raise TypeError(
+                f"Expected MWDB, AsyncMWDB or API client, got {type(client)!r}"
+            )
+        client = client.api
+    return client
+
+
+class RequestCounter(APIClientHooks):
+    """
+    Context manager that counts API requests made by client, grouped by
+    endpoint. Requests are counted via client hooks, so counters of different
+    clients don't interfere with each other even if they're used concurrently.
+
+    .. code-block:: python
+
+        from itertools import islice
+        from mwdblib.testing import RequestCounter
+
+        with RequestCounter(mwdb, max_requests=2) as counter:
+            files = list(islice(mwdb.recent_files(chunk_size=100), 100))
+        print(counter.counts)
+
+    Budget is checked when ``with`` block exits without an exception.
+    Endpoint budgets are keyed by endpoint name pattern (e.g. ``file``,
+    ``object/*/tag``), optionally prefixed with HTTP method (``GET file``).
+    Each attempt is counted, so retried requests count more than once.
+
+    All requests made by the client are counted, including these from other
+    threads. Use separate client instances if you need to count requests made
+    by concurrent tasks separately.
+
+    .. versionadded:: 4.7.0
+
+    :param clients: :class:`mwdblib.MWDB`, :class:`mwdblib.AsyncMWDB`
+        or API client objects to be observed
+    :param max_requests: Maximum total number of requests (default: no limit)
+    :param endpoints: Maximum number of requests per endpoint pattern
+    """
+
+    def __init__(
+        self,
+        *clients: Any,
+        max_requests: Optional[int] = None,
+        endpoints: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self.clients = [_get_api_client(client) for client in clients]
+        self.max_requests = max_requests
+        self.endpoints = endpoints or {}
+        #: Number of requests per ``"METHOD endpoint"`` key
+        self.counts: Dict[str, int] = Counter()
+        #: Number of client-side cache hits per cache name
+        self.cache_hits: Dict[str, int] = Counter()
+        self._lock = threading.Lock()
+
+    def on_request_start(self, request: RequestInfo) -> None:
+        with self._lock:
+            self.counts[f"{request.method} {request.endpoint}"] += 1
+
+    def on_cache_hit(self, cache: str, key: str) -> None:
+        with self._lock:
+            self.cache_hits[cache] += 1
+
+    @property
+    def total(self) -> int:
+        """
+        Total number of counted requests
+        """
+        with self._lock:
+            return sum(self.counts.values())
+
+    def count(self, pattern: str = "*") -> int:
+        """
+        Returns number of requests matching endpoint pattern
+
+        :param pattern: Endpoint name pattern e.g. ``object/*/tag``,
+            optionally prefixed with HTTP method e.g. ``GET file``
+        """
+        if " " not in pattern:
+            pattern = "* " + pattern
+        with self._lock:
+            return sum(
+                count
+                for key, count in self.counts.items()
+                if fnmatch.fnmatchcase(key, pattern)
+            )
+
+    def reset(self) -> None:
+        """
+        Resets counters
+        """
+        with self._lock:
+            self.counts.clear()
+            self.cache_hits.clear()
+
+    def check(self) -> None:
+        """
+        Checks request budget
+
+        :raises: RequestBudgetExceeded
+        """
+        violations = []
+        total = self.total
+        if self.max_requests is not None and total > self.max_requests:
+            violations.append(
+                f"made {total} requests, expected at most {self.max_requests}"
+            )
+        for pattern, limit in self.endpoints.items():
+            count = self.count(pattern)
+            if count > limit:
+                violations.append(
+                    f"made {count} requests to '{pattern}', expected at most {limit}"
+                )
+        if violations:
+            with self._lock:
+                summary = ", ".join(
+                    f"{key}: {count}" for key, count in sorted(self.counts.items())
+                )
+            raise RequestBudgetExceeded(
+                "Request budget exceeded: " + "; ".join(violations) + f" ({summary})"
+            )
+
+    def __enter__(self) -> "RequestCounter":
+        for client in self.clients:
+            client.add_hooks(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        for client in self.clients:
+            client.remove_hooks(self)
+        if exc_type is None:
+            self.check()
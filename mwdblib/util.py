@@ -1,5 +1,32 @@
 import hashlib
-from typing import Any
+import itertools
+import queue
+import threading
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def convert_to_utf8(obj: Any) -> bytes:
@@ -7,22 +34,86 @@ def convert_to_utf8(obj: Any) -> bytes:
     return bytes(str(obj), "utf-8")
 
 
+def calc_sha256(content: Union[bytes, BinaryIO], chunk_size: int = 1024 * 1024) -> str:
+    """
+    Computes SHA256 hex digest of bytes or seekable file object.
+    File object is read in chunks and rewound to its original position.
+    """
+    if isinstance(content, bytes):
+        return hashlib.sha256(content).hexdigest()
+    sha256 = hashlib.sha256()
+    position = content.tell()
+    for chunk in iter(lambda: content.read(chunk_size), b""):
+        sha256.update(chunk)
+    content.seek(position)
+    return sha256.hexdigest()
+
+
+def _hash_value(obj: Any) -> str:
+    # Other types: evaluate SHA256 after conversion to UTF-8
+    return hashlib.sha256(convert_to_utf8(obj)).hexdigest()
+
+
+def _hash_list(hashes: List[str]) -> str:
+    # Hash of str() of sorted list with hex digests of elements
+    hashes.sort()
+    return _hash_value("['" + "', '".join(hashes) + "']" if hashes else "[]")
+
+
 def _eval_config_dhash(obj: Any) -> str:
     """Compute a data hash from the object. This is the hashing algorithm
     used internally by MWDB to assign unique ids to configs
+
+    - For lists: evaluate hash for all elements, sort them lexicographically
+      and hash the string representation of the sorted list
+    - For dicts: hash list of ``[key, hash(value)]`` pairs
+    - Other types: evaluate SHA256 after conversion to UTF-8
+
+    Nested structures are traversed using explicit stack instead of
+    recursion, so deeply nested configs don't exceed the recursion limit.
     """
-    if isinstance(obj, list):
-        # For lists: evaluate hash recursively for all elements
-        # and sort them lexicographically
-        return _eval_config_dhash(str(sorted([_eval_config_dhash(o) for o in obj])))
-    elif isinstance(obj, dict):
-        # For dicts: convert to key-ordered tuples with hashed value
-        return _eval_config_dhash(
-            [[o, _eval_config_dhash(obj[o])] for o in sorted(obj.keys())]
-        )
-    else:
-        # Other types: evaluate SHA256 after conversion to UTF-8
-        return hashlib.sha256(convert_to_utf8(obj)).hexdigest()
+    if not isinstance(obj, (dict, list)):
+        return _hash_value(obj)
+    # Frames of containers being evaluated: (container, iterator over
+    # elements or sorted keys, hashes of evaluated elements, keys of dict
+    # values being evaluated)
+    stack: List[Tuple[Any, Iterator[Any], List[str], List[Any]]] = []
+    current: Any = obj
+    while True:
+        if isinstance(current, dict):
+            stack.append((current, iter(sorted(current.keys())), [], []))
+        else:
+            stack.append((current, iter(current), [], []))
+        container, elements, hashes, keys = stack[-1]
+        is_dict = isinstance(container, dict)
+        while True:
+            for element in elements:
+                key = element
+                if is_dict:
+                    element = container[key]
+                if isinstance(element, (dict, list)):
+                    # Evaluate nested container first
+                    keys.append(key)
+                    current = element
+                    break
+                result = _hash_value(element)
+                if is_dict:
+                    # Hash of [key, hash(value)] pair
+                    result = _hash_list([_hash_value(key), _hash_value(result)])
+                hashes.append(result)
+            else:
+                # All elements are evaluated: pass result to the parent frame
+                stack.pop()
+                result = _hash_list(hashes)
+                if not stack:
+                    return result
+                container, elements, hashes, keys = stack[-1]
+                is_dict = isinstance(container, dict)
+                if is_dict:
+                    result = _hash_list([_hash_value(keys.pop()), _hash_value(result)])
+                hashes.append(result)
+                continue
+            break
 
 
 def config_dhash(obj: Any) -> str:
@@ -48,3 +139,194 @@ def config_dhash(obj: Any) -> str:
                     ).hexdigest()
                 }
     return _eval_config_dhash(config)
+
+
+def config_dhash_many(
+    configs: Iterable[Dict[str, Any]], processes: int = 0, chunksize: int = 256
+) -> Iterator[str]:
+    """
+    Computes :py:func:`config_dhash` for many configs, optionally using
+    a pool of worker processes. Hashes are yielded in the same order
+    as configs.
+
+    Configs are consumed lazily in batches, so huge iterables are processed
+    in bounded memory.
+
+    Sending config to worker process costs about as much as hashing
+    a typical config, so pool pays off only for large corpora and when
+    many CPU cores are available. Pool is not started for a single process
+    or when there are fewer than ``processes * chunksize * 4`` configs:
+    hashes are computed in the current process instead.
+
+    .. versionadded:: 4.7.0
+
+    :param configs: Iterable with configuration dicts
+    :param processes: Number of worker processes. If 0 (default), hashes are
+        computed in the current process.
+    :param chunksize: Number of configs sent to worker process at once
+    :return: Iterator with SHA256 hex digests
+    """
+    if processes < 0:
+        raise ValueError("Number of processes must not be negative")
+    configs_iter = iter(configs)
+    batch_size = processes * chunksize * 4
+    batch = list(itertools.islice(configs_iter, batch_size)) if processes > 1 else []
+    if len(batch) < batch_size or processes <= 1:
+        yield from map(config_dhash, batch)
+        yield from map(config_dhash, configs_iter)
+        return
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        while batch:
+            yield from executor.map(config_dhash, batch, chunksize=chunksize)
+            batch = list(itertools.islice(configs_iter, batch_size))
+
+
+def iter_concurrently(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    workers: int,
+    ordered: bool = True,
+    max_inflight: int = 0,
+) -> Iterator[Tuple[T, "Future[R]"]]:
+    """
+    Calls ``fn`` for each item using a pool of ``workers`` threads and yields
+    ``(item, future)`` pairs with completed futures.
+
+    Items are consumed lazily: at most ``max_inflight`` calls (default: twice the
+    number of workers) are submitted at once, so huge or infinite iterables
+    are processed in bounded memory. Futures left pending when the generator is
+    closed are cancelled.
+
+    :param fn: Function to be called for each item
+    :param items: Iterable with items
+    :param workers: Number of worker threads
+    :param ordered: Yield results in the same order as items (default)
+        or as soon as they are completed
+    :param max_inflight: Maximum number of submitted but not yielded calls
+    """
+    if workers < 1:
+        raise ValueError("Number of workers must be positive")
+    max_inflight = max_inflight or workers * 2
+    items_iter = iter(items)
+    pending: Deque[Tuple[T, "Future[R]"]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < max_inflight:
+                    try:
+                        item = next(items_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending.append((item, executor.submit(fn, item)))
+                if not pending:
+                    return
+                if ordered:
+                    item, future = pending.popleft()
+                    wait([future])
+                    yield item, future
+                else:
+                    done: Set["Future[R]"] = wait(
+                        [future for _, future in pending], return_when=FIRST_COMPLETED
+                    ).done
+                    completed = [entry for entry in pending if entry[1] in done]
+                    for entry in completed:
+                        pending.remove(entry)
+                    for entry in completed:
+                        yield entry
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def iter_prefetched(iterator: Iterator[T], prefetch: int) -> Iterator[T]:
+    """
+    Advances ``iterator`` on a background thread, keeping up to ``prefetch``
+    elements ready ahead of the consumer.
+
+    Exceptions raised by iterator are re-raised in the consumer thread.
+    If consumer stops iteration early, background thread is stopped as well.
+
+    :param iterator: Iterator to be advanced on a background thread
+    :param prefetch: Maximum number of elements fetched ahead
+    """
+    if prefetch < 1:
+        raise ValueError("Number of prefetched elements must be positive")
+    return iter_merged([iterator], ordered=True, buffer=prefetch)
+
+
+def iter_merged(
+    iterators: List[Iterator[T]], ordered: bool = True, buffer: int = 1
+) -> Iterator[T]:
+    """
+    Advances each iterator concurrently on its own background thread and merges
+    their elements into a single iterator.
+
+    If ``ordered`` is set, all elements of the first iterator are yielded first,
+    then elements of the second one and so on. Otherwise, elements are yielded
+    as soon as they are produced. Each iterator keeps at most ``buffer`` elements
+    ahead of the consumer (or all iterators together in unordered mode).
+
+    Exceptions raised by iterators are re-raised in the consumer thread.
+    If consumer stops iteration early, background threads are stopped as well.
+
+    :param iterators: Iterators to be advanced on background threads
+    :param ordered: Preserve order of iterators (default)
+    :param buffer: Maximum number of elements fetched ahead
+    """
+    if buffer < 1:
+        # Queue with maxsize=0 would be unbounded
+        raise ValueError("Buffer size must be positive")
+    stopped = threading.Event()
+    if ordered:
+        buffers: List["queue.Queue[Tuple[bool, Any]]"] = [
+            queue.Queue(maxsize=buffer) for _ in iterators
+        ]
+    else:
+        buffers = [queue.Queue(maxsize=buffer)] * len(iterators)
+
+    def put(target: "queue.Queue[Tuple[bool, Any]]", entry: Tuple[bool, Any]) -> bool:
+        while not stopped.is_set():
+            try:
+                target.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def producer(
+        iterator: Iterator[T], target: "queue.Queue[Tuple[bool, Any]]"
+    ) -> None:
+        try:
+            for element in iterator:
+                if not put(target, (False, element)):
+                    return
+        except BaseException as e:
+            put(target, (True, e))
+            return
+        put(target, (True, None))
+
+    threads = [
+        threading.Thread(target=producer, args=(iterator, target), daemon=True)
+        for iterator, target in zip(iterators, buffers)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        # In unordered mode, all producers share the same queue,
+        # so it needs to be drained until every producer finishes
+        for source in buffers if ordered else buffers[:1]:
+            remaining = 1 if ordered else len(iterators)
+            while remaining:
+                finished, element = source.get()
+                if finished:
+                    if element is not None:
+                        raise element
+                    remaining -= 1
+                    continue
+                yield element
+    finally:
+        stopped.set()
+        for thread in threads:
+            thread.join()
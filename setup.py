@@ -26,7 +26,8 @@ setup(
             "click-default-group",
             "beautifultable>=1.0.0",
             "humanize>=0.5.1",
-        ]
+        ],
+        "arrow": ["pyarrow"],
     },
     entry_points={"console_scripts": ["mwdb = mwdblib.cli:main [cli]"]},
     classifiers=[
@@ -0,0 +1,58 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mwdblib import APIClient
+
+
+class JSONHandler(BaseHTTPRequestHandler):
+    """
+    Base request handler for local test servers
+    """
+
+    def send_json(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class EchoHandler(JSONHandler):
+    """
+    Responds with requested path or HTTP 404 if path ends with '/missing'
+    """
+
+    def do_GET(self):
+        if self.path.endswith("/missing"):
+            self.send_json(404, {"message": "Object not found"})
+        else:
+            self.send_json(200, {"path": self.path})
+
+
+class LocalServerTestCase(unittest.TestCase):
+    """
+    Runs HTTP server with ``handler`` in background thread for each test
+    """
+
+    handler = EchoHandler
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.api_url = f"http://127.0.0.1:{self.server.server_port}/api/"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def make_client(self, **api_options):
+        return APIClient(api_url=self.api_url, config_path=None, **api_options)
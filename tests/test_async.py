@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from benchmarks.fake_mwdb import FakeMWDB, fake_api_key
+from mwdblib import AsyncMWDB
+from mwdblib.testing import RequestCounter
+
+
+class TestAsyncMWDB(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMWDB(files=20).start()
+        self.addCleanup(self.server.stop)
+
+    def make_client(self, **api_options):
+        return AsyncMWDB(
+            api_url=self.server.api_url,
+            api_key=fake_api_key(),
+            config_path=None,
+            **api_options,
+        )
+
+    def test_query_concurrently(self):
+        hashes = [obj["id"] for obj in self.server.objects[:10]] + ["0" * 64]
+
+        async def main():
+            async with self.make_client(max_workers=4) as mwdb:
+                return await asyncio.gather(
+                    *[mwdb.query_file(h, raise_not_found=False) for h in hashes]
+                )
+
+        files = asyncio.run(main())
+        self.assertEqual([f.id for f in files[:-1]], hashes[:-1])
+        self.assertIsNone(files[-1])
+
+    def test_fetch_and_download(self):
+        sample = self.server.objects[0]
+
+        async def main():
+            async with self.make_client() as mwdb:
+                file = await mwdb.query_file(sample["id"])
+                await mwdb.fetch(file, "comments", "attributes")
+                with RequestCounter(mwdb, max_requests=0):
+                    self.assertEqual(file.comments, [])
+                    self.assertEqual(file.attributes, {})
+                return await mwdb.download(file)
+
+        self.assertEqual(asyncio.run(main()), self.server.contents[sample["id"]])
+
+    def test_iterate(self):
+        async def main():
+            async with self.make_client() as mwdb:
+                return [f.id async for f in mwdb.recent_files(chunk_size=5)]
+
+        newest_first = [obj["id"] for obj in self.server.objects[::-1]]
+        self.assertEqual(asyncio.run(main()), newest_first)
+
+    def test_abandoned_iterator(self):
+        closed = threading.Event()
+
+        def generator():
+            try:
+                yield from range(10)
+            finally:
+                closed.set()
+
+        async def main():
+            async with self.make_client() as mwdb:
+                elements = mwdb._iterate(generator())
+                async for _ in elements:
+                    break
+                await elements.aclose()
+                # Blocking generator is closed together with async iterator
+                self.assertTrue(closed.is_set())
+            closed.clear()
+            async with self.make_client() as mwdb:
+                elements = mwdb._iterate(generator())
+                await elements.__anext__()
+            # Iterator finalized after client is closed
+            await elements.aclose()
+            self.assertTrue(closed.is_set())
+
+        asyncio.run(main())
+
+    def test_listen(self):
+        pivot = self.server.objects[-3]["id"]
+
+        async def main():
+            async with self.make_client() as mwdb:
+                return [
+                    obj.id async for obj in mwdb.listen_for_files(pivot, blocking=False)
+                ]
+
+        expected = [obj["id"] for obj in self.server.objects[-2:]]
+        self.assertEqual(asyncio.run(main()), expected)
+
+    def test_concurrency(self):
+        self.server.latency = 0.5
+        hashes = [obj["id"] for obj in self.server.objects] * 2
+
+        async def main():
+            async with self.make_client() as mwdb:
+                self.assertEqual(mwdb.options.pool_maxsize, mwdb.api.max_workers)
+                start = time.monotonic()
+                await asyncio.gather(*[mwdb.query_file(h) for h in hashes])
+                return time.monotonic() - start
+
+        # All 40 requests are in flight at once
+        self.assertLess(asyncio.run(main()), 2.5 * self.server.latency)
@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import unittest
+
+from click.testing import CliRunner
+
+from benchmarks.fake_mwdb import FakeMWDB, fake_api_key
+from mwdblib.cli import main
+
+
+class TestProfile(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMWDB(files=5).start()
+        self.addCleanup(self.server.stop)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.config_path = os.path.join(self.tmpdir.name, "mwdb.cfg")
+        with open(self.config_path, "w") as f:
+            f.write(
+                f"[mwdb:{self.server.api_url}]\n"
+                "use_keyring = 0\n"
+                f"api_key = {fake_api_key()}\n"
+            )
+        self.sample_id = self.server.objects[0]["id"]
+
+    def invoke(self, *args):
+        result = CliRunner().invoke(
+            main,
+            list(args)
+            + ["--api-url", self.server.api_url, "--config-path", self.config_path],
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        return result
+
+    def test_profile(self):
+        result = self.invoke("--profile", "get", self.sample_id)
+        self.assertIn(self.sample_id, result.stdout)
+        self.assertRegex(result.stderr, r"Profile: \d+ requests")
+        self.assertIn("GET object/{hash}", result.stderr)
+
+    def test_trace_file(self):
+        trace_path = os.path.join(self.tmpdir.name, "trace.json")
+        self.invoke("--trace-file", trace_path, "get", self.sample_id)
+        with open(trace_path) as f:
+            trace = json.load(f)
+        events = trace["traceEvents"]
+        self.assertEqual(events[0]["cat"], "command")
+        requests = [event for event in events if event["cat"] == "request"]
+        self.assertEqual(len(requests), self.server.requests)
+        for event in events:
+            self.assertEqual(event["ph"], "X")
+            self.assertIsInstance(event["ts"], (int, float))
+            self.assertGreaterEqual(event["dur"], 0)
+            self.assertIn("pid", event)
+            self.assertIn("tid", event)
+        for event in requests:
+            self.assertEqual(event["args"]["status"], 200)
+            self.assertTrue(event["args"]["url"].startswith(self.server.api_url))
+        self.assertIn("GET object/{hash}", [event["name"] for event in requests])
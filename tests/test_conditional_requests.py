@@ -0,0 +1,51 @@
+import json
+
+from tests.http_server import JSONHandler, LocalServerTestCase
+
+
+class TagsHandler(JSONHandler):
+    def do_GET(self):
+        server = self.server
+        etag = f'"{server.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        server.body_bytes_sent += len(json.dumps(server.tags).encode())
+        self.send_json(200, server.tags, headers={"ETag": etag})
+
+
+class TestConditionalRequests(LocalServerTestCase):
+    handler = TagsHandler
+
+    def setUp(self):
+        super().setUp()
+        self.server.version = 1
+        self.server.tags = [{"tag": f"tag:{i}"} for i in range(100)]
+        self.server.body_bytes_sent = 0
+        self.api = self.make_client(conditional_cache_size=16)
+
+    def test_not_modified(self):
+        first = self.api.get("object/abc/tag", noauth=True)
+        body_size = self.server.body_bytes_sent
+        for _ in range(5):
+            self.assertEqual(self.api.get("object/abc/tag", noauth=True), first)
+        self.assertEqual(self.server.body_bytes_sent, body_size)
+        stats = self.api.conditional_cache.stats()
+        self.assertEqual(stats["not_modified"], 5)
+        self.assertEqual(stats["bytes_saved"], 5 * body_size)
+
+    def test_modified(self):
+        self.api.get("object/abc/tag", noauth=True)
+        self.server.version = 2
+        self.server.tags = [{"tag": "new"}]
+        self.assertEqual(self.api.get("object/abc/tag", noauth=True), [{"tag": "new"}])
+        self.assertEqual(self.api.conditional_cache.stats()["not_modified"], 0)
+
+    def test_raw_not_cached(self):
+        self.api.get("file/abc/download", noauth=True, raw=True)
+        self.api.get("file/abc/download", noauth=True, raw=True)
+        body_size = len(json.dumps(self.server.tags).encode())
+        self.assertEqual(self.server.body_bytes_sent, 2 * body_size)
+        self.assertEqual(self.api.conditional_cache.stats()["size"], 0)
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+
+from benchmarks.fake_mwdb import FakeMWDB, fake_api_key
+from mwdblib import MWDB, APIClient, config_dhash
+from mwdblib.api import SQLiteConfigIndex
+from mwdblib.exc import ObjectNotFoundError
+
+CONFIG = {"urls": [f"http://example.com/{n}" for n in range(100)], "key": "secret"}
+
+
+class RecordingAPIClient(APIClient):
+    def __init__(self, **api_options):
+        super().__init__(config_path=None, **api_options)
+        self.requests = []
+        self.objects = set()
+
+    def request(self, method, url, *args, **kwargs):
+        self.requests.append((method, url, kwargs.get("json")))
+        if method == "post" and url == "config":
+            dhash = config_dhash(kwargs["json"]["cfg"])
+            self.objects.add(dhash)
+            return {"id": dhash, "type": "static_config"}
+        if method == "get" and url.startswith("config/"):
+            if url.split("/")[1] not in self.objects:
+                raise ObjectNotFoundError("Object not found")
+            return {"id": url.split("/")[1], "type": "static_config"}
+        if url.startswith("object/"):
+            # object/<id>/tag or object/<parent>/child/<child>
+            if any(object_id not in self.objects for object_id in url.split("/")[1::2]):
+                raise ObjectNotFoundError("Object not found")
+        return {}
+
+
+class TestConfigIndex(unittest.TestCase):
+    def test_skip_indexed_config(self):
+        api = RecordingAPIClient(config_index_size=10)
+        mwdb = MWDB(api=api)
+        config = mwdb.upload_config("evil", CONFIG)
+        api.objects.add("a" * 64)
+        api.requests.clear()
+        same_config = mwdb.upload_config(
+            "evil", dict(CONFIG), parent="a" * 64, tags=["ripped:evil"]
+        )
+        self.assertEqual(same_config.id, config.id)
+        self.assertEqual(same_config.data["type"], "static_config")
+        self.assertEqual(
+            api.requests,
+            [
+                ("put", f"object/{'a' * 64}/child/{config.id}", None),
+                ("put", f"object/{config.id}/tag", {"tag": "ripped:evil"}),
+            ],
+        )
+        self.assertEqual(api.config_index.stats()["hits"], 1)
+        # Options applied only during upload require sending configuration
+        api.requests.clear()
+        mwdb.upload_config("evil", CONFIG, public=True)
+        self.assertEqual(
+            [request[:2] for request in api.requests], [("post", "config")]
+        )
+
+    def test_removed_config(self):
+        api = RecordingAPIClient(config_index_size=10)
+        mwdb = MWDB(api=api)
+        mwdb.upload_config("evil", CONFIG)
+        api.objects.clear()
+        api.requests.clear()
+        mwdb.upload_config("evil", CONFIG, tags=["ripped:evil"])
+        self.assertEqual(
+            [request[:2] for request in api.requests],
+            [
+                ("put", f"object/{config_dhash(CONFIG)}/tag"),
+                ("get", f"config/{config_dhash(CONFIG)}"),
+                ("post", "config"),
+            ],
+        )
+
+    def test_missing_parent(self):
+        api = RecordingAPIClient(config_index_size=10)
+        mwdb = MWDB(api=api)
+        mwdb.upload_config("evil", CONFIG)
+        with self.assertRaises(ObjectNotFoundError):
+            mwdb.upload_config("evil", CONFIG, parent="a" * 64)
+        # Index entry of existing configuration is kept
+        self.assertEqual(
+            api.config_index.get(config_dhash(CONFIG)), config_dhash(CONFIG)
+        )
+        self.assertNotIn("post", [request[0] for request in api.requests[1:]])
+
+    def test_persistent_index(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "configs.sqlite")
+            api = RecordingAPIClient(config_index_path=path)
+            MWDB(api=api).upload_config("evil", CONFIG)
+            api.config_index.close()
+
+            other_api = RecordingAPIClient(config_index_path=path)
+            other_api.objects = api.objects
+            MWDB(api=other_api).upload_config("evil", CONFIG)
+            # Indexed configuration is only checked for existence
+            self.assertEqual(
+                other_api.requests, [("get", f"config/{config_dhash(CONFIG)}", None)]
+            )
+            other_api.config_index.close()
+
+            index = SQLiteConfigIndex(path, namespace="http://other.example.com/api/")
+            self.assertIsNone(index.get(config_dhash(CONFIG)))
+            index.close()
+
+
+class TestConfigIndexFakeMWDB(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMWDB(files=0).start()
+        self.addCleanup(self.server.stop)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def make_client(self):
+        mwdb = MWDB(
+            api_url=self.server.api_url,
+            api_key=fake_api_key(),
+            config_path=None,
+            config_index_path=os.path.join(self.tmpdir.name, "configs.sqlite"),
+        )
+        self.addCleanup(mwdb.api.config_index.close)
+        return mwdb
+
+    def test_removed_between_uploads(self):
+        config = self.make_client().upload_config("evil", CONFIG)
+        mwdb = self.make_client()
+        mwdb.query_config(config.id).remove()
+        self.assertNotIn(config.id, self.server.objects_by_id)
+        requests = self.server.requests
+        uploaded = mwdb.upload_config("evil", CONFIG)
+        # Existence check, then upload
+        self.assertEqual(self.server.requests, requests + 2)
+        # Stale index entry doesn't prevent upload
+        self.assertEqual(uploaded.id, config.id)
+        self.assertIn(config.id, self.server.objects_by_id)
+        requests = self.server.requests
+        self.assertEqual(mwdb.upload_config("evil", CONFIG).family, "evil")
+        self.assertEqual(self.server.requests, requests + 1)
@@ -0,0 +1,89 @@
+import tempfile
+import time
+import unittest
+
+from benchmarks.fake_mwdb import FakeMWDB, fake_api_key
+from mwdblib import MWDB, MWDBObject
+from mwdblib.api import DiskCache
+from mwdblib.exc import IntegrityError
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_lru_eviction(self):
+        cache = DiskCache(self.tmpdir.name, max_size=10)
+        self.addCleanup(cache.close)
+        cache.put("a", b"aaaa")
+        time.sleep(0.01)
+        cache.put("b", b"bbbb")
+        time.sleep(0.01)
+        self.assertEqual(cache.get("a"), b"aaaa")
+        time.sleep(0.01)
+        cache.put("c", b"cccc")
+        # Least recently used entry is evicted
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.get("a"), b"aaaa")
+        self.assertEqual(cache.get("c"), b"cccc")
+        self.assertEqual(cache.size, 8)
+        # Entries larger than cache are not stored
+        cache.put("d", b"d" * 11)
+        self.assertNotIn("d", cache)
+
+
+class TestDiskCachedObjects(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMWDB(files=2).start()
+        self.addCleanup(self.server.stop)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.sample = self.server.objects[0]
+
+    def make_client(self):
+        mwdb = MWDB(
+            api_url=self.server.api_url,
+            api_key=fake_api_key(),
+            config_path=None,
+            cache_dir=self.tmpdir.name,
+        )
+        self.addCleanup(mwdb.api.disk_cache.close)
+        return mwdb
+
+    def lazy_file(self, mwdb):
+        return MWDBObject.create(mwdb.api, {"id": self.sample["id"], "type": "file"})
+
+    def test_immutable_fields(self):
+        # Object details loaded from server are stored in disk cache
+        self.assertEqual(self.lazy_file(self.make_client()).md5, self.sample["md5"])
+        file = self.lazy_file(self.make_client())
+        requests = self.server.requests
+        self.assertEqual(file.md5, self.sample["md5"])
+        self.assertEqual(file.file_name, self.sample["file_name"])
+        self.assertEqual(self.server.requests, requests)
+        # Mutable fields are always fetched from server
+        self.assertEqual(file.tags, [tag["tag"] for tag in self.sample["tags"]])
+        self.assertEqual(self.server.requests, requests + 1)
+
+    def test_verified_contents(self):
+        content = self.server.contents[self.sample["id"]]
+        self.assertEqual(
+            self.make_client().query_file(self.sample["id"]).download(), content
+        )
+        file = self.make_client().query_file(self.sample["id"])
+        requests = self.server.requests
+        self.assertEqual(file.download(), content)
+        self.assertEqual(b"".join(file.iter_content(chunk_size=100)), content)
+        self.assertEqual(self.server.requests, requests)
+
+    def test_tampered_contents(self):
+        tampered = self.server.objects[1]["id"]
+        self.server.contents[tampered] = b"tampered"
+        mwdb = self.make_client()
+        file = mwdb.query_file(tampered)
+        self.assertEqual(file.download(), b"tampered")
+        self.assertNotIn(file._content_cache_key(), mwdb.api.disk_cache)
+        with self.assertRaises(IntegrityError):
+            list(file.iter_content())
+        self.assertNotIn(file._content_cache_key(), mwdb.api.disk_cache)
@@ -0,0 +1,90 @@
+import io
+import os
+import tempfile
+import unittest
+
+from click.testing import CliRunner
+
+from benchmarks.fake_mwdb import FakeMWDB, fake_api_key
+from mwdblib import MWDB
+from mwdblib.cli import main
+from mwdblib.exc import IntegrityError
+
+
+class TestDownload(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMWDB(files=2, file_size=1000).start()
+        self.addCleanup(self.server.stop)
+        self.mwdb = MWDB(
+            api_url=self.server.api_url, api_key=fake_api_key(), config_path=None
+        )
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.sample_id = self.server.objects[0]["id"]
+        self.content = self.server.contents[self.sample_id]
+
+    def tamper(self):
+        self.server.contents[self.sample_id] = b"tampered" * 100
+
+    def test_iter_content(self):
+        file = self.mwdb.query_file(self.sample_id)
+        chunks = list(file.iter_content(chunk_size=256))
+        self.assertEqual([len(chunk) for chunk in chunks], [256, 256, 256, 232])
+        self.assertEqual(b"".join(chunks), self.content)
+
+    def test_iter_content_integrity_error(self):
+        file = self.mwdb.query_file(self.sample_id)
+        self.tamper()
+        chunks = []
+        with self.assertRaises(IntegrityError):
+            for chunk in file.iter_content(chunk_size=256):
+                chunks.append(chunk)
+        # Error is raised after the last chunk
+        self.assertEqual(b"".join(chunks), b"tampered" * 100)
+
+    def test_download_to(self):
+        file = self.mwdb.query_file(self.sample_id)
+        path = os.path.join(self.tmpdir.name, "sample")
+        self.assertEqual(file.download_to(path, chunk_size=256), len(self.content))
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), self.content)
+        target = io.BytesIO()
+        self.assertEqual(file.download_to(target), len(self.content))
+        self.assertEqual(target.getvalue(), self.content)
+
+    def test_download_to_removes_partial_file(self):
+        file = self.mwdb.query_file(self.sample_id)
+        self.tamper()
+        path = os.path.join(self.tmpdir.name, "sample")
+        with self.assertRaises(IntegrityError):
+            file.download_to(path, chunk_size=256)
+        self.assertFalse(os.path.exists(path))
+
+    def test_fetch_command_removes_partial_file(self):
+        config_path = os.path.join(self.tmpdir.name, "mwdb.cfg")
+        with open(config_path, "w") as f:
+            f.write(
+                f"[mwdb:{self.server.api_url}]\n"
+                "use_keyring = 0\n"
+                f"api_key = {fake_api_key()}\n"
+            )
+        path = os.path.join(self.tmpdir.name, "sample")
+        args = [
+            "fetch",
+            self.sample_id,
+            path,
+            "--api-url",
+            self.server.api_url,
+            "--config-path",
+            config_path,
+        ]
+        result = CliRunner().invoke(main, args)
+        self.assertEqual(result.exit_code, 0, result.output)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), self.content)
+        os.remove(path)
+        self.tamper()
+        result = CliRunner().invoke(main, args)
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("IntegrityError", result.output)
+        self.assertFalse(os.path.exists(path))
@@ -0,0 +1,126 @@
+import datetime
+import io
+import os
+import tempfile
+import unittest
+
+from benchmarks.fake_mwdb import FakeMWDB, fake_api_key
+from mwdblib import MWDB
+from mwdblib.export import export_table
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+ENTRIES = [
+    {
+        "id": "%064x" % index,
+        "type": "file",
+        "tags": [{"tag": "a"}, {"tag": "b"}],
+        "upload_time": "2023-01-01T12:00:00+00:00",
+        "file_name": f"sample-{index}.bin",
+        "file_size": index,
+    }
+    for index in range(5)
+]
+
+
+class TestExport(unittest.TestCase):
+    def test_csv(self):
+        output = io.StringIO()
+        rows = export_table(
+            iter([ENTRIES[:3], ENTRIES[3:]]),
+            columns=["sha256", "file_size", "tags", "md5"],
+            format="csv",
+            path=output,
+            batch_size=2,
+        )
+        self.assertEqual(rows, 5)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], "sha256,file_size,tags,md5")
+        self.assertEqual(lines[2], '%064x,1,"a,b",' % 1)
+        self.assertEqual(len(lines), 6)
+
+    def test_unknown_column(self):
+        with self.assertRaises(ValueError):
+            export_table(
+                iter([]), ["cfg"], format="csv", path=io.StringIO(), batch_size=1
+            )
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestArrowExport(unittest.TestCase):
+    columns = ["sha256", "md5", "file_size", "tags", "upload_time", "file_name"]
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def export(self, format, path=None):
+        return export_table(
+            iter([ENTRIES[:3], ENTRIES[3:]]),
+            columns=self.columns,
+            format=format,
+            path=path,
+            batch_size=2,
+        )
+
+    def check_table(self, table):
+        self.assertEqual(
+            table.schema,
+            pyarrow.schema(
+                [
+                    ("sha256", pyarrow.binary(32)),
+                    ("md5", pyarrow.binary(16)),
+                    ("file_size", pyarrow.int64()),
+                    ("tags", pyarrow.list_(pyarrow.string())),
+                    ("upload_time", pyarrow.timestamp("us", tz="UTC")),
+                    ("file_name", pyarrow.string()),
+                ]
+            ),
+        )
+        rows = table.to_pylist()
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[1]["sha256"], bytes.fromhex("%064x" % 1))
+        self.assertIsNone(rows[1]["md5"])
+        self.assertEqual(rows[1]["file_size"], 1)
+        self.assertEqual(rows[1]["tags"], ["a", "b"])
+        self.assertEqual(
+            rows[1]["upload_time"],
+            datetime.datetime(2023, 1, 1, 12, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(rows[1]["file_name"], "sample-1.bin")
+
+    def test_table(self):
+        self.check_table(self.export("arrow"))
+
+    def test_arrow_file(self):
+        path = os.path.join(self.tmpdir.name, "export.arrow")
+        self.assertEqual(self.export("arrow", path), 5)
+        with pyarrow.memory_map(path) as source:
+            table = pyarrow.ipc.open_file(source).read_all()
+        self.assertEqual(table.to_batches()[0].num_rows, 2)
+        self.check_table(table)
+
+    def test_parquet_file(self):
+        path = os.path.join(self.tmpdir.name, "export.parquet")
+        self.assertEqual(self.export("parquet", path), 5)
+        self.check_table(pyarrow.parquet.read_table(path))
+
+    def test_search_to_table(self):
+        with FakeMWDB(files=25) as server:
+            mwdb = MWDB(
+                api_url=server.api_url, api_key=fake_api_key(), config_path=None
+            )
+            table = mwdb.search_to_table(None, columns=["id", "file_size"])
+            # Fake server doesn't list blobs
+            empty = mwdb.search_to_table(None, columns=["id"], object_type="blob")
+        self.assertEqual(table.num_rows, 25)
+        self.assertEqual(
+            table.column("id").to_pylist(),
+            [bytes.fromhex(obj["id"]) for obj in server.objects[::-1]],
+        )
+        self.assertEqual(empty.num_rows, 0)
+        self.assertEqual(empty.schema.field("id").type, pyarrow.binary(32))
@@ -0,0 +1,47 @@
+import unittest
+
+from mwdblib.api import MetricsCollector
+from mwdblib.api.hooks import endpoint_name
+from mwdblib.exc import ObjectNotFoundError
+from tests.http_server import LocalServerTestCase
+
+SHA256 = "a" * 64
+
+
+class TestEndpointName(unittest.TestCase):
+    def test_endpoint_name(self):
+        self.assertEqual(
+            endpoint_name(f"object/{SHA256}/comment/12?x=1"),
+            "object/{hash}/comment/{id}",
+        )
+        self.assertEqual(endpoint_name("file"), "file")
+
+
+class TestMetricsCollector(LocalServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.api = self.make_client()
+        self.metrics = MetricsCollector()
+        self.api.add_hooks(self.metrics)
+
+    def test_metrics(self):
+        for sha256 in ["a" * 64, "b" * 64]:
+            self.api.get(f"object/{sha256}/tag", noauth=True)
+        with self.assertRaises(ObjectNotFoundError):
+            self.api.get("object/missing", noauth=True)
+        metrics = {
+            entry["endpoint"]: entry for entry in self.metrics.to_dict()["endpoints"]
+        }
+        self.assertEqual(metrics["object/{hash}/tag"]["count"], 2)
+        self.assertEqual(metrics["object/{hash}/tag"]["errors"], 0)
+        self.assertGreater(metrics["object/{hash}/tag"]["bytes_in"], 0)
+        self.assertEqual(metrics["object/missing"]["errors"], 1)
+        prometheus = self.metrics.to_prometheus()
+        self.assertIn(
+            'mwdblib_request_duration_seconds_count{method="GET",'
+            'endpoint="object/{hash}/tag"} 2',
+            prometheus,
+        )
+        self.api.remove_hooks(self.metrics)
+        self.api.get("object/missing/x", noauth=True)
+        self.assertEqual(len(self.metrics.to_dict()["endpoints"]), 2)
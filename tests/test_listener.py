@@ -0,0 +1,183 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from itertools import islice
+
+from mwdblib import MWDB, APIClient, Checkpoint, FileCheckpointStore, ListenerEngine
+from mwdblib.listener import AdaptiveInterval, ListenerCursor
+
+
+def entry(index, upload_time=None):
+    return {
+        "id": "%064x" % index,
+        "type": "file",
+        "upload_time": upload_time or "2023-01-01T00:00:%02d+00:00" % index,
+    }
+
+
+class ListingMWDB(MWDB):
+    def __init__(self, objects):
+        super().__init__(api=APIClient(config_path=None))
+        # Objects ordered from the oldest one
+        self.objects = objects
+        self.requests = 0
+        # Listing of these queries waits until event is set
+        self.blocked_queries = {}
+
+    def _listing_pages(self, url_type, query=None, chunk_size=None):
+        if query in self.blocked_queries:
+            self.blocked_queries[query].wait()
+        chunk_size = chunk_size or 2
+        objects = self.objects[::-1]
+        for offset in range(0, len(objects), chunk_size):
+            self.requests += 1
+            yield objects[offset : offset + chunk_size]
+
+
+class TestListenerCursor(unittest.TestCase):
+    def test_poll(self):
+        mwdb = ListingMWDB([entry(index) for index in range(3)])
+        cursor = ListenerCursor(mwdb)
+        cursor.start()
+        self.assertEqual(cursor.poll(), [])
+        mwdb.objects += [entry(3), entry(4, upload_time=entry(3)["upload_time"])]
+        mwdb.requests = 0
+        self.assertEqual(
+            [obj.id for obj in cursor.poll()], [entry(3)["id"], entry(4)["id"]]
+        )
+        self.assertEqual(mwdb.requests, 2)
+        # Removed objects don't break the cursor
+        del mwdb.objects[3:]
+        mwdb.objects.append(entry(5))
+        self.assertEqual([obj.id for obj in cursor.poll()], [entry(5)["id"]])
+
+    def test_lazy_listener(self):
+        mwdb = ListingMWDB([entry(index) for index in range(3)])
+        listener = mwdb.listen_for_objects(last_object="missing", blocking=False)
+        # Cursor is started when the first object is requested
+        self.assertEqual(mwdb.requests, 0)
+        listener = mwdb.listen_for_objects(blocking=False)
+        mwdb.objects.append(entry(3))
+        self.assertEqual(mwdb.requests, 0)
+        # Listener starts from the newest object at the time of the first poll
+        self.assertEqual(list(listener), [])
+        self.assertEqual(mwdb.requests, 2)
+        with self.assertRaises(TypeError):
+            next(mwdb.listen_for_objects(last_object=3))
+
+    def test_adaptive_interval(self):
+        interval = AdaptiveInterval(1, 8)
+        self.assertEqual([interval.update(0) for _ in range(4)], [2, 4, 8, 8])
+        self.assertEqual(interval.update(3), 1)
+
+
+class TestCheckpoint(unittest.TestCase):
+    def test_resume(self):
+        mwdb = ListingMWDB([entry(index) for index in range(3)])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = FileCheckpointStore(os.path.join(tmpdir, "checkpoint.json"))
+
+            def listen():
+                checkpoint = Checkpoint(store, "test", commit_every=1)
+                return mwdb.listen_for_objects(blocking=False, checkpoint=checkpoint)
+
+            self.assertEqual(list(listen()), [])
+            mwdb.objects += [entry(index) for index in range(3, 6)]
+            processed = [obj.id for obj in islice(listen(), 2)]
+            self.assertEqual(processed, [entry(3)["id"], entry(4)["id"]])
+            # Last delivered object wasn't acknowledged, so it's delivered again
+            resumed = [obj.id for obj in listen()]
+            self.assertEqual(resumed, [entry(4)["id"], entry(5)["id"]])
+            self.assertEqual(list(listen()), [])
+
+    def test_process_stream(self):
+        mwdb = ListingMWDB([entry(0)])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = FileCheckpointStore(os.path.join(tmpdir, "checkpoint.json"))
+            checkpoint = Checkpoint(store, "test")
+            list(mwdb.listen_for_objects(blocking=False, checkpoint=checkpoint))
+            mwdb.objects += [entry(index) for index in range(1, 9)]
+
+            def handler(obj):
+                if obj.id == entry(3)["id"]:
+                    raise ValueError(obj.id)
+                return obj.id
+
+            listener = mwdb.listen_for_objects(blocking=False, checkpoint=checkpoint)
+            results = list(mwdb.process_stream(listener, handler, workers=4))
+            self.assertEqual(
+                [result.object.id for result in results],
+                [entry(index)["id"] for index in range(1, 9)],
+            )
+            self.assertIsInstance(results[2].error, ValueError)
+            self.assertEqual(results[0].result, entry(1)["id"])
+            # Checkpoint is held before the first failed object
+            self.assertEqual(store.load("test")["ids"], [entry(2)["id"]])
+            listener = mwdb.listen_for_objects(blocking=False, checkpoint=checkpoint)
+            results = list(
+                mwdb.process_stream(listener, handler, workers=4, ack_failed=True)
+            )
+            self.assertEqual(
+                [result.object.id for result in results],
+                [entry(index)["id"] for index in range(3, 9)],
+            )
+            self.assertIsInstance(results[0].error, ValueError)
+            # Failed objects are acknowledged as well
+            self.assertEqual(store.load("test")["ids"], [entry(8)["id"]])
+
+    def test_close_process_stream(self):
+        mwdb = ListingMWDB([entry(0)])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = FileCheckpointStore(os.path.join(tmpdir, "checkpoint.json"))
+            checkpoint = Checkpoint(store, "test")
+            list(mwdb.listen_for_objects(blocking=False, checkpoint=checkpoint))
+            mwdb.objects += [entry(index) for index in range(1, 4)]
+            listener = mwdb.listen_for_objects(interval=60, checkpoint=checkpoint)
+            stream = mwdb.process_stream(listener, lambda obj: obj.id, workers=2)
+            results = [next(stream).object.id for _ in range(3)]
+            self.assertEqual(results, [entry(index)["id"] for index in range(1, 4)])
+            start = time.monotonic()
+            # Listener waiting for new objects is interrupted
+            stream.close()
+            self.assertLess(time.monotonic() - start, 5)
+            requests = mwdb.requests
+            mwdb.objects.append(entry(4))
+            time.sleep(0.1)
+            self.assertEqual(mwdb.requests, requests)
+            self.assertEqual(store.load("test")["ids"], [entry(3)["id"]])
+            self.assertRaises(StopIteration, next, listener)
+
+
+class TestListenerEngine(unittest.TestCase):
+    def test_slow_poll(self):
+        mwdb = ListingMWDB([entry(0)])
+        with ListenerEngine(mwdb, min_interval=0.01, max_interval=0.01) as engine:
+            slow = engine.subscribe(query="slow")
+            fast = engine.subscribe(query="fast")
+            unblock = threading.Event()
+            mwdb.blocked_queries["slow"] = unblock
+            # Let the slow subscription occupy a worker
+            time.sleep(0.05)
+            mwdb.objects.append(entry(1))
+            deadline = time.monotonic() + 5
+            try:
+                while fast.queue.empty() and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                self.assertFalse(fast.queue.empty())
+            finally:
+                unblock.set()
+            self.assertEqual(next(fast).id, entry(1)["id"])
+            self.assertEqual(next(slow).id, entry(1)["id"])
+
+    def test_close_subscription_stream(self):
+        mwdb = ListingMWDB([entry(0)])
+        with ListenerEngine(mwdb, min_interval=0.01, max_interval=0.01) as engine:
+            subscription = engine.subscribe()
+            mwdb.objects.append(entry(1))
+            stream = mwdb.process_stream(subscription, lambda obj: obj.id)
+            self.assertEqual(next(stream).result, entry(1)["id"])
+            stream.close()
+            self.assertTrue(subscription.closed)
+            self.assertEqual(engine.subscriptions, set())
@@ -12,3 +12,5 @@ class TestPublicApi(unittest.TestCase):
         from mwdblib import MWDBObject  # noqa
         from mwdblib import MWDBConfig  # noqa
         from mwdblib import MWDBBlob  # noqa
+        from mwdblib import AsyncMWDB  # noqa
+        from mwdblib import AsyncAPIClient  # noqa
@@ -0,0 +1,69 @@
+import time
+import unittest
+
+from benchmarks.fake_mwdb import FakeMWDB, fake_api_key
+from mwdblib import MWDB
+
+
+class TestObjectCache(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMWDB(files=3).start()
+        self.ids = [obj["id"] for obj in self.server.objects]
+
+    def tearDown(self):
+        self.server.stop()
+
+    def make_client(self, **api_options):
+        return MWDB(
+            api_url=self.server.api_url,
+            api_key=fake_api_key(),
+            config_path=None,
+            **api_options,
+        )
+
+    def test_identity(self):
+        mwdb = self.make_client(object_cache_size=10)
+        listed = {file.id: file for file in mwdb.recent_files()}
+        queried = mwdb.query_file(self.ids[0])
+        self.assertIs(queried, listed[self.ids[0]])
+        self.assertEqual(mwdb.object_cache.stats()["hits"], 1)
+        # Lazy-loaded properties are fetched once for all references
+        self.assertEqual(queried.comments, [])
+        requests = self.server.requests
+        self.assertEqual(listed[self.ids[0]].comments, [])
+        self.assertEqual(self.server.requests, requests)
+
+    def test_disabled(self):
+        mwdb = self.make_client()
+        self.assertIsNone(mwdb.object_cache)
+        self.assertIsNot(mwdb.query_file(self.ids[0]), mwdb.query_file(self.ids[0]))
+
+    def test_eviction(self):
+        mwdb = self.make_client(object_cache_size=1)
+        first = mwdb.query_file(self.ids[0])
+        # Loading another object evicts the least recently used one
+        mwdb.query_file(self.ids[1])
+        self.assertEqual(mwdb.object_cache.stats()["evictions"], 1)
+        cached = mwdb.query_file(self.ids[0])
+        self.assertIsNot(cached, first)
+        # Modification of outdated instance evicts the cached one
+        first.add_tag("modified")
+        self.assertEqual(len(mwdb.object_cache), 0)
+        refreshed = mwdb.query_file(self.ids[0])
+        self.assertIsNot(refreshed, cached)
+        self.assertIn("modified", refreshed.tags)
+        # Modification of cached instance expires its own fields only
+        refreshed.add_tag("again")
+        self.assertIs(mwdb.query_file(self.ids[0]), refreshed)
+        self.assertIn("again", refreshed.tags)
+        # Flushed outdated instance evicts cached one as well
+        cached.flush()
+        self.assertIsNot(mwdb.query_file(self.ids[0]), refreshed)
+
+    def test_ttl(self):
+        mwdb = self.make_client(object_cache_size=10, object_cache_ttl=0.05)
+        first = mwdb.query_file(self.ids[0])
+        self.assertIs(mwdb.query_file(self.ids[0]), first)
+        time.sleep(0.1)
+        self.assertIsNot(mwdb.query_file(self.ids[0]), first)
+        self.assertEqual(mwdb.object_cache.stats()["evictions"], 1)
@@ -0,0 +1,95 @@
+import os
+import socket
+import tempfile
+import unittest
+
+from mwdblib import APIClient
+from mwdblib.api.adapter import APIClientAdapter
+from mwdblib.api.options import APIClientOptions
+from tests.http_server import LocalServerTestCase
+
+
+class TestOptionsParsing(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.config_path = os.path.join(self.tmpdir.name, "mwdb.cfg")
+
+    def test_config_file(self):
+        with open(self.config_path, "w") as f:
+            f.write(
+                "[mwdb]\n"
+                "use_keyring = 0\n"
+                "connect_timeout = 3\n"
+                "read_timeout = 2.5\n"
+                "pool_maxsize = 20\n"
+                "pool_block = yes\n"
+                "[mwdb:https://mwdb.cert.pl/api/]\n"
+                "tcp_keepalive = true\n"
+            )
+        options = APIClientOptions(config_path=self.config_path)
+        self.assertEqual(options.connect_timeout, 3.0)
+        self.assertIs(type(options.connect_timeout), float)
+        self.assertEqual(options.read_timeout, 2.5)
+        self.assertEqual(options.pool_maxsize, 20)
+        self.assertIs(options.pool_block, True)
+        self.assertIs(options.tcp_keepalive, True)
+        # Defaults
+        self.assertEqual(options.pool_connections, 10)
+
+    def test_arguments(self):
+        options = APIClientOptions(config_path=None, read_timeout=5, pool_maxsize=4)
+        self.assertIs(type(options.read_timeout), float)
+        self.assertEqual(options.read_timeout, 5.0)
+        self.assertIsNone(options.connect_timeout)
+        self.assertEqual(options.pool_maxsize, 4)
+        with self.assertRaises(TypeError):
+            APIClientOptions(config_path=None, read_timeout="5")
+        with self.assertRaises(TypeError):
+            APIClientOptions(config_path=None, pool_maxsize=4.0)
+
+
+class TestAdapter(unittest.TestCase):
+    def test_mounted(self):
+        api = APIClient(config_path=None, pool_maxsize=4, pool_block=True)
+        for url in ("http://127.0.0.1/api/", "https://mwdb.cert.pl/api/"):
+            self.assertIsInstance(api.session.get_adapter(url), APIClientAdapter)
+        adapter = api.session.get_adapter(api.options.api_url)
+        pool_kw = adapter.poolmanager.connection_pool_kw
+        self.assertEqual(pool_kw["maxsize"], 4)
+        self.assertIs(pool_kw["block"], True)
+        self.assertNotIn("socket_options", pool_kw)
+
+    def test_tcp_keepalive(self):
+        api = APIClient(config_path=None, tcp_keepalive=True)
+        adapter = api.session.get_adapter(api.options.api_url)
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), socket_options)
+        # Default options (e.g. TCP_NODELAY) are kept
+        self.assertIn((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1), socket_options)
+
+
+class TestTimeouts(LocalServerTestCase):
+    def capture_timeouts(self, api):
+        timeouts = []
+        request = api.session.request
+
+        def capturing_request(*args, **kwargs):
+            timeouts.append(kwargs.get("timeout"))
+            return request(*args, **kwargs)
+
+        api.session.request = capturing_request
+        return timeouts
+
+    def test_configured_timeouts(self):
+        api = self.make_client(connect_timeout=2, read_timeout=5.5)
+        timeouts = self.capture_timeouts(api)
+        api.get("file", noauth=True)
+        api.get("file", noauth=True, timeout=1)
+        self.assertEqual(timeouts, [(2.0, 5.5), 1])
+
+    def test_no_timeouts(self):
+        api = self.make_client()
+        timeouts = self.capture_timeouts(api)
+        api.get("file", noauth=True)
+        self.assertEqual(timeouts, [None])
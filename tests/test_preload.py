@@ -0,0 +1,67 @@
+import unittest
+from itertools import islice
+
+from benchmarks.fake_mwdb import FakeMWDB, fake_api_key
+from mwdblib import MWDB, MWDBObject
+from mwdblib.object import preload_fields
+from mwdblib.testing import RequestCounter
+
+
+class TestPreloadFields(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMWDB(files=20).start()
+        self.addCleanup(self.server.stop)
+        self.mwdb = MWDB(
+            api_url=self.server.api_url, api_key=fake_api_key(), config_path=None
+        )
+        # Fetch server version before requests are counted
+        self.mwdb.api.server_version
+
+    def test_recent_include(self):
+        include = ("tags", "comments", "attributes")
+        with RequestCounter(self.mwdb) as counter:
+            files = list(
+                islice(self.mwdb.recent_files(chunk_size=5, include=include), 10)
+            )
+        self.assertEqual(counter.count("GET file"), 2)
+        # Tags are already included in listing
+        self.assertEqual(counter.count("object/*/tag"), 0)
+        self.assertEqual(counter.count("GET object/*/comment"), 10)
+        self.assertEqual(counter.count("GET object/*/attribute"), 10)
+        self.assertEqual(counter.total, 22)
+        with RequestCounter(self.mwdb, max_requests=0):
+            for file in files:
+                self.assertEqual(file.comments, [])
+                self.assertEqual(file.attributes, {})
+                self.assertIn("bench", file.tags)
+
+    def test_query_include(self):
+        sample_id = self.server.objects[0]["id"]
+        with RequestCounter(self.mwdb) as counter:
+            file = self.mwdb.query_file(sample_id, include=("comments", "shares"))
+        self.assertEqual(counter.total, 3)
+        with RequestCounter(self.mwdb, max_requests=0):
+            self.assertEqual(file.comments, [])
+            self.assertEqual(file.shares, [])
+
+    def test_preload_fields(self):
+        parent_id, child_id = (obj["id"] for obj in self.server.objects[:2])
+        self.server.relations.add((parent_id, child_id))
+        objects = [
+            MWDBObject.create(self.mwdb.api, {"id": obj["id"], "type": "file"})
+            for obj in self.server.objects[:5]
+        ]
+        with RequestCounter(self.mwdb) as counter:
+            preload_fields(objects, ("parents", "children"))
+        # Parents and children are loaded by the same request
+        self.assertEqual(counter.count("GET file/*"), 5)
+        self.assertEqual(counter.total, 5)
+        with RequestCounter(self.mwdb, max_requests=0):
+            self.assertEqual([obj.id for obj in objects[0].children], [child_id])
+            self.assertEqual([obj.id for obj in objects[1].parents], [parent_id])
+            # Fields that are already loaded don't trigger any request
+            preload_fields(objects, ("parents", "tags"))
+
+    def test_preload_unknown_field(self):
+        with self.assertRaises(ValueError):
+            preload_fields([], ("metakeys",))
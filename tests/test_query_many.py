@@ -0,0 +1,49 @@
+import time
+import unittest
+
+from benchmarks.fake_mwdb import FakeMWDB, fake_api_key
+from mwdblib import MWDB, MWDBConfig, MWDBFile
+
+MISSING = "0" * 64
+
+
+class TestQueryMany(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMWDB(files=10, latency=0.05).start()
+        self.addCleanup(self.server.stop)
+        self.mwdb = MWDB(
+            api_url=self.server.api_url, api_key=fake_api_key(), config_path=None
+        )
+        self.hashes = [obj["id"] for obj in self.server.objects]
+        self.hashes.insert(3, MISSING)
+
+    def test_ordered(self):
+        results = list(self.mwdb.query_files_many(self.hashes, ordered=True))
+        self.assertEqual([hash for hash, _ in results], self.hashes)
+        for hash, file in results:
+            if hash == MISSING:
+                self.assertIsNone(file)
+            else:
+                self.assertIsInstance(file, MWDBFile)
+                self.assertEqual(file.id, hash)
+
+    def test_unordered(self):
+        start = time.monotonic()
+        results = dict(self.mwdb.query_many(iter(self.hashes), workers=10))
+        # Requests are sent concurrently, serial lookups would take 11 * latency
+        self.assertLess(time.monotonic() - start, 5 * self.server.latency)
+        self.assertEqual(set(results), set(self.hashes))
+        self.assertIsNone(results.pop(MISSING))
+        self.assertEqual(
+            {hash: obj.id for hash, obj in results.items()},
+            {hash: hash for hash in results},
+        )
+
+    def test_typed_variants(self):
+        config = self.server.add_config("evil", {"key": "value"})
+        results = dict(self.mwdb.query_configs_many([config["id"], MISSING]))
+        self.assertIsInstance(results[config["id"]], MWDBConfig)
+        self.assertIsNone(results[MISSING])
+        # Files and configs are not blobs
+        results = dict(self.mwdb.query_blobs_many([self.hashes[0], config["id"]]))
+        self.assertEqual(results, {self.hashes[0]: None, config["id"]: None})
@@ -0,0 +1,73 @@
+import datetime
+import unittest
+
+from benchmarks.fake_mwdb import FakeMWDB, fake_api_key
+from mwdblib import MWDB, APIClient, MWDBFile, MWDBFileRecord
+
+FILE_ENTRY = {
+    "id": "a" * 64,
+    "type": "file",
+    "tags": [{"tag": "feed:test"}],
+    "upload_time": "2023-01-01T12:00:00+00:00",
+    "file_name": "sample.exe",
+    "file_size": 1024,
+    "file_type": "PE32 executable",
+    "md5": "b" * 32,
+    "sha1": "c" * 40,
+    "sha256": "a" * 64,
+}
+
+
+class TestRecords(unittest.TestCase):
+    def test_file_record(self):
+        api = APIClient(config_path=None)
+        record = MWDBFileRecord(api, FILE_ENTRY)
+        self.assertEqual(record.sha256, FILE_ENTRY["id"])
+        self.assertEqual(record.tags, ("feed:test",))
+        self.assertEqual(record.file_name, "sample.exe")
+        self.assertFalse(hasattr(record, "__dict__"))
+        with self.assertRaises(AttributeError):
+            record.file_name = "other.exe"
+        obj = record.to_object()
+        self.assertIsInstance(obj, MWDBFile)
+        # Listing fields are available without requests
+        self.assertEqual(obj.tags, ["feed:test"])
+        self.assertEqual(obj.upload_time, record.upload_time)
+        self.assertEqual(obj.file_size, 1024)
+
+
+class TestIterRecords(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMWDB(files=23).start()
+        self.addCleanup(self.server.stop)
+        self.mwdb = MWDB(
+            api_url=self.server.api_url, api_key=fake_api_key(), config_path=None
+        )
+
+    def test_listing(self):
+        for prefetch in (0, 2):
+            records = list(
+                self.mwdb.iter_records("file", chunk_size=5, prefetch=prefetch)
+            )
+            expected = self.server.objects[::-1]
+            self.assertEqual(len(records), len(expected))
+            for record, entry in zip(records, expected):
+                self.assertIsInstance(record, MWDBFileRecord)
+                self.assertEqual(record.id, entry["id"])
+                self.assertEqual(record.object_type, "file")
+                self.assertEqual(
+                    record.tags, tuple(tag["tag"] for tag in entry["tags"])
+                )
+                self.assertEqual(
+                    record.upload_time,
+                    datetime.datetime.fromisoformat(entry["upload_time"]),
+                )
+                for key in MWDBFileRecord.LISTING_FIELDS:
+                    self.assertEqual(getattr(record, key), entry[key])
+
+    def test_pages(self):
+        requests = self.server.requests
+        records = self.mwdb.iter_records("file", chunk_size=10)
+        self.assertEqual(len([record.id for record in records]), 23)
+        # Pages of 10, 10 and 3 records, then an empty one that ends the listing
+        self.assertEqual(self.server.requests - requests, 4)
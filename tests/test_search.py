@@ -0,0 +1,97 @@
+import datetime
+import re
+import threading
+import unittest
+from itertools import islice
+
+from benchmarks.fake_mwdb import FakeMWDB, fake_api_key
+from mwdblib import MWDB, APIClient
+
+SINCE = datetime.date(2023, 1, 1)
+
+
+def entry(day):
+    upload_time = datetime.datetime.combine(SINCE, datetime.time(12))
+    return {
+        "id": "%064x" % day,
+        "type": "file",
+        "upload_time": (upload_time + datetime.timedelta(days=day)).isoformat(),
+    }
+
+
+class PartitionedMWDB(MWDB):
+    def __init__(self, days):
+        super().__init__(api=APIClient(config_path=None))
+        # Objects ordered from the newest one
+        self.objects = [entry(day) for day in reversed(range(days))]
+        self.queries = []
+
+    def _listing_pages(self, url_type, query=None, chunk_size=None):
+        self.queries.append(query)
+        start, end = re.search(r"upload_time:\[(\S+) TO (\S+)\]", query).groups()
+        entries = [
+            obj for obj in self.objects if start <= obj["upload_time"][:10] <= end
+        ]
+        for offset in range(0, len(entries), 2):
+            yield entries[offset : offset + 2]
+
+
+class TestSearchPartitioned(unittest.TestCase):
+    def test_ranges(self):
+        mwdb = PartitionedMWDB(10)
+        until = SINCE + datetime.timedelta(days=9)
+        objects = list(
+            mwdb.search_files_partitioned(
+                "tag:evil", since=SINCE, until=until, partitions=3, ordered=True
+            )
+        )
+        self.assertEqual(
+            [obj.id for obj in objects], [obj["id"] for obj in mwdb.objects]
+        )
+        self.assertEqual(
+            sorted(mwdb.queries),
+            [
+                "(tag:evil) AND upload_time:[2023-01-01 TO 2023-01-03]",
+                "(tag:evil) AND upload_time:[2023-01-04 TO 2023-01-06]",
+                "(tag:evil) AND upload_time:[2023-01-07 TO 2023-01-10]",
+            ],
+        )
+        unordered = mwdb.search_partitioned(None, since=SINCE, until=until)
+        self.assertEqual(
+            sorted(obj.id for obj in unordered),
+            sorted(obj["id"] for obj in mwdb.objects),
+        )
+
+    def test_prefetch_must_be_positive(self):
+        mwdb = PartitionedMWDB(2)
+        with self.assertRaises(ValueError):
+            next(mwdb.search_partitioned(None, since=SINCE, prefetch=0))
+
+
+class TestPrefetch(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMWDB(files=50, page_size=5).start()
+        self.addCleanup(self.server.stop)
+        self.mwdb = MWDB(
+            api_url=self.server.api_url, api_key=fake_api_key(), config_path=None
+        )
+        # Open pooled connection before threads are counted
+        self.mwdb.api.server_version
+
+    def test_same_order(self):
+        expected = [file.id for file in self.mwdb.recent_files()]
+        self.assertEqual(len(expected), 50)
+        prefetched = [file.id for file in self.mwdb.recent_files(prefetch=2)]
+        self.assertEqual(prefetched, expected)
+
+    def test_close_early(self):
+        threads = set(threading.enumerate())
+        files = self.mwdb.recent_files(prefetch=2)
+        self.assertEqual(len(list(islice(files, 7))), 7)
+        self.assertEqual(len(set(threading.enumerate()) - threads), 1)
+        files.close()
+        # Background thread is stopped and no more pages are fetched
+        self.assertEqual(set(threading.enumerate()) - threads, set())
+        requests = self.server.requests
+        # Two pages consumed, at most two fetched ahead and one blocked
+        self.assertLessEqual(requests, 1 + 5)
@@ -0,0 +1,42 @@
+import threading
+
+from mwdblib import MWDB
+from mwdblib.testing import RequestBudgetExceeded, RequestCounter
+from tests.http_server import LocalServerTestCase
+
+
+class TestRequestCounter(LocalServerTestCase):
+    def test_budget(self):
+        mwdb = MWDB(api=self.make_client())
+        with RequestCounter(mwdb, max_requests=3, endpoints={"file": 1}) as counter:
+            mwdb.api.get("file", noauth=True)
+            mwdb.api.get(f"object/{'a' * 64}/tag", noauth=True)
+        self.assertEqual(counter.count("GET file"), 1)
+        self.assertEqual(counter.count("object/*/tag"), 1)
+        self.assertEqual(counter.total, 2)
+        with self.assertRaises(RequestBudgetExceeded):
+            with RequestCounter(mwdb, endpoints={"GET file": 1}):
+                mwdb.api.get("file", noauth=True)
+                mwdb.api.get("file", noauth=True)
+        # Hooks are removed after exit
+        self.assertEqual(mwdb.api.hooks, [])
+
+    def test_concurrent_clients(self):
+        def worker(requests, results):
+            api = self.make_client()
+            with RequestCounter(api) as counter:
+                for _ in range(requests):
+                    api.get("file", noauth=True)
+            results.append((requests, counter.total))
+
+        results = []
+        threads = [
+            threading.Thread(target=worker, args=(n, results)) for n in range(1, 6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 5)
+        for expected, counted in results:
+            self.assertEqual(expected, counted)
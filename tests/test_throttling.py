@@ -0,0 +1,149 @@
+import time
+import unittest
+from unittest import mock
+
+from mwdblib.api import APIClientHooks
+from mwdblib.api.throttling import ConcurrencyLimiter, RetryBudget, TokenBucket
+from mwdblib.exc import GatewayError
+from tests.http_server import JSONHandler, LocalServerTestCase
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_rate(self):
+        bucket = TokenBucket(50, burst=5)
+        start = time.monotonic()
+        for _ in range(15):
+            bucket.acquire()
+        # 5 requests from burst, 10 more at 50 req/s
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+
+    def test_pause(self):
+        bucket = TokenBucket(1000)
+        bucket.pause(0.1)
+        self.assertGreaterEqual(bucket.reserve(), 0.1)
+
+
+class TestConcurrencyLimiter(unittest.TestCase):
+    def test_aimd(self):
+        limiter = ConcurrencyLimiter(8)
+        epochs = [limiter.acquire() for _ in range(8)]
+        # Burst of errors from concurrent requests decreases limit once
+        for epoch in epochs:
+            limiter.release(epoch, overloaded=True)
+        self.assertEqual(limiter.limit, 4)
+        for _ in range(4):
+            limiter.release(limiter.acquire())
+        self.assertAlmostEqual(limiter.limit, 5, delta=0.1)
+
+
+class TestRetryBudget(unittest.TestCase):
+    def test_budget(self):
+        budget = RetryBudget(0.5, max_tokens=2)
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+
+
+class RateLimitedHandler(JSONHandler):
+    def do_GET(self):
+        self.server.requests += 1
+        if self.server.requests == 1:
+            self.send_json(429, {"message": "Too many requests"}, {"Retry-After": "0"})
+        else:
+            self.send_json(200, {"path": self.path})
+
+
+class TestRateLimitRetry(LocalServerTestCase):
+    handler = RateLimitedHandler
+
+    def test_retry_takes_one_token(self):
+        self.server.requests = 0
+        api = self.make_client(rate_limit=1000, emit_warnings=False)
+        acquire = api.rate_limiter.acquire
+        acquired = []
+
+        def counting_acquire():
+            acquired.append(1)
+            acquire()
+
+        api.rate_limiter.acquire = counting_acquire
+        self.assertEqual(api.get("file", noauth=True), {"path": "/api/file"})
+        self.assertEqual(self.server.requests, 2)
+        self.assertEqual(len(acquired), 2)
+
+
+class BadGatewayHandler(JSONHandler):
+    def do_GET(self):
+        self.server.requests += 1
+        self.send_json(502, {"message": "Bad gateway"})
+
+
+class RetryRecorder(APIClientHooks):
+    def __init__(self):
+        self.delays = []
+
+    def on_retry(self, request, error, delay):
+        self.delays.append(delay)
+
+
+class TestDowntimeRetries(LocalServerTestCase):
+    handler = BadGatewayHandler
+
+    def setUp(self):
+        super().setUp()
+        self.server.requests = 0
+
+    def make_retrying_client(self, **api_options):
+        api = self.make_client(
+            retry_on_downtime=True, emit_warnings=False, **api_options
+        )
+        recorder = RetryRecorder()
+        api.add_hooks(recorder)
+        return api, recorder
+
+    def test_backoff_with_jitter(self):
+        api, recorder = self.make_retrying_client(
+            retry_backoff=True,
+            downtime_timeout=1,
+            retry_backoff_max=5.0,
+            max_downtime_retries=8,
+        )
+        with mock.patch("mwdblib.api.api.time.sleep") as sleep:
+            with self.assertRaises(GatewayError):
+                api.get("file", noauth=True)
+        self.assertEqual(self.server.requests, 9)
+        self.assertEqual(len(recorder.delays), 8)
+        for attempt, delay in enumerate(recorder.delays):
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(5.0, 1 * 2**attempt))
+        self.assertEqual([call[0][0] for call in sleep.call_args_list], recorder.delays)
+
+    def test_deadline(self):
+        api, recorder = self.make_retrying_client(
+            retry_backoff=True,
+            downtime_timeout=1,
+            retry_backoff_max=0.1,
+            max_downtime_retries=1000,
+            request_deadline=0.5,
+        )
+        start = time.monotonic()
+        with self.assertRaises(GatewayError):
+            api.get("file", noauth=True)
+        elapsed = time.monotonic() - start
+        self.assertLess(elapsed, 0.8)
+        self.assertGreater(len(recorder.delays), 1)
+        self.assertEqual(self.server.requests, len(recorder.delays) + 1)
+
+    def test_retry_budget(self):
+        api, recorder = self.make_retrying_client(
+            downtime_timeout=0, max_downtime_retries=1000, retry_budget_ratio=0.01
+        )
+        with self.assertRaises(GatewayError):
+            api.get("file", noauth=True)
+        # Budget starts with 10 tokens, each retry takes one
+        self.assertEqual(len(recorder.delays), 10)
+        self.assertEqual(self.server.requests, 11)
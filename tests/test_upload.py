@@ -0,0 +1,132 @@
+import io
+import unittest
+
+from benchmarks.fake_mwdb import FakeMWDB, fake_api_key, synthetic_content
+from mwdblib import MWDB
+from mwdblib.api.multipart import MultipartEncoder
+
+
+class NonSeekableStream(io.RawIOBase):
+    def __init__(self, content):
+        self._content = io.BytesIO(content)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._content.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+class TestUploadFile(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMWDB(files=0).start()
+        self.mwdb = MWDB(
+            api_url=self.server.api_url, api_key=fake_api_key(), config_path=None
+        )
+        self.bodies = []
+        post = self.mwdb.api.post
+
+        def recording_post(*args, **kwargs):
+            self.bodies.append(kwargs.get("data"))
+            return post(*args, **kwargs)
+
+        self.mwdb.api.post = recording_post
+
+    def tearDown(self):
+        self.server.stop()
+
+    def assertUploaded(self, file, content):
+        self.assertEqual(self.server.contents[file.sha256], content)
+
+    def test_streamed(self):
+        content = b"streamed" * 10000
+        progress = []
+        file = self.mwdb.upload_file(
+            "streamed.bin",
+            io.BytesIO(content),
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+        self.assertUploaded(file, content)
+        self.assertIsInstance(self.bodies[0], MultipartEncoder)
+        self.assertGreater(len(progress), 1)
+        self.assertEqual(progress[-1][0], progress[-1][1])
+        self.assertEqual(
+            [done for done, _ in progress], sorted(done for done, _ in progress)
+        )
+
+    def test_non_seekable(self):
+        content = b"piped" * 10000
+        file = self.mwdb.upload_file("piped.bin", NonSeekableStream(content))
+        self.assertUploaded(file, content)
+        self.assertIsInstance(self.bodies[0], MultipartEncoder)
+
+    def test_in_memory_content(self):
+        for content in [b"bytes", bytearray(b"bytearray"), "text"]:
+            file = self.mwdb.upload_file("memory.bin", content)
+            expected = content.encode() if isinstance(content, str) else content
+            self.assertUploaded(file, expected)
+        # Bytes are sent without streaming unless progress is reported
+        self.assertEqual(self.bodies, [None, None, None])
+        progress = []
+        file = self.mwdb.upload_file(
+            "memory.bin",
+            bytearray(b"progress"),
+            progress_callback=lambda done, total: progress.append(done),
+        )
+        self.assertUploaded(file, b"progress")
+        self.assertEqual(progress[-1], self.bodies[-1].length)
+
+
+class TestUploadMany(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMWDB(files=2).start()
+        self.mwdb = MWDB(
+            api_url=self.server.api_url, api_key=fake_api_key(), config_path=None
+        )
+        self.sample = self.server.objects[0]["id"]
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_upload_many(self):
+        dropped = [
+            ("existing.bin", synthetic_content(1, self.server.file_size)),
+            ("new.bin", b"new file"),
+            "/nonexistent/path",
+        ]
+        results = list(
+            self.mwdb.upload_many(
+                dropped,
+                workers=2,
+                ordered=True,
+                parent=self.sample,
+                tags=["dropped"],
+                attributes={"sandbox": "run-1"},
+            )
+        )
+        self.assertEqual([result.item for result in results], dropped)
+        self.assertEqual([result.skipped for result in results], [True, False, False])
+        self.assertIsInstance(results[2].error, FileNotFoundError)
+        for result in results[:2]:
+            file_id = result.object.id
+            # Options are applied to existing files as well
+            self.assertIn((self.sample, file_id), self.server.relations)
+            self.assertIn(
+                {"tag": "dropped"}, self.server.objects_by_id[file_id]["tags"]
+            )
+            self.assertEqual(
+                self.server.attributes[file_id], [{"key": "sandbox", "value": "run-1"}]
+            )
+        self.assertEqual(self.server.contents[results[1].object.id], b"new file")
+
+    def test_upload_many_without_skipping(self):
+        content = synthetic_content(1, self.server.file_size)
+        requests = self.server.requests
+        results = list(
+            self.mwdb.upload_many([("existing.bin", content)], skip_existing=False)
+        )
+        self.assertFalse(results[0].skipped)
+        # File is uploaded without checking whether it exists
+        self.assertEqual(self.server.requests - requests, 1)
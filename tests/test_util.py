@@ -1,5 +1,7 @@
+import time
 import unittest
-from mwdblib import config_dhash
+from mwdblib import config_dhash, config_dhash_many
+from mwdblib.util import iter_concurrently, iter_merged, iter_prefetched
 
 
 class TestPublicApi(unittest.TestCase):
@@ -98,3 +100,95 @@ class TestPublicApi(unittest.TestCase):
             config_dhash(config),
             "bb746125514931fe0f216305ba5a1dab3da60a8527977a4df6d1db3e6d859d58"
         )
+
+    def test_dhash_nested(self):
+        config = {"a": [[], {}, [1, [2, {"b": None}]], {"c": ["d", "e"]}], "f": {}}
+        self.assertEqual(
+            config_dhash(config),
+            "f51a9e39a72e9ef22db81080cb78933eb76dcaea3785bf1027fd39693be8cb4d"
+        )
+
+    def test_dhash_deeply_nested(self):
+        config = {"a": []}
+        for _ in range(5000):
+            config = {"a": [config]}
+        self.assertEqual(len(config_dhash(config)), 64)
+
+    def test_dhash_many(self):
+        configs = [{"family": "test", "id": n, "urls": [str(n)]} for n in range(50)]
+        expected = [config_dhash(config) for config in configs]
+        self.assertEqual(list(config_dhash_many(configs)), expected)
+        self.assertEqual(
+            list(config_dhash_many(iter(configs), processes=2, chunksize=4)), expected
+        )
+
+
+class TestIterConcurrently(unittest.TestCase):
+    def test_ordered(self):
+        def slow_square(n):
+            time.sleep(0.01 * (5 - n % 5))
+            return n * n
+
+        results = [
+            (item, future.result())
+            for item, future in iter_concurrently(slow_square, range(20), workers=4)
+        ]
+        self.assertEqual(results, [(n, n * n) for n in range(20)])
+
+    def test_unordered_with_errors(self):
+        def fail_on_odd(n):
+            if n % 2:
+                raise ValueError(n)
+            return n
+
+        results = {}
+        errors = set()
+        for item, future in iter_concurrently(
+            fail_on_odd, range(10), workers=3, ordered=False
+        ):
+            if future.exception() is not None:
+                errors.add(item)
+            else:
+                results[item] = future.result()
+        self.assertEqual(results, {n: n for n in range(0, 10, 2)})
+        self.assertEqual(errors, set(range(1, 10, 2)))
+
+
+class TestIterPrefetched(unittest.TestCase):
+    def test_prefetch(self):
+        self.assertEqual(list(iter_prefetched(iter(range(100)), 3)), list(range(100)))
+
+    def test_error_propagation(self):
+        def failing():
+            yield 1
+            raise ValueError("failed")
+
+        iterator = iter_prefetched(failing(), 2)
+        self.assertEqual(next(iterator), 1)
+        with self.assertRaises(ValueError):
+            next(iterator)
+
+    def test_early_close(self):
+        fetched = []
+
+        def counting():
+            for n in range(1000):
+                fetched.append(n)
+                yield n
+
+        iterator = iter_prefetched(counting(), 2)
+        self.assertEqual(next(iterator), 0)
+        iterator.close()
+        self.assertLess(len(fetched), 10)
+
+
+class TestIterMerged(unittest.TestCase):
+    def test_ordered(self):
+        iterators = [iter(range(n * 10, n * 10 + 10)) for n in range(5)]
+        self.assertEqual(list(iter_merged(iterators, ordered=True)), list(range(50)))
+
+    def test_unordered(self):
+        iterators = [iter(range(n * 10, n * 10 + 10)) for n in range(5)]
+        self.assertEqual(
+            sorted(iter_merged(iterators, ordered=False, buffer=3)), list(range(50))
+        )